@@ -2,14 +2,17 @@
 
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
+import hmac
 import logging
 import os
 from datetime import datetime
 
-from src.config import DEBUG, HOST, PORT, SECRET_KEY, LOG_LEVEL
+from src.config import (
+    DEBUG, HOST, PORT, SECRET_KEY, LOG_LEVEL, MICRO_BATCH_ENABLED, ADMIN_TOKEN, MODEL_WATCH_INTERVAL
+)
 from src.models.analyzer import ContentAnalyzer
-import nltk
-import ssl
+from src.models.registry import ModelRegistry
+from src.utils.resources import missing_nltk_resources
 
 # Configure logging
 logging.basicConfig(level=getattr(logging, LOG_LEVEL))
@@ -20,37 +23,41 @@ app = Flask(__name__, template_folder='../frontend', static_folder='../frontend/
 app.config['SECRET_KEY'] = SECRET_KEY
 CORS(app)
 
-# Ensure required NLTK data is available (download if missing)
-try:
-    try:
-        _create_unverified_https_context = ssl._create_unverified_context
-    except AttributeError:
-        pass
-    else:
-        ssl._create_default_https_context = _create_unverified_https_context
-
-    required_nltk = ['punkt', 'stopwords', 'averaged_perceptron_tagger', 'wordnet']
-    for res in required_nltk:
-        try:
-            nltk.data.find(res if '/' in res else f"tokenizers/{res}" if res == 'punkt' else f"corpora/{res}")
-        except LookupError:
-            logger.info(f"NLTK resource '{res}' not found. Downloading...")
-            nltk.download(res)
-except Exception:
-    logger.exception("Failed to verify/download NLTK data")
+# NLTK data comes from the pre-built bundle (python -m src.utils.resources);
+# nothing is downloaded at startup
+missing_nltk = missing_nltk_resources()
+if missing_nltk:
+    logger.warning(f"NLTK data not found: {', '.join(missing_nltk)} - run `python -m src.utils.resources`")
 
 # Initialize analyzer
 analyzer = ContentAnalyzer()
 
-# Try to load pre-trained model
+# Load the current registry version, falling back to the standalone model
+registry = ModelRegistry()
 try:
-    if analyzer.detector.load_model():
+    if registry.current_version():
+        version = registry.activate(analyzer.detector)
+        logger.info(f"Model version {version} loaded from registry")
+    elif analyzer.detector.load_model():
         logger.info("Pre-trained model loaded successfully")
     else:
         logger.warning("No pre-trained model found - using default analysis")
 except Exception as e:
     logger.warning(f"Could not load model: {e}")
 
+# Coalesce concurrent ML predictions (needs a threaded worker class)
+if MICRO_BATCH_ENABLED:
+    analyzer.enable_micro_batching()
+    logger.info("Micro-batching enabled for ML predictions")
+
+
+@app.before_request
+def follow_model_registry():
+    """Follow registry version changes made by other workers or deploy tooling"""
+    # Started per process on its first request, so forked workers get their own watcher
+    if MODEL_WATCH_INTERVAL:
+        registry.watch(analyzer.detector)
+
 
 @app.route('/')
 def index():
@@ -64,7 +71,20 @@ def health():
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0'
+        'version': '1.0.0',
+        'model_version': analyzer.detector.model_version
+    }), 200
+
+
+@app.route('/api/stats', methods=['GET'])
+def stats():
+    """Runtime statistics for performance tuning"""
+    return jsonify({
+        'micro_batching': analyzer.batcher.stats() if analyzer.batcher else None,
+        'prediction_cache': analyzer.detector.cache.stats(),
+        'credibility_cache': analyzer.credibility_analyzer.cache.stats(),
+        'source_breaker': analyzer.credibility_analyzer.prober.breaker.stats(),
+        'timestamp': datetime.now().isoformat()
     }), 200
 
 
@@ -99,6 +119,7 @@ def analyze_news():
         return jsonify({
             'success': True,
             'analysis': analysis_result,
+            'model_version': analysis_result['content_analysis'].get('model_version'),
             'timestamp': datetime.now().isoformat()
         }), 200
         
@@ -140,16 +161,25 @@ def analyze_batch():
         if len(items) > 50:
             return jsonify({'error': 'Maximum 50 items per request'}), 400
         
+        # Fact-check every item's claims together; if that fails, analyze
+        # item by item so only the failing items report an error
+        try:
+            analyses = analyzer.analyze_news_batch(items)
+        except Exception as e:
+            logger.warning(f"Batch analysis fell back to single items: {str(e)}")
+            analyses = None
+        
         results = []
-        for item in items:
+        for i, item in enumerate(items):
             try:
-                analysis = analyzer.analyze_news(
+                analysis = analyses[i] if analyses is not None else analyzer.analyze_news(
                     item.get('content', ''),
                     item.get('source_url'),
                     item.get('author')
                 )
                 results.append({
                     'analysis': analysis,
+                    'model_version': analysis['content_analysis'].get('model_version'),
                     'success': True
                 })
             except Exception as e:
@@ -239,6 +269,69 @@ def verify_source():
         return jsonify({'error': str(e)}), 500
 
 
+def _admin_denied():
+    """Return an error response unless the request carries the admin token"""
+    if not ADMIN_TOKEN:
+        return jsonify({'error': 'Admin endpoints are disabled'}), 403
+    token = request.headers.get('X-Admin-Token', '')
+    if not hmac.compare_digest(token, ADMIN_TOKEN):
+        return jsonify({'error': 'Invalid admin token'}), 401
+    return None
+
+
+@app.route('/api/admin/models', methods=['GET'])
+def list_models():
+    """List registry versions and the active model"""
+    denied = _admin_denied()
+    if denied:
+        return denied
+    
+    return jsonify({
+        'success': True,
+        'versions': registry.versions(),
+        'current': registry.current_version(),
+        'active': analyzer.detector.model_version
+    }), 200
+
+
+@app.route('/api/admin/models/activate', methods=['POST'])
+def activate_model():
+    """
+    Hot-swap the running model to a registry version
+    
+    Expected JSON:
+    {
+        "version": "20240101-120000"
+    }
+    """
+    denied = _admin_denied()
+    if denied:
+        return denied
+    
+    try:
+        data = request.get_json() or {}
+        version = data.get('version')
+        
+        if not version:
+            return jsonify({'error': 'No version provided'}), 400
+        
+        previous = analyzer.detector.model_version
+        registry.activate(analyzer.detector, version)
+        logger.info(f"Model swapped from {previous} to {version}")
+        
+        return jsonify({
+            'success': True,
+            'previous': previous,
+            'active': analyzer.detector.model_version
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Model activation error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
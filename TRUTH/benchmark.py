@@ -0,0 +1,1046 @@
+#!/usr/bin/env python
+"""
+Performance benchmarks for TRUTH system components
+
+Usage:
+    python benchmark.py              # Run all benchmarks
+    python benchmark.py batch        # Run a single benchmark by name
+"""
+
+import os
+import random
+import subprocess
+import sys
+import time
+from itertools import accumulate, islice
+
+sys.path.insert(0, '.')
+
+from data.sample_articles import get_sample_articles
+
+
+def print_section(title):
+    """Print a formatted section header"""
+    print("\n" + "="*60)
+    print(f"  {title}")
+    print("="*60 + "\n")
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    """Run func and return (result, best wall time in seconds)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def synthetic_corpus(n, seed=42, vocabulary_size=8000):
+    """
+    Build n labeled articles from sample-article sentences plus filler words
+
+    Sentences are shared by both labels; the label only skews which filler
+    words (from a Zipf-like synthetic vocabulary) are likely, so the forest
+    grows realistically deep trees over many weakly informative features.
+    """
+    rng = random.Random(seed)
+    sentences = [s.strip() for a in get_sample_articles()
+                 for s in a['content'].split('.') if s.strip()]
+    vocabulary = [f"term{i}" for i in range(vocabulary_size)]
+    weights = {
+        label: [(1.5 if i % 2 == label else 1.0) / (i + 1) for i in range(vocabulary_size)]
+        for label in (0, 1)
+    }
+
+    texts, labels = [], []
+    for _ in range(n):
+        label = rng.randint(0, 1)
+        picked = rng.sample(sentences, 3)
+        filler = rng.choices(vocabulary, weights=weights[label], k=60)
+        texts.append('. '.join(picked) + '. ' + ' '.join(filler))
+        labels.append(label)
+    return texts, labels
+
+
+def trained_detector(n=400):
+    """Return a FakeNewsDetector trained on a synthetic corpus"""
+    from src.models.detector import FakeNewsDetector
+
+    texts, labels = synthetic_corpus(n)
+    return FakeNewsDetector().train(texts, labels)
+
+
+def bench_batch():
+    """Per-row predict loop vs chunked predict_batch"""
+    print_section("Detector: predict loop vs predict_batch")
+
+    detector = trained_detector()
+    texts, _ = synthetic_corpus(2000, seed=7)
+
+    looped, loop_time = timed(lambda: [detector.predict(t) for t in texts])
+    batched, batch_time = timed(detector.predict_batch, texts)
+
+    assert looped == batched, "Batch results differ from per-row results"
+    print(f"  Rows:              {len(texts)}")
+    print(f"  predict loop:      {loop_time:.3f}s ({len(texts) / loop_time:,.0f} rows/s)")
+    print(f"  predict_batch:     {batch_time:.3f}s ({len(texts) / batch_time:,.0f} rows/s)")
+    print(f"  Speedup:           {loop_time / batch_time:.1f}x")
+
+
+def _concurrent_latencies(predict, texts, threads):
+    """Score texts from a thread pool; return (wall time, sorted latencies)"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def call(text):
+        start = time.perf_counter()
+        predict(text)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = sorted(pool.map(call, texts))
+    return time.perf_counter() - start, latencies
+
+
+def bench_microbatch():
+    """Concurrent single predictions, direct vs micro-batched"""
+    print_section("Detector: direct vs micro-batched concurrent predictions")
+
+    from src.models.batcher import MicroBatcher
+
+    detector = trained_detector()
+    texts, _ = synthetic_corpus(1000, seed=11)
+    threads = 16
+
+    for name, predictor in [
+        ('direct', detector),
+        ('micro-batched 2ms', MicroBatcher(detector, max_batch_size=32, max_wait_ms=2)),
+        ('micro-batched 5ms', MicroBatcher(detector, max_batch_size=32, max_wait_ms=5)),
+    ]:
+        wall, latencies = _concurrent_latencies(predictor.predict, texts, threads)
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f"  {name:<18} {len(texts) / wall:>8,.0f} req/s   p99 {p99 * 1000:7.1f} ms")
+        if isinstance(predictor, MicroBatcher):
+            stats = predictor.stats()
+            print(f"  {'':<18} avg batch {stats['avg_batch_size']:.1f}, "
+                  f"avg wait {stats['avg_wait_ms']:.2f} ms")
+
+
+def bench_streaming():
+    """Peak training memory, in-memory TF-IDF vs streaming hashing"""
+    print_section("Detector: in-memory vs streaming training memory")
+
+    import tracemalloc
+    from src.models.detector import FakeNewsDetector
+
+    for n in (2000, 8000):
+        texts, labels = synthetic_corpus(n, seed=3)
+
+        tracemalloc.start()
+        _, train_time = timed(FakeNewsDetector().train, texts, labels)
+        train_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        stream = zip(texts, labels)
+        tracemalloc.start()
+        _, stream_time = timed(FakeNewsDetector().train_streaming, stream, batch_size=500)
+        stream_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"  {n:>6} docs  train: {train_peak / 2**20:7.1f} MB {train_time:6.2f}s   "
+              f"train_streaming: {stream_peak / 2**20:7.1f} MB {stream_time:6.2f}s")
+    print("\n  (the synthetic corpus is generated before tracing in both paths)")
+
+
+def bench_artifact():
+    """Model load time and private memory, pickle vs mapped artifact"""
+    print_section("Detector: pickle vs memory-mapped model artifact")
+
+    import os
+    import tempfile
+    import tracemalloc
+    from src.models.detector import FakeNewsDetector
+
+    detector = trained_detector(2000)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, path in [('pickle', os.path.join(tmp, 'model.pkl')),
+                           ('mapped', os.path.join(tmp, 'model'))]:
+            detector.save_model(path)
+            if os.path.isdir(path):
+                size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            else:
+                size = os.path.getsize(path)
+
+            tracemalloc.start()
+            _, load_time = timed(FakeNewsDetector().load_model, path, repeat=5)
+            private = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(f"  {name:<7} size {size / 2**20:6.2f} MB   load {load_time * 1000:7.2f} ms   "
+                  f"private heap {private / 2**20:6.2f} MB")
+
+
+def bench_compiled():
+    """Scoring latency, sklearn vs compiled forest and pickle vs mapped artifact"""
+    print_section("Detector: sklearn vs compiled forest scoring")
+
+    import os
+    import tempfile
+    import numpy as np
+    from src.models.artifact import PackedForest
+    from src.models.detector import FakeNewsDetector
+
+    detector = trained_detector(2000)
+    texts, _ = synthetic_corpus(200, seed=9)
+    X = detector.vectorizer.transform([detector.preprocessor.clean_text(t) for t in texts])
+    compiled = PackedForest.from_estimator(detector.model)
+
+    diff = np.abs(compiled.predict_proba(X) - detector.model.predict_proba(X)).max()
+    print(f"  Trees: {compiled.n_trees}, nodes: {len(compiled.feature):,}, max |dp|: {diff:.2e}\n")
+
+    for name, model in [('sklearn', detector.model), ('compiled', compiled)]:
+        latencies = []
+        for i in range(X.shape[0]):
+            _, elapsed = timed(model.predict_proba, X[i])
+            latencies.append(elapsed)
+        latencies.sort()
+        print(f"  {name:<9} single-row p50 {latencies[len(latencies) // 2] * 1000:6.3f} ms   "
+              f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:6.3f} ms")
+
+    for name, model in [('sklearn', detector.model), ('compiled', compiled)]:
+        _, elapsed = timed(model.predict_proba, X, repeat=3)
+        print(f"  {name:<9} {X.shape[0]}-row batch {elapsed * 1000:8.2f} ms")
+
+    # A mapped artifact loads as a packed forest, so its batches take the compiled path
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'model')
+        detector.save_model(path)
+        mapped = FakeNewsDetector()
+        mapped.load_model(path)
+        print()
+        for name, scorer in [('pickle', detector), ('mapped', mapped)]:
+            scorer.cache.maxsize = 0
+            _, elapsed = timed(scorer.predict_batch, texts, repeat=3)
+            print(f"  {name:<9} predict_batch({len(texts)}) {elapsed * 1000:8.2f} ms")
+
+
+def bench_cache():
+    """Syndicated traffic with and without the prediction cache"""
+    print_section("Detector: prediction cache on repeated articles")
+
+    detector = trained_detector(1000)
+    unique, _ = synthetic_corpus(100, seed=13)
+    rng = random.Random(13)
+    traffic = [rng.choice(unique) for _ in range(2000)]
+
+    detector.cache.maxsize = 0
+    _, uncached = timed(lambda: [detector.predict(t) for t in traffic])
+
+    detector.cache.maxsize = 10000
+    detector.cache.clear()
+    detector.cache.reset_stats()
+    _, cached = timed(lambda: [detector.predict(t) for t in traffic])
+    stats = detector.cache.stats()
+
+    print(f"  Requests: {len(traffic)}, unique articles: {len(unique)}")
+    print(f"  uncached: {uncached:.3f}s ({len(traffic) / uncached:,.0f} req/s)")
+    print(f"  cached:   {cached:.3f}s ({len(traffic) / cached:,.0f} req/s), "
+          f"hit rate {stats['hit_rate']:.1%}")
+
+
+def bench_update():
+    """Daily refreshes, full retrain vs warm-start update"""
+    print_section("Detector: full retrain vs incremental update")
+
+    from src.models.detector import FakeNewsDetector
+
+    history, history_labels = synthetic_corpus(2000, seed=21)
+    eval_texts, eval_labels = synthetic_corpus(500, seed=22)
+    daily = [synthetic_corpus(400, seed=100 + day) for day in range(5)]
+
+    retrained = FakeNewsDetector().train(history, history_labels)
+    updated = FakeNewsDetector().train(history, history_labels)
+    print(f"  {'day':<5}{'retrain time':>14}{'retrain acc':>13}{'update time':>14}{'update acc':>12}{'trees':>7}")
+
+    for day, (texts, labels) in enumerate(daily, 1):
+        history, history_labels = history + texts, history_labels + labels
+        _, retrain_time = timed(retrained.train, history, history_labels)
+        report = updated.update(texts, labels, max_trees=200, eval_texts=eval_texts, eval_labels=eval_labels)
+        print(f"  {day:<5}{retrain_time:>13.2f}s{retrained.evaluate(eval_texts, eval_labels):>13.3f}"
+              f"{report['train_time']:>13.2f}s{report['accuracy']:>12.3f}{report['n_trees']:>7}")
+
+
+def _directory_size(path):
+    import os
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+def bench_compact():
+    """Memory, latency and accuracy of compact feature mode"""
+    print_section("Detector: full vs compact (float32, pruned vocabulary) features")
+
+    import os
+    import tempfile
+    from src.models.detector import FakeNewsDetector
+
+    texts, labels = synthetic_corpus(3000, seed=31)
+    eval_texts, eval_labels = synthetic_corpus(1000, seed=32)
+    chunk = [t for t in eval_texts for _ in range(10)]  # 10k-document scoring chunk
+
+    print(f"  {'mode':<14}{'vocab':>7}{'10k chunk':>12}{'artifact':>11}{'batch 10k':>11}"
+          f"{'single':>10}{'accuracy':>10}")
+    for name, compact in [('full', None), ('compact 2000', 2000), ('compact 1000', 1000),
+                          ('compact 300', 300)]:
+        detector = FakeNewsDetector().train(texts, labels, compact_features=compact)
+        detector.compile_model()
+        cleaned = [detector.preprocessor.clean_text(t) for t in chunk]
+        X = detector.vectorizer.transform(cleaned)
+        matrix_bytes = X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+
+        with tempfile.TemporaryDirectory() as tmp:
+            detector.save_model(os.path.join(tmp, 'model'))
+            artifact_bytes = _directory_size(os.path.join(tmp, 'model'))
+
+        _, batch_time = timed(detector.model.predict_proba, X)
+        _, single_time = timed(detector.compiled_model.predict_proba, X[0], repeat=50)
+        print(f"  {name:<14}{len(detector.vectorizer.vocabulary_):>7}"
+              f"{matrix_bytes / 2**20:>9.1f} MB{artifact_bytes / 2**20:>8.1f} MB"
+              f"{batch_time:>10.2f}s{single_time * 1000:>7.2f} ms"
+              f"{detector.evaluate(eval_texts, eval_labels):>10.3f}")
+
+
+def bench_tuning():
+    """Cold vs cached hyperparameter search and the per-config report"""
+    print_section("Tuning: 3-fold grid search, cold vs cached features")
+
+    import tempfile
+    from src.models.tuning import HyperparameterSearch
+
+    texts, labels = synthetic_corpus(1500, seed=41)
+    grid = {
+        'vectorizer__max_features': [1000, 5000],
+        'forest__n_estimators': [25, 100],
+        'forest__max_depth': [None, 20]
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        search = HyperparameterSearch(cache_dir=tmp, n_splits=3)
+        results, cold = timed(search.run, texts, labels, grid)
+        _, warm = timed(HyperparameterSearch(cache_dir=tmp, n_splits=3).run, texts, labels, grid)
+
+    print(f"  cold run:   {cold:6.2f}s ({search.cache.built} cache entries built)")
+    print(f"  cached run: {warm:6.2f}s\n")
+    print(f"  {'features':>8}{'trees':>7}{'depth':>7}{'accuracy':>10}{'train':>8}"
+          f"{'size':>10}{'single':>10}{'batch/doc':>11}")
+    for r in results:
+        print(f"  {r['vectorizer_params']['max_features']:>8}{r['forest_params']['n_estimators']:>7}"
+              f"{str(r['forest_params']['max_depth']):>7}{r['accuracy']:>10.3f}{r['train_time']:>7.2f}s"
+              f"{r['model_bytes'] / 2**20:>7.2f} MB{r['latency_ms']:>7.2f} ms{r['batch_latency_ms']:>8.3f} ms")
+
+    cheapest = HyperparameterSearch.cheapest(results, results[0]['accuracy'] - 0.01)
+    print(f"\n  cheapest within 1 point of best: {cheapest['vectorizer_params']} {cheapest['forest_params']}")
+
+
+def bench_document():
+    """Per-article CPU of analysis stages on raw strings vs one shared Document"""
+    print_section("Analysis stages: raw strings vs shared Document")
+
+    from textblob.exceptions import MissingCorpusError
+    from src.models.fact_checker import FactChecker
+    from src.utils.text_processor import Document, TextAnalyzer, TextPreprocessor
+
+    preprocessor = TextPreprocessor()
+    fact_checker = FactChecker()
+    stages = [
+        ('cleaning', lambda item: Document.of(item).cleaned),
+        ('sentiment', TextAnalyzer.get_sentiment),
+        ('language patterns', TextAnalyzer.analyze_language_patterns),
+        ('text statistics', preprocessor.calculate_statistics),
+        ('fact check', fact_checker.get_fact_check_score),
+        ('entities', TextAnalyzer.extract_entities),
+    ]
+
+    # Stages whose NLTK/TextBlob corpora are not installed are skipped
+    available = []
+    for name, stage in stages:
+        try:
+            stage(Document("Officials said the report is accurate."))
+            available.append((name, stage))
+        except (LookupError, MissingCorpusError):
+            print(f"  skipping {name}: NLTK data not installed")
+
+    articles = [f"{a['title']}. {a['content']}" for a in get_sample_articles()] * 50
+
+    def run(make_input):
+        """CPU seconds per article for each stage, plus building the input"""
+        costs = dict.fromkeys(['input'] + [name for name, _ in available], 0.0)
+        for article in articles:
+            start = time.process_time()
+            item = make_input(article)
+            costs['input'] += time.process_time() - start
+            for name, stage in available:
+                start = time.process_time()
+                stage(item)
+                costs[name] += time.process_time() - start
+        return {name: cost / len(articles) for name, cost in costs.items()}
+
+    run(Document)  # warm-up (lazy imports, TextBlob lexicons)
+    strings = min((run(str) for _ in range(5)), key=lambda costs: sum(costs.values()))
+    shared = min((run(Document) for _ in range(5)), key=lambda costs: sum(costs.values()))
+
+    print(f"  {'stage':<20}{'strings':>12}{'Document':>12}")
+    for name in strings:
+        print(f"  {name:<20}{strings[name] * 1000:>9.3f} ms{shared[name] * 1000:>9.3f} ms")
+    total_strings, total_shared = sum(strings.values()), sum(shared.values())
+    print(f"  {'total':<20}{total_strings * 1000:>9.3f} ms{total_shared * 1000:>9.3f} ms")
+    print(f"\n  CPU saved per article: {(total_strings - total_shared) * 1000:.3f} ms "
+          f"({(1 - total_shared / total_strings) * 100:.0f}%)")
+
+
+def bench_patterns():
+    """Language-pattern features: per-phrase counting vs the lexicon scanner"""
+    print_section("Language patterns: per-phrase counting vs lexicon scanner")
+
+    from src.utils.lexicon import SENSATIONAL_WORDS, LanguagePatternScanner
+
+    texts = [f"{a['title']}. {a['content']}" for a in get_sample_articles()] * 20
+    rng = random.Random(5)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+
+    def per_phrase(text, lexicon):
+        """The original approach: a pass per feature and per phrase"""
+        return {
+            'exclamation_count': text.count('!'),
+            'question_count': text.count('?'),
+            'caps_percentage': sum(1 for c in text if c.isupper()) / len(text) * 100 if text else 0,
+            'quotation_count': text.count('"'),
+            'has_sources': text.lower().count('according to') + text.lower().count('said') + text.lower().count('reported'),
+            'sensational_words': sum(1 for word in lexicon if word in text.lower())
+        }
+
+    print(f"  {'lexicon':>8}{'per-phrase':>14}{'scanner':>12}{'speedup':>10}")
+    for size in [5, 100, 300, 1000, 5000]:
+        extra = [''.join(rng.choices(letters, k=rng.randint(5, 12))) for _ in range(size - len(SENSATIONAL_WORDS))]
+        lexicon = list(SENSATIONAL_WORDS) + extra
+        scanner = LanguagePatternScanner(sensational_words=lexicon)
+
+        _, baseline = timed(lambda: [per_phrase(t, lexicon) for t in texts], repeat=3)
+        _, scanned = timed(scanner.scan_batch, texts, repeat=3)
+        print(f"  {size:>8}{baseline / len(texts) * 1000:>11.3f} ms{scanned / len(texts) * 1000:>9.3f} ms"
+              f"{baseline / scanned:>9.1f}x")
+
+
+def bench_cleaning():
+    """clean_text throughput: original regexes vs clean_text vs clean_texts"""
+    print_section("Text cleaning throughput (MB/s)")
+
+    import os
+    import re
+    import string
+    from src.utils.text_processor import TextPreprocessor
+
+    def original(text):
+        text = text.lower()
+        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+        text = re.sub(r'\S+@\S+', '', text)
+        text = re.sub(f'[^{re.escape(string.ascii_letters + string.digits + " ")}]', '', text)
+        return re.sub(r'\s+', ' ', text).strip()
+
+    texts, _ = synthetic_corpus(20000, seed=17)
+    texts = [f"{t} Contact press@example.com or visit https://example.com/story!" for t in texts]
+    megabytes = sum(len(t.encode('utf-8')) for t in texts) / 2**20
+    preprocessor = TextPreprocessor()
+
+    runs = [
+        ('original regexes', lambda: [original(t) for t in texts]),
+        ('clean_text loop', lambda: [preprocessor.clean_text(t) for t in texts]),
+        ('clean_texts', lambda: preprocessor.clean_texts(texts)),
+    ]
+    cpus = os.cpu_count() or 1
+    if cpus > 1:
+        runs.append((f'clean_texts, {cpus} procs',
+                     lambda: preprocessor.clean_texts(texts, workers=cpus, chunk_size=2000)))
+    else:
+        print("  (single CPU: skipping the process-pool run)")
+    print(f"  corpus: {len(texts)} texts, {megabytes:.1f} MB\n")
+    for name, run in runs:
+        _, seconds = timed(run, repeat=3)
+        print(f"  {name:<22}{megabytes / seconds:>8.1f} MB/s")
+
+
+def bench_sentiment():
+    """TextBlob vs vectorized lexicon sentiment: throughput and agreement"""
+    print_section("Sentiment: TextBlob vs lexicon backend")
+
+    from src.utils.sentiment import LexiconSentiment, TextBlobSentiment, sentiment_agreement
+
+    articles = get_sample_articles()
+    sample = [a['content'] for a in articles] + [a['title'] for a in articles]
+    texts = [f"{a['title']}. {a['content']}" for a in articles] * 250
+    textblob, lexicon = TextBlobSentiment(), LexiconSentiment()
+    lexicon.score("warm up")  # builds the lexicon arrays
+
+    _, blob_time = timed(textblob.score_batch, texts)
+    _, lexicon_time = timed(lexicon.score_batch, texts, repeat=3)
+    print(f"  {len(texts)} articles")
+    print(f"  textblob: {blob_time / len(texts) * 1000:7.3f} ms/article")
+    print(f"  lexicon:  {lexicon_time / len(texts) * 1000:7.3f} ms/article "
+          f"({blob_time / lexicon_time:.0f}x)\n")
+
+    report = sentiment_agreement(sample, lexicon)
+    print(f"  agreement with TextBlob on the sample corpus ({report['documents']} texts):")
+    print(f"    label agreement:      {report['label_agreement']:.1%}")
+    print(f"    polarity MAE:         {report['polarity_mae']:.4f}")
+    print(f"    subjectivity MAE:     {report['subjectivity_mae']:.4f}")
+    print(f"    polarity correlation: {report['polarity_correlation']:.3f}")
+
+
+def bench_entities():
+    """Entity extraction on long articles: POS tagger vs fast rule-based path"""
+    print_section("Entities: TextBlob tagger vs fast extractor (long articles)")
+
+    from textblob.exceptions import MissingCorpusError
+    from src.utils.text_processor import Document, TextAnalyzer
+
+    # ~20k-character articles built from the samples
+    articles = get_sample_articles()
+    long_articles = [' '.join(f"{a['title']}. {a['content']}" for a in articles[i:] + articles[:i]) * 6
+                     for i in range(len(articles))] * 5
+    print(f"  {len(long_articles)} articles, ~{len(long_articles[0]) // 1000}k characters each\n")
+
+    _, fast = timed(TextAnalyzer.extract_entities_batch, long_articles, 'fast', repeat=3)
+    print(f"  fast:   {fast / len(long_articles) * 1000:8.2f} ms/article")
+    try:
+        _, tagger = timed(lambda: [TextAnalyzer.extract_entities(Document(t), 'tagger') for t in long_articles])
+        print(f"  tagger: {tagger / len(long_articles) * 1000:8.2f} ms/article ({tagger / fast:.0f}x slower)")
+    except (LookupError, MissingCorpusError):
+        print("  tagger: skipped, NLTK tagger data not installed")
+    print(f"\n  top entities: {TextAnalyzer.extract_entities(long_articles[0], 'fast', limit=6)}")
+
+
+def _import_profile(module):
+    """Import module in a fresh interpreter under -X importtime; return (wall s, {name: cumulative us})"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env={**os.environ, 'LOG_LEVEL': 'ERROR'}
+    )
+    wall = time.perf_counter() - start
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, total, name = line[len('import time:'):].split('|')
+        cumulative.setdefault(name.strip(), int(total))
+    return wall, cumulative
+
+
+def bench_imports():
+    """Cold import cost of the main entry points, with the heaviest packages"""
+    print_section("Startup: import time (python -X importtime)")
+
+    for module in ('src.utils.text_processor', 'src.models.analyzer', 'api.app'):
+        runs = [_import_profile(module) for _ in range(3)]
+        wall, cumulative = min(runs, key=lambda run: run[0])
+        heaviest = sorted(
+            ((total, name) for name, total in cumulative.items()
+             if '.' not in name and not name.startswith('_') and name not in ('site', 'src', 'api')),
+            reverse=True
+        )[:5]
+        print(f"  {module}: {cumulative.get(module, 0) / 1000:7.1f} ms import, {wall * 1000:7.1f} ms process")
+        print("    heaviest: " + ', '.join(f"{name} {total / 1000:.0f} ms" for total, name in heaviest))
+    print("\n  NLTK and TextBlob load on first use; importing them is not part of startup")
+
+
+def pseudo_words(n, seed=0):
+    """n distinct random lowercase words of 5-9 letters"""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < n:
+        words.add(''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(5, 9))))
+    return sorted(words)
+
+
+def synthetic_fact_checks(n, seed=42, vocabulary_size=50000):
+    """Build a fact-check database of n claims: Zipf-distributed topic words plus common words"""
+    rng = random.Random(seed)
+    common = ['the', 'is', 'of', 'are', 'not', 'by', 'caused', 'in']
+    vocabulary = pseudo_words(vocabulary_size)
+    cum_weights = list(accumulate(1 / (i + 10) for i in range(vocabulary_size)))
+
+    fact_check_db = {}
+    for i in range(n):
+        words = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(2, 6))
+        words += rng.sample(common, rng.randint(1, 2))
+        rng.shuffle(words)
+        fact_check_db[f'claim_{i}'] = {
+            'claim': ' '.join(words).capitalize(),
+            'verdict': rng.choice(['TRUE', 'FALSE']),
+            'confidence': 0.9,
+            'sources': [],
+            'explanation': ''
+        }
+    return fact_check_db
+
+
+def fact_check_queries(fact_check_db, n, seed=7):
+    """Claims to verify: every fourth an edited database claim, the rest sharing only common words"""
+    rng = random.Random(seed)
+    claims = [fact_check['claim'] for fact_check in fact_check_db.values()]
+    queries = []
+    for i in range(n):
+        if i % 4 == 0:
+            words = rng.choice(claims).split()
+            for j in rng.sample(range(len(words)), len(words) // 3):
+                words[j] = f"other{rng.randint(0, 10**6)}x"
+            queries.append('Experts say ' + ' '.join(words))
+        else:
+            words = [f"word{rng.randint(0, 10**6)}y" for _ in range(8)] + ['the', 'is', 'by', 'not']
+            rng.shuffle(words)
+            queries.append(' '.join(words).capitalize())
+    return queries
+
+
+def bench_claim_index():
+    """Linear fact-check scan vs the inverted keyword index"""
+    print_section("Fact checker: linear scan vs claim index")
+    from src.models.claim_index import ClaimIndex
+    from src.models.fact_checker import FactChecker
+
+    checker = FactChecker()
+
+    def linear_verdicts(queries):
+        verdicts = []
+        for query in queries:
+            lowered = query.lower()
+            verdicts.append(next(
+                (key for key, fact_check in checker.fact_check_db.items()
+                 if checker._match_claim(lowered, fact_check['claim'])), None
+            ))
+        return verdicts
+
+    def indexed_verdicts(queries):
+        verdicts = []
+        for query in queries:
+            lowered = query.lower()
+            verdicts.append(next(
+                (key for key in checker.index.candidates(lowered)
+                 if checker._match_claim(lowered, checker.fact_check_db[key]['claim'])), None
+            ))
+        return verdicts
+
+    for size in (1000, 10000, 100000):
+        checker.fact_check_db = synthetic_fact_checks(size)
+        queries = fact_check_queries(checker.fact_check_db, 200)
+        checker.index, build_time = timed(ClaimIndex, checker.fact_check_db)
+        checker.index.candidates('')  # build the automaton
+        indexed, index_time = timed(indexed_verdicts, queries)
+
+        sample = queries[:max(20, 20000000 // size // 100)]
+        linear, linear_time = timed(linear_verdicts, sample)
+        assert linear == indexed[:len(sample)], "Claim index changed a verdict"
+
+        matched = sum(key is not None for key in indexed)
+        print(f"  {size:>7} fact-checks: build {build_time:6.2f} s, "
+              f"linear {linear_time / len(sample) * 1000:8.2f} ms/claim, "
+              f"indexed {index_time / len(queries) * 1000:6.3f} ms/claim "
+              f"({linear_time / len(sample) / (index_time / len(queries)):.0f}x), {matched} matched")
+
+
+def bench_claim_similarity():
+    """MinHash/LSH near-duplicate matching vs the keyword matcher"""
+    print_section("Fact checker: MinHash near-duplicates vs keyword matching")
+    import tempfile
+    from src.models.claim_similarity import MinHashIndex
+    from src.models.fact_checker import FactChecker
+
+    checker = FactChecker()
+    rng = random.Random(3)
+    fillers = ['reportedly', 'again', 'still', 'now']
+    unrelated_words = pseudo_words(2000, seed=9)
+    for size in (1000, 10000, 100000):
+        checker.fact_check_db = synthetic_fact_checks(size)
+        keys = list(checker.fact_check_db)
+
+        # Paraphrases: an inflected word, a filler word, and a dropped word in longer claims
+        queries, sources = [], []
+        for key in rng.sample(keys, 150):
+            words = checker.fact_check_db[key]['claim'].split()
+            words[rng.randrange(len(words))] += 's'
+            if len(words) > 5:
+                del words[rng.randrange(len(words))]
+            words.insert(rng.randrange(len(words) + 1), rng.choice(fillers))
+            queries.append(' '.join(words))
+            sources.append(key)
+        unrelated = [' '.join(rng.sample(unrelated_words, 6)) for _ in range(150)]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            checker.similarity_path = os.path.join(tmp, 'claim_lsh.npz')
+            checker._similarity_index = None
+            _, build_time = timed(lambda: checker.similarity_index)
+            file_size = os.path.getsize(checker.similarity_path)
+            _, load_time = timed(MinHashIndex.load, checker.similarity_path, checker.fact_check_db)
+
+        def keys_for(method, claims):
+            return [checker._keyword_match(c.lower()) if method == 'keyword'
+                    else next(iter(checker.similarity_index.query(c)), (None,))[0] for c in claims]
+
+        keyword, _ = timed(keys_for, 'keyword', queries + unrelated)
+        minhash, minhash_time = timed(keys_for, 'minhash', queries + unrelated)
+
+        agree = sum(m is not None and m == k for m, k in zip(minhash, keyword))
+        found = sum(m is not None for m in minhash)
+        expected = sum(k is not None for k in keyword)
+        recall_keyword = sum(k == s for k, s in zip(keyword, sources)) / len(sources)
+        recall_minhash = sum(m == s for m, s in zip(minhash, sources)) / len(sources)
+        print(f"  {size:>7} fact-checks: build {build_time:5.2f} s, load {load_time * 1000:6.1f} ms, "
+              f"file {file_size / 1e6:5.1f} MB, lookup {minhash_time / len(minhash) * 1000:5.3f} ms/claim")
+        print(f"           vs keyword matcher: precision {agree / max(found, 1):.2f}, "
+              f"recall {agree / max(expected, 1):.2f}; paraphrase recall: "
+              f"keyword {recall_keyword:.2f}, minhash {recall_minhash:.2f}; "
+              f"unrelated matched: keyword {sum(k is not None for k in keyword[150:])}, "
+              f"minhash {sum(m is not None for m in minhash[150:])}")
+
+
+def bench_fact_store():
+    """In-memory fact-check database vs the SQLite store"""
+    print_section("Fact checker: in-memory database vs SQLite store")
+    import tempfile
+    from src.models.fact_checker import FactChecker
+    from src.models.fact_store import SQLiteFactStore
+
+    memory = FactChecker('memory')
+    for size in (10000, 100000):
+        memory.fact_check_db = synthetic_fact_checks(size)
+        queries = fact_check_queries(memory.fact_check_db, 200)
+        memory.verify_claim('')  # build the index
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteFactStore(os.path.join(tmp, 'truth.db'))
+            _, import_time = timed(store.add_many, memory.fact_check_db.items())
+            file_size = sum(os.path.getsize(path) for path in (store.path, f'{store.path}-wal') if os.path.exists(path))
+            checker = FactChecker(store)
+            checker.verify_claim('')  # open the connection
+
+            expected, memory_time = timed(lambda: [memory.verify_claim(q) for q in queries])
+            results, store_time = timed(lambda: [checker.verify_claim(q) for q in queries])
+            assert results == expected, "SQLite store changed a verdict"
+            extra = list(synthetic_fact_checks(100).values())
+            _, add_time = timed(lambda: [store.add(f'extra_{i}', fact_check) for i, fact_check in enumerate(extra)])
+            store.close()
+
+        matched = sum(result['checked'] for result in results)
+        print(f"  {size:>7} fact-checks: import {import_time:5.2f} s ({size / import_time:,.0f}/s), "
+              f"file {file_size / 1e6:5.1f} MB, in-memory {memory_time / len(queries) * 1000:5.3f} ms/claim, "
+              f"SQLite {store_time / len(queries) * 1000:5.3f} ms/claim, {matched} matched, "
+              f"single add {add_time / len(extra) * 1000:5.2f} ms")
+
+
+def bench_claim_matrix():
+    """Per-claim verification vs bulk sparse-matrix verification"""
+    print_section("Fact checker: per-claim vs matrix bulk verification")
+    from src.models.claim_matrix import ClaimMatrix
+    from src.models.fact_checker import FactChecker
+
+    checker = FactChecker()
+    for size in (10000, 100000):
+        checker.fact_check_db = synthetic_fact_checks(size)
+        claims = fact_check_queries(checker.fact_check_db, 20000)
+        checker.verify_claim('')  # build the claim index
+        checker._matrix, build_time = timed(ClaimMatrix, checker.fact_check_db)
+
+        single, single_time = timed(lambda: [checker.verify_claim(claim) for claim in claims])
+        bulk, bulk_time = timed(checker.verify_claims, claims)
+        assert bulk == single, "Matrix verification changed a verdict"
+        # Words are cached across batches, as they are over a long batch job
+        _, warm_time = timed(checker.verify_claims, claims)
+
+        matched = sum(result['checked'] for result in bulk)
+        print(f"  {size:>7} fact-checks, {len(claims)} claims: matrix build {build_time:5.2f} s, "
+              f"per-claim {len(claims) / single_time:9,.0f} claims/s, "
+              f"matrix {len(claims) / bulk_time:9,.0f} claims/s ({single_time / bulk_time:.1f}x), "
+              f"warm {len(claims) / warm_time:9,.0f} claims/s, {matched} matched")
+
+
+def _stub_http_server(delay=0.0):
+    """
+    Threaded keep-alive HTTP server on every loopback address, answering 200
+
+    delay is the seconds to wait before answering, or a function of the
+    loopback address the request came in on.
+    """
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_HEAD(self):
+            time.sleep(delay(self.connection.getsockname()[0]) if callable(delay) else delay)
+            self.send_response(200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        do_GET = do_HEAD
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 256  # the default backlog of 5 drops concurrent connects
+
+    server = Server(('', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_credibility_cache():
+    """Source checks with and without the domain cache"""
+    print_section("Source credibility: per-domain result cache")
+    import tempfile
+    from src.models.credibility import SourceCredibilityAnalyzer
+    from src.models.domain_cache import DomainCache
+
+    server = _stub_http_server(delay=0.005)
+    port = server.server_port
+    rng = random.Random(5)
+    # 400 sites on loopback addresses, requested with Zipf-like popularity
+    sites = [f"http://127.0.{i // 200}.{i % 200 + 1}:{port}" for i in range(400)]
+    weights = list(accumulate(1 / (rank + 1) for rank in range(len(sites))))
+    urls = [f"{site}/article/{i}" for i, site in enumerate(rng.choices(sites, cum_weights=weights, k=1500))]
+
+    try:
+        uncached = SourceCredibilityAnalyzer(DomainCache(maxsize=0))
+        sample = urls[:200]
+        _, uncached_time = timed(lambda: [uncached.verify_source(url) for url in sample])
+        print(f"  uncached:       {len(sample) / uncached_time:8,.0f} checks/s")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, path in (("memory", None), ("memory+SQLite", os.path.join(tmp, 'credibility.db'))):
+                analyzer = SourceCredibilityAnalyzer(DomainCache(maxsize=200, path=path))
+                _, cached_time = timed(lambda: [analyzer.verify_source(url) for url in urls])
+                stats = analyzer.cache.stats()
+                print(f"  {label + ':':<15} {len(urls) / cached_time:8,.0f} checks/s "
+                      f"({len(urls) / cached_time / (len(sample) / uncached_time):.1f}x), "
+                      f"hit rate {stats['hit_rate']:.2f}, {stats['evictions']} evictions")
+                if path:
+                    restarted = SourceCredibilityAnalyzer(DomainCache(maxsize=200, path=path))
+                    _, warm_time = timed(lambda: [restarted.verify_source(url) for url in urls])
+                    print(f"  after restart:  {len(urls) / warm_time:8,.0f} checks/s, "
+                          f"hit rate {restarted.cache.stats()['hit_rate']:.2f} "
+                          f"({restarted.cache.stats()['disk_hits']} from SQLite)")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def bench_source_probing():
+    """Serial source checks vs concurrent probing with a deadline"""
+    print_section("Source credibility: serial vs concurrent probing")
+    import requests
+    from src.models.credibility import SourceCredibilityAnalyzer
+    from src.models.domain_cache import DomainCache
+    from src.models.source_prober import SourceProber
+
+    # 50 ms per request; one site in 25 takes 3 s
+    server = _stub_http_server(lambda host: 3.0 if host.endswith('.25') or host.endswith('.50') else 0.05)
+    port = server.server_port
+    urls = [f"http://127.0.1.{i}:{port}/article" for i in range(1, 51)]
+
+    def serial_check(url):
+        # The previous implementation: HEAD, then the About page, no shared connections
+        requests.head(url, timeout=30, allow_redirects=True)
+        requests.get(url.rstrip('/') + '/about', timeout=5)
+
+    try:
+        fast = [url for url in urls if not url.startswith(('http://127.0.1.25:', 'http://127.0.1.50:'))]
+        _, serial_time = timed(lambda: [serial_check(url) for url in fast])
+        print(f"  serial, {len(fast)} fast sites:          {serial_time:6.2f} s "
+              f"(+ 6 s per slow site)")
+
+        for deadline in (5.0, 1.0):
+            analyzer = SourceCredibilityAnalyzer(DomainCache(maxsize=0), SourceProber(deadline=deadline))
+            results, probe_time = timed(analyzer.verify_sources, urls)
+            timeouts = sum(result['score'] == 0.3 for result in results)
+            print(f"  concurrent, {len(urls)} sites, {deadline:.0f} s deadline: {probe_time:6.2f} s, "
+                  f"{timeouts} timed out")
+            _, repeat_time = timed(analyzer.verify_sources, fast)
+            print(f"  concurrent, {len(fast)} fast sites again:    {repeat_time:6.2f} s (kept-alive connections)")
+            analyzer.prober.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def bench_circuit_breaker():
+    """Source check latency during an outage, with and without the circuit breaker"""
+    print_section("Source credibility: circuit breaker during an outage")
+    from src.models.circuit_breaker import CircuitBreaker
+    from src.models.credibility import SourceCredibilityAnalyzer
+    from src.models.domain_cache import DomainCache
+    from src.models.source_prober import SourceProber
+
+    down = set()
+    server = _stub_http_server(lambda host: 10.0 if host in down else 0.01)
+    port = server.server_port
+    sites = [f"127.0.2.{i}" for i in range(1, 21)]
+    rng = random.Random(11)
+    # Zipf-like popularity: the most popular site, cited by about 28% of checks, goes down
+    weights = list(accumulate(1 / (rank + 1) for rank in range(len(sites))))
+    urls = [f"http://{site}:{port}/article/{i}" for i, site in enumerate(rng.choices(sites, cum_weights=weights, k=60))]
+
+    try:
+        print(f"  {'':<24}{'p50':>8}{'p90':>8}{'p99':>8}{'total':>9}{'trips':>7}")
+        for label, breaker in (
+            ("no breaker", CircuitBreaker(failure_threshold=10**9, factor=float('inf'))),
+            ("breaker + adaptive", CircuitBreaker()),
+        ):
+            down.clear()
+            # Per-URL checks without the domain cache, as for a new domain seen in every request
+            analyzer = SourceCredibilityAnalyzer(DomainCache(maxsize=0), SourceProber(deadline=2.0, breaker=breaker))
+            for i in range(25):
+                analyzer.verify_sources([f"http://{site}:{port}/warmup/{i}" for site in sites])
+            down.add(sites[0])
+            latencies = sorted(timed(analyzer.verify_source, url)[1] for url in urls)
+            percentile = lambda p: latencies[min(int(p / 100 * len(latencies)), len(latencies) - 1)]
+            print(f"  {label:<24}{percentile(50) * 1e3:6.0f}ms{percentile(90) * 1e3:6.0f}ms"
+                  f"{percentile(99) * 1e3:6.0f}ms{sum(latencies):8.1f}s{breaker.stats()['trips']:>7}")
+            analyzer.prober.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _rss_bytes():
+    """(private, file-backed) resident bytes of this process (Linux), zeros where unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            resident, shared = (int(pages) for pages in f.read().split()[1:3])
+    except (OSError, ValueError):
+        return 0, 0
+    page = os.sysconf('SC_PAGE_SIZE')
+    return (resident - shared) * page, shared * page
+
+
+def synthetic_domains(n, seed=3):
+    """Yield (domain, score) pairs of n distinct made-up domains under common suffixes"""
+    rng = random.Random(seed)
+    suffixes = ['com', 'net', 'org', 'info', 'co.uk', 'com.au', 'io', 'blogspot.com']
+    for i in range(n):
+        yield f"site{i:x}-{rng.randrange(1 << 20):x}.{suffixes[i % len(suffixes)]}", rng.random()
+
+
+def bench_domain_index():
+    """Reputation index build, footprint and lookups at 1M and 10M domains"""
+    print_section("Source credibility: domain reputation index")
+    import gc
+    import tempfile
+    from src.models.domain_index import DomainIndex
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (1000000, 10000000):
+            path = os.path.join(tmp, f'domains-{n}.idx')
+            _, build_time = timed(DomainIndex.build, synthetic_domains(n), path)
+            index, load_time = timed(DomainIndex.load, path)
+
+            rng = random.Random(n)
+            listed = [domain for domain, _ in islice(synthetic_domains(n), 0, None, n // 50000)]
+            queries = [f"www.news{i % 7}.{rng.choice(listed)}" if i % 2 else f"unlisted{i}.example.com"
+                       for i in range(100000)]
+            rss = _rss_bytes()
+            matches, lookup_time = timed(lambda: [index.lookup(query) for query in queries])
+            assert sum(match is not None for match in matches) == len(queries) // 2
+            batched, batch_time = timed(index.lookup_many, queries)
+            assert batched == matches
+            print(f"  {n:>10,} domains: build {build_time:5.1f}s, file {os.path.getsize(path) / 2**20:4.0f} MB "
+                  f"({os.path.getsize(path) / n:.1f} B/domain), load {load_time * 1e3:.2f} ms")
+            private, mapped = (after - before for after, before in zip(_rss_bytes(), rss))
+            print(f"  {'':>19}lookup {lookup_time / len(queries) * 1e6:.1f} us, lookup_many "
+                  f"{batch_time / len(queries) * 1e6:.1f} us/domain")
+            print(f"  {'':>19}after {len(queries):,} lookups: +{mapped / 2**20:.0f} MB of index pages resident "
+                  f"(shared page cache), +{private / 2**20:.0f} MB private")
+            del index, listed, queries, matches, batched
+
+        gc.collect()
+        rss = _rss_bytes()[0]
+        table = dict(synthetic_domains(1000000))
+        print(f"  (a dict of the 1,000,000 domains needs {(_rss_bytes()[0] - rss) / 2**20:.0f} MB private)")
+        del table
+
+
+def bench_author_index():
+    """Author lookups against registries of growing size"""
+    print_section("Source credibility: author registry index")
+    import gc
+    from src.models.author_index import AuthorIndex
+
+    rng = random.Random(13)
+    first, last = pseudo_words(3000, seed=1), pseudo_words(30000, seed=2)
+    bylines = [f"By {rng.choice(first).title()} {rng.choice(last).title()}, Staff Writer" for _ in range(20000)]
+
+    print(f"  {'registry':>9}{'build':>9}{'memory':>9}{'lookup':>10}{'batch':>10}{'loop (old)':>13}")
+    for n in (1000, 50000, 500000):
+        names = {f"{rng.choice(first)} {rng.choice(last)}" for _ in range(n * 2)}
+        entries = [(name.title(), rng.random(), (f"{name[0]}. {name.split()[1]}",), {'type': 'journalist'})
+                   for name in list(names)[:n]]
+        gc.collect()
+        rss = _rss_bytes()[0]
+        index, build_time = timed(AuthorIndex, entries)
+        memory = _rss_bytes()[0] - rss
+
+        _, lookup_time = timed(lambda: [index.match(byline) for byline in bylines])
+        _, batch_time = timed(index.match_many, bylines)
+        # The previous verify_author: one substring test per registry entry
+        known = {name.lower(): score for name, score, _, _ in entries}
+        sample = bylines[:max(20000000 // n, 20)]
+        _, loop_time = timed(lambda: [next((k for k in known if k in byline.lower()), None) for byline in sample])
+        print(f"  {n:>9,}{build_time:8.2f}s{memory / 2**20:7.0f}MB"
+              f"{lookup_time / len(bylines) * 1e6:8.1f}us{batch_time / len(bylines) * 1e6:8.1f}us"
+              f"{loop_time / len(sample) * 1e6:11.0f}us")
+        del index, entries, known
+
+
+BENCHMARKS = {
+    'batch': bench_batch,
+    'microbatch': bench_microbatch,
+    'streaming': bench_streaming,
+    'artifact': bench_artifact,
+    'compiled': bench_compiled,
+    'cache': bench_cache,
+    'update': bench_update,
+    'compact': bench_compact,
+    'tuning': bench_tuning,
+    'document': bench_document,
+    'patterns': bench_patterns,
+    'cleaning': bench_cleaning,
+    'sentiment': bench_sentiment,
+    'entities': bench_entities,
+    'imports': bench_imports,
+    'claims': bench_claim_index,
+    'bulk': bench_claim_matrix,
+    'similarity': bench_claim_similarity,
+    'store': bench_fact_store,
+    'credibility': bench_credibility_cache,
+    'probing': bench_source_probing,
+    'breaker': bench_circuit_breaker,
+    'domains': bench_domain_index,
+    'authors': bench_author_index,
+}
+
+
+def main():
+    """Run selected benchmarks"""
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}")
+            return 1
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
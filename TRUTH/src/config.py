@@ -8,17 +8,62 @@ load_dotenv()
 # Flask Configuration
 DEBUG = os.getenv("DEBUG", "True") == "True"
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")  # admin endpoints are disabled when unset
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", 5000))
 
 # NLP Configuration
 NLP_MODEL = "en_core_web_sm"
 MIN_CONFIDENCE_SCORE = 0.5
+CLEAN_CHUNK_SIZE = int(os.getenv("CLEAN_CHUNK_SIZE", 1000))  # texts per clean_texts chunk
+CLEAN_WORKERS = int(os.getenv("CLEAN_WORKERS", 1))  # processes for clean_texts, 1 = in-process
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "textblob")  # textblob or lexicon
+ENTITY_EXTRACTOR = os.getenv("ENTITY_EXTRACTOR", "tagger")  # tagger (POS tagger) or fast (rule-based)
+NLTK_DATA_DIR = os.getenv("NLTK_DATA_DIR", "data/nltk_data")  # pre-built by `python -m src.utils.resources`
+
+# Detector Configuration
+PREDICT_BATCH_SIZE = int(os.getenv("PREDICT_BATCH_SIZE", 1000))  # rows per predict_proba call
+COMPILE_FOREST = os.getenv("COMPILE_FOREST", "False") == "True"  # packed-array evaluator for single predictions
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", 10000))  # 0 disables the cache
+PREDICTION_CACHE_TTL = float(os.getenv("PREDICTION_CACHE_TTL", 0)) or None  # seconds, 0 = no expiry
+TRAIN_BATCH_SIZE = int(os.getenv("TRAIN_BATCH_SIZE", 1000))  # rows per partial_fit call
+STREAMING_HASH_FEATURES = 2 ** 18  # hashing featurizer width for streaming training
+UPDATE_NEW_TREES = int(os.getenv("UPDATE_NEW_TREES", 20))  # trees added per incremental update
+MODEL_REGISTRY_DIR = os.getenv("MODEL_REGISTRY_DIR", "models/registry")
+MODEL_WATCH_INTERVAL = float(os.getenv("MODEL_WATCH_INTERVAL", 5))  # seconds, 0 disables the watcher
+MICRO_BATCH_ENABLED = os.getenv("MICRO_BATCH_ENABLED", "False") == "True"
+MICRO_BATCH_WAIT_MS = float(os.getenv("MICRO_BATCH_WAIT_MS", 3))  # coalescing window
+MICRO_BATCH_MAX_SIZE = int(os.getenv("MICRO_BATCH_MAX_SIZE", 32))
+TUNING_CACHE_DIR = os.getenv("TUNING_CACHE_DIR", "data/processed/tuning_cache")  # cached cleaned/vectorized corpora
+TUNING_WORKERS = int(os.getenv("TUNING_WORKERS", 0))  # 0 = one per CPU
 
 # Fact-Check Configuration
 FACT_CHECK_THRESHOLD = 0.7
+CLAIM_MATCHER = os.getenv("CLAIM_MATCHER", "keyword")  # keyword (keyword ratio) or minhash (near-duplicates)
+CLAIM_SIMILARITY_THRESHOLD = float(os.getenv("CLAIM_SIMILARITY_THRESHOLD", 0.5))  # minhash: min shingle Jaccard
+FACT_CHECK_STORE = os.getenv("FACT_CHECK_STORE", "memory")  # memory (built-in sample) or sqlite (DATABASE_URL)
+FACT_CHECK_POOL_SIZE = int(os.getenv("FACT_CHECK_POOL_SIZE", 4))  # SQLite connections per worker process
 MAX_SOURCES_TO_CHECK = 5
 
+# Source Credibility Configuration
+CREDIBILITY_CACHE_SIZE = int(os.getenv("CREDIBILITY_CACHE_SIZE", 10000))  # domains cached, 0 disables the cache
+CREDIBILITY_CACHE_TTL = float(os.getenv("CREDIBILITY_CACHE_TTL", 86400))  # seconds to keep successful checks
+CREDIBILITY_FAILURE_TTL = float(os.getenv("CREDIBILITY_FAILURE_TTL", 600))  # seconds to keep failed checks
+CREDIBILITY_TIMEOUT_TTL = float(os.getenv("CREDIBILITY_TIMEOUT_TTL", 120))  # seconds to keep timed-out checks
+CREDIBILITY_CACHE_DB = os.getenv("CREDIBILITY_CACHE_DB", "")  # SQLite file shared by workers, empty = memory only
+PROBE_DEADLINE = float(os.getenv("PROBE_DEADLINE", 5))  # seconds per verify_source(s) call for all HTTP probes
+PROBE_MAX_CONNECTIONS = int(os.getenv("PROBE_MAX_CONNECTIONS", 32))  # concurrent probe requests per worker
+PROBE_PER_HOST = int(os.getenv("PROBE_PER_HOST", 2))  # concurrent probe requests per host
+BREAKER_FAILURES = int(os.getenv("BREAKER_FAILURES", 5))  # consecutive probe failures that open a host's circuit
+BREAKER_RESET = float(os.getenv("BREAKER_RESET", 30))  # seconds a circuit stays open before a trial probe
+BREAKER_MAX_HOSTS = int(os.getenv("BREAKER_MAX_HOSTS", 10000))  # hosts tracked by the circuit breaker
+ADAPTIVE_TIMEOUT_PERCENTILE = float(os.getenv("ADAPTIVE_TIMEOUT_PERCENTILE", 99))  # host latency percentile...
+ADAPTIVE_TIMEOUT_FACTOR = float(os.getenv("ADAPTIVE_TIMEOUT_FACTOR", 3))  # ...times this is the host's timeout
+ADAPTIVE_TIMEOUT_MIN = float(os.getenv("ADAPTIVE_TIMEOUT_MIN", 0.5))  # lowest adaptive timeout in seconds
+DOMAIN_REPUTATION_PATH = os.getenv("DOMAIN_REPUTATION_PATH", "")  # prebuilt domain index file (see domain_index.py)
+PUBLIC_SUFFIX_LIST = os.getenv("PUBLIC_SUFFIX_LIST", "")  # public_suffix_list.dat, empty = built-in common suffixes
+AUTHOR_REGISTRY_PATH = os.getenv("AUTHOR_REGISTRY_PATH", "")  # CSV/JSONL of authors and outlets with scores
+
 # API Configuration
 API_TIMEOUT = 30
 RATE_LIMIT = 100  # requests per minute
@@ -27,5 +72,5 @@ RATE_LIMIT = 100  # requests per minute
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = "logs/truth.log"
 
-# Database (if needed)
+# Database (fact-check store when FACT_CHECK_STORE is sqlite)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///truth.db")
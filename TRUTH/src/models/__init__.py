@@ -1,13 +1,27 @@
-"""Initialize models module"""
-
-from src.models.analyzer import ContentAnalyzer
-from src.models.detector import FakeNewsDetector
-from src.models.credibility import SourceCredibilityAnalyzer
-from src.models.fact_checker import FactChecker
-
-__all__ = [
-    'ContentAnalyzer',
-    'FakeNewsDetector',
-    'SourceCredibilityAnalyzer',
-    'FactChecker'
-]
+"""Initialize models module
+
+Exports are imported on first access, so importing one submodule does not
+pull in every model's dependencies.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    'ContentAnalyzer': 'src.models.analyzer',
+    'FakeNewsDetector': 'src.models.detector',
+    'SourceCredibilityAnalyzer': 'src.models.credibility',
+    'FactChecker': 'src.models.fact_checker',
+    'MicroBatcher': 'src.models.batcher',
+    'ModelRegistry': 'src.models.registry',
+    'HyperparameterSearch': 'src.models.tuning'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
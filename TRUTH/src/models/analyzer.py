@@ -1,9 +1,10 @@
 """Unified content analyzer combining all verification methods"""
 
+from src.models.batcher import MicroBatcher
 from src.models.detector import FakeNewsDetector
 from src.models.credibility import SourceCredibilityAnalyzer
 from src.models.fact_checker import FactChecker
-from src.utils.text_processor import TextAnalyzer, TextPreprocessor
+from src.utils.text_processor import Document, TextAnalyzer, TextPreprocessor
 
 
 class ContentAnalyzer:
@@ -15,6 +16,12 @@ class ContentAnalyzer:
         self.fact_checker = FactChecker()
         self.text_analyzer = TextAnalyzer()
         self.preprocessor = TextPreprocessor()
+        self.batcher = None
+    
+    def enable_micro_batching(self, max_batch_size=None, max_wait_ms=None):
+        """Route single-document ML predictions through a MicroBatcher"""
+        self.batcher = MicroBatcher(self.detector, max_batch_size, max_wait_ms)
+        return self.batcher
     
     def analyze_news(self, content, source_url=None, author=None):
         """
@@ -28,11 +35,38 @@ class ContentAnalyzer:
         Returns:
             Detailed analysis report
         """
+        # One shared Document, so each stage reuses the others' tokenization
+        doc = Document(content, self.preprocessor)
+        return self._report(doc, self._analyze_source(source_url), self._analyze_author(author),
+                            self._fact_check_content(doc))
+    
+    def analyze_news_batch(self, items):
+        """
+        Analyze several news items, fact-checking the claims of all of them in
+        one batch and probing their sources concurrently
+        
+        Args:
+            items: List of dicts with 'content' and optional 'source_url' and 'author'
+            
+        Returns:
+            List of analyze_news reports, one per item
+        """
+        docs = [Document(item.get('content', ''), self.preprocessor) for item in items]
+        sources = self._analyze_sources([item.get('source_url') for item in items])
+        authors = self._analyze_authors([item.get('author') for item in items])
+        fact_checks = self.fact_checker.get_fact_check_scores(docs)
+        return [
+            self._report(doc, source, author, fact_check)
+            for doc, source, author, fact_check in zip(docs, sources, authors, fact_checks)
+        ]
+    
+    def _report(self, doc, source_analysis, author_analysis, fact_check):
+        """Assemble the analysis report of one item around its source, author and fact-check results"""
         report = {
-            'content_analysis': self._analyze_content(content),
-            'source_analysis': self._analyze_source(source_url),
-            'author_analysis': self._analyze_author(author),
-            'fact_check': self._fact_check_content(content),
+            'content_analysis': self._analyze_content(doc),
+            'source_analysis': source_analysis,
+            'author_analysis': author_analysis,
+            'fact_check': fact_check,
             'overall_score': 0.0,
             'recommendation': ''
         }
@@ -47,7 +81,7 @@ class ContentAnalyzer:
         """Analyze content characteristics"""
         try:
             # ML-based detection
-            detector_result = self.detector.predict(content)
+            detector_result = (self.batcher or self.detector).predict(content)
             
             # Linguistic analysis
             sentiment = self.text_analyzer.get_sentiment(content)
@@ -57,6 +91,7 @@ class ContentAnalyzer:
             return {
                 'ml_prediction': detector_result['prediction'],
                 'ml_confidence': detector_result['confidence'],
+                'model_version': detector_result['model_version'],
                 'sentiment': sentiment,
                 'language_patterns': language_patterns,
                 'text_statistics': text_stats,
@@ -78,6 +113,11 @@ class ContentAnalyzer:
         
         return self.credibility_analyzer.verify_source(source_url)
     
+    def _analyze_sources(self, source_urls):
+        """Analyze the credibility of several sources, probing them concurrently"""
+        verified = iter(self.credibility_analyzer.verify_sources([url for url in source_urls if url]))
+        return [next(verified) if url else self._analyze_source(url) for url in source_urls]
+    
     def _analyze_author(self, author):
         """Analyze author credibility"""
         if not author:
@@ -90,6 +130,11 @@ class ContentAnalyzer:
         
         return self.credibility_analyzer.verify_author(author)
     
+    def _analyze_authors(self, authors):
+        """Analyze the credibility of several authors in one registry pass"""
+        verified = iter(self.credibility_analyzer.verify_authors([author for author in authors if author]))
+        return [next(verified) if author else self._analyze_author(author) for author in authors]
+    
     def _fact_check_content(self, content):
         """Fact-check claims in content"""
         return self.fact_checker.get_fact_check_score(content)
@@ -0,0 +1,440 @@
+"""Memory-mappable model artifacts for the fake news detector
+
+A mapped artifact is a directory holding a JSON manifest plus one raw .npy
+buffer per array (forest nodes, linear weights, vocabulary, IDF weights).
+Arrays are opened with mmap_mode='r', so every worker process on a host
+shares the same page-cache copy and load time does not depend on model size.
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
+
+ARTIFACT_FORMAT = 'truth-mapped-model'
+ARTIFACT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+
+TREE_LEAF = -1  # sklearn's marker for a missing child
+WALK_ARRAYS = ('model_walk_children', 'model_walk_feature', 'model_walk_threshold')
+
+
+class PackedForest:
+    """
+    Random forest stored as flat node arrays shared by all trees
+
+    Node arrays are concatenated tree after tree; tree t owns the node range
+    node_offsets[t]:node_offsets[t + 1]. Child indices are global (already
+    offset), leaves have children_left == TREE_LEAF, and value holds the
+    per-node class probabilities each tree would report.
+
+    walk holds the arrays predict_proba steps through (see walk_arrays);
+    mapped artifacts store them so workers share them instead of each
+    building a private copy. params keeps the RandomForestClassifier
+    hyperparameters, so trees added by an update are grown the same way.
+    """
+
+    def __init__(self, classes, node_offsets, children_left, children_right,
+                 feature, threshold, value, walk=None, params=None):
+        self.classes_ = classes
+        self.node_offsets = node_offsets
+        self.children_left = children_left
+        self.children_right = children_right
+        self.feature = feature
+        self.threshold = threshold
+        self.value = value
+        self._walk = walk
+        self.params = params
+
+    @property
+    def n_trees(self):
+        return len(self.node_offsets) - 1
+
+    @classmethod
+    def from_estimator(cls, model, compact=False):
+        """
+        Pack a fitted RandomForestClassifier
+
+        With compact=True, thresholds and leaf probabilities are stored as
+        float32 and child indices as int32, halving the node arrays.
+        Thresholds are rounded down, so comparisons against float32 feature
+        values (what sklearn compares) give exactly the same splits.
+        """
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        sizes = [tree.node_count for tree in trees]
+        node_offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+
+        def children(tree, offset, side):
+            child = getattr(tree, side).astype(np.int64)
+            return np.where(child == TREE_LEAF, TREE_LEAF, child + offset)
+
+        value = np.concatenate([tree.value[:, 0, :] for tree in trees])
+        normalizer = value.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+
+        forest = cls(
+            classes=np.asarray(model.classes_),
+            node_offsets=node_offsets,
+            children_left=np.concatenate([
+                children(tree, offset, 'children_left') for tree, offset in zip(trees, node_offsets)
+            ]),
+            children_right=np.concatenate([
+                children(tree, offset, 'children_right') for tree, offset in zip(trees, node_offsets)
+            ]),
+            feature=np.concatenate([tree.feature for tree in trees]).astype(np.int32),
+            threshold=np.concatenate([tree.threshold for tree in trees]),
+            value=value / normalizer,
+            params=_estimator_params(model)
+        )
+        return forest.compacted() if compact else forest
+
+    def compacted(self):
+        """Copy of the forest with float32 thresholds/values and int32 children"""
+        if len(self.feature) > np.iinfo(np.int32).max:
+            raise ValueError('Forest too large for int32 node indices')
+        threshold = np.asarray(self.threshold)
+        rounded = threshold.astype(np.float32)
+        too_high = rounded > threshold
+        rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+
+        return PackedForest(
+            classes=np.asarray(self.classes_),
+            node_offsets=np.asarray(self.node_offsets),
+            children_left=np.asarray(self.children_left, dtype=np.int32),
+            children_right=np.asarray(self.children_right, dtype=np.int32),
+            feature=np.asarray(self.feature, dtype=np.int32),
+            threshold=rounded,
+            value=np.asarray(self.value, dtype=np.float32),
+            params=self.params
+        )
+
+    @property
+    def is_compact(self):
+        return self.threshold.dtype == np.float32
+
+    def predict_proba(self, X):
+        """
+        Average tree class probabilities, matching RandomForestClassifier
+
+        All trees are walked at once: each step advances every (row, tree)
+        pair that has not reached a leaf yet with a few vectorized gathers,
+        so the total work is the sum of root-to-leaf path lengths. Pairs
+        that reached a leaf loop in place until a quarter of them are done,
+        then are dropped in one pass rather than on every step.
+        """
+        # sklearn compares float32 feature values against float64 thresholds
+        X = _dense_float32(X)
+        n_rows, n_features = X.shape
+        children, feature, threshold = self.walk_arrays()
+        flat = X.ravel()
+        nodes = np.tile(self.node_offsets[:-1], n_rows)
+        pairs = np.arange(nodes.size)
+        row_starts = np.repeat(np.arange(0, n_rows * n_features, n_features), self.n_trees)
+        current = nodes
+
+        while pairs.size:
+            go_right = flat[row_starts + feature[current]] > threshold[current]
+            advanced = children[2 * current + go_right]
+            moved = advanced != current
+            n_moved = np.count_nonzero(moved)
+            if n_moved < 0.75 * moved.size:
+                nodes[pairs] = advanced
+                pairs, row_starts, advanced = pairs[moved], row_starts[moved], advanced[moved]
+            current = advanced
+
+        leaf_values = self.value[nodes].reshape(n_rows, self.n_trees, self.value.shape[1])
+        return leaf_values.sum(axis=1) / self.n_trees
+
+    @classmethod
+    def concatenate(cls, forests):
+        """Join forests into one whose trees are averaged together"""
+        classes = forests[0].classes_
+        if any(not np.array_equal(forest.classes_, classes) for forest in forests):
+            raise ValueError('Cannot combine forests trained on different classes')
+
+        shift = 0
+        offsets, left, right = [np.zeros(1, dtype=np.int64)], [], []
+        for forest in forests:
+            offsets.append(np.asarray(forest.node_offsets[1:]) + shift)
+            left.append(_shift_children(forest.children_left, shift))
+            right.append(_shift_children(forest.children_right, shift))
+            shift += len(forest.feature)
+
+        return cls(
+            classes=np.asarray(classes),
+            node_offsets=np.concatenate(offsets),
+            children_left=np.concatenate(left),
+            children_right=np.concatenate(right),
+            feature=np.concatenate([forest.feature for forest in forests]),
+            threshold=np.concatenate([forest.threshold for forest in forests]),
+            value=np.concatenate([forest.value for forest in forests]),
+            params=forests[0].params
+        )
+
+    def newest(self, n_trees):
+        """Forest made of the last n_trees trees"""
+        if n_trees >= self.n_trees:
+            return self
+        start = int(self.node_offsets[-n_trees - 1])
+        return PackedForest(
+            classes=np.asarray(self.classes_),
+            node_offsets=np.asarray(self.node_offsets[-n_trees - 1:]) - start,
+            children_left=_shift_children(self.children_left[start:], -start),
+            children_right=_shift_children(self.children_right[start:], -start),
+            feature=np.array(self.feature[start:]),
+            threshold=np.array(self.threshold[start:]),
+            value=np.array(self.value[start:]),
+            params=self.params
+        )
+
+    def walk_arrays(self):
+        """
+        Node arrays where leaves loop back to themselves, built on first use
+
+        Returns (children, feature, threshold). Children are interleaved
+        (left, right) so one gather picks the next node; leaves test
+        feature 0 against +inf.
+        """
+        if self._walk is None:
+            leaf = self.children_left == TREE_LEAF
+            index = np.arange(len(leaf), dtype=np.int64)
+            children = np.empty(2 * len(leaf), dtype=np.int64)
+            children[0::2] = np.where(leaf, index, self.children_left)
+            children[1::2] = np.where(leaf, index, self.children_right)
+            self._walk = (
+                children,
+                np.where(leaf, 0, self.feature),
+                np.where(leaf, np.inf, self.threshold)
+            )
+        return self._walk
+
+    def arrays(self):
+        return {
+            'classes': self.classes_,
+            'node_offsets': self.node_offsets,
+            'children_left': self.children_left,
+            'children_right': self.children_right,
+            'feature': self.feature,
+            'threshold': self.threshold,
+            'value': self.value
+        }
+
+
+class PackedLinear:
+    """
+    Binary logistic model (as trained by train_streaming) over raw weight arrays
+
+    params and t keep the SGDClassifier hyperparameters and learning-rate
+    step count, so to_estimator() can resume partial_fit where training
+    stopped.
+    """
+
+    def __init__(self, classes, coef, intercept, params=None, t=None):
+        self.classes_ = classes
+        self.coef = coef
+        self.intercept = intercept
+        self.params = params
+        self.t = t
+
+    @classmethod
+    def from_estimator(cls, model):
+        """Pack a fitted binary SGDClassifier with log loss"""
+        if len(model.classes_) != 2:
+            raise ValueError('Only binary linear models can be mapped')
+        return cls(np.asarray(model.classes_), model.coef_[0].copy(), np.asarray(model.intercept_),
+                   params=_estimator_params(model), t=float(model.t_))
+
+    def to_estimator(self):
+        """SGDClassifier with these weights, ready for partial_fit"""
+        if self.params is None or self.t is None:
+            raise ValueError('Linear artifact was saved without its training state; re-save it to update it')
+        model = SGDClassifier(**self.params)
+        model.classes_ = np.array(self.classes_)
+        model.coef_ = np.array(self.coef, dtype=np.float64).reshape(1, -1)
+        model.intercept_ = np.array(self.intercept, dtype=np.float64)
+        model.t_ = self.t
+        model.n_features_in_ = model.coef_.shape[1]
+        return model
+
+    def predict_proba(self, X):
+        """Logistic probabilities, matching SGDClassifier(loss='log_loss')"""
+        decision = np.asarray(X @ self.coef).ravel() + self.intercept[0]
+        positive = 1.0 / (1.0 + np.exp(-decision))
+        return np.column_stack([1.0 - positive, positive])
+
+    def arrays(self):
+        return {'classes': self.classes_, 'coef': self.coef, 'intercept': self.intercept}
+
+
+def is_mapped_artifact(path):
+    """Check whether path is a mapped artifact directory"""
+    return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+
+def save_artifact(path, model, vectorizer, version=None, compact=False):
+    """
+    Write model and vectorizer as a mapped artifact directory
+
+    The artifact is written next to path and renamed into place, so readers
+    never observe a partially written directory. compact=True stores forest
+    node arrays in float32/int32 (see PackedForest.compacted).
+    """
+    manifest = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'model_version': version,
+        'model': {},
+        'vectorizer': {}
+    }
+    arrays = {}
+
+    if isinstance(model, (RandomForestClassifier, PackedForest)):
+        packed = model if isinstance(model, PackedForest) else PackedForest.from_estimator(model)
+        if compact and not packed.is_compact:
+            packed = packed.compacted()
+        manifest['model']['kind'] = 'random_forest'
+        manifest['model']['params'] = packed.params
+        arrays.update(zip(WALK_ARRAYS, packed.walk_arrays()))
+    elif isinstance(model, (SGDClassifier, PackedLinear)):
+        packed = model if isinstance(model, PackedLinear) else PackedLinear.from_estimator(model)
+        manifest['model']['kind'] = 'linear'
+        manifest['model']['params'] = packed.params
+        manifest['model']['t'] = packed.t
+    else:
+        raise ValueError(f'Unsupported model type for mapped artifact: {type(model).__name__}')
+    arrays.update({f'model_{name}': array for name, array in packed.arrays().items()})
+
+    if isinstance(vectorizer, TfidfVectorizer):
+        manifest['vectorizer']['kind'] = 'tfidf'
+        terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+        arrays['vectorizer_terms'] = np.array(terms, dtype=str)
+        arrays['vectorizer_idf'] = np.asarray(vectorizer.idf_)
+    elif isinstance(vectorizer, HashingVectorizer):
+        manifest['vectorizer']['kind'] = 'hashing'
+    else:
+        raise ValueError(f'Unsupported vectorizer type for mapped artifact: {type(vectorizer).__name__}')
+    manifest['vectorizer']['params'] = _vectorizer_params(vectorizer)
+
+    path = path.rstrip(os.sep)
+    parent = os.path.dirname(path) or '.'
+    os.makedirs(parent, exist_ok=True)
+    staging = f'{path}.tmp-{os.getpid()}'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    for name, array in arrays.items():
+        np.save(os.path.join(staging, f'{name}.npy'), np.ascontiguousarray(array), allow_pickle=False)
+    with open(os.path.join(staging, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    retired = None
+    if os.path.exists(path):
+        retired = f'{path}.old-{os.getpid()}'
+        os.replace(path, retired)
+    os.replace(staging, path)
+    if retired:
+        shutil.rmtree(retired, ignore_errors=True)
+
+
+def load_artifact(path):
+    """
+    Open a mapped artifact directory
+
+    Returns:
+        (model, vectorizer, model_version) where model exposes classes_ and
+        predict_proba
+    """
+    with open(os.path.join(path, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+
+    if manifest.get('format') != ARTIFACT_FORMAT or manifest.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f'Unsupported model artifact format in {path}')
+
+    def mapped(name):
+        return np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r', allow_pickle=False)
+
+    kind = manifest['model']['kind']
+    if kind == 'random_forest':
+        # Artifacts written before the walk arrays were stored build them on first use
+        walk = None
+        if all(os.path.exists(os.path.join(path, f'{name}.npy')) for name in WALK_ARRAYS):
+            walk = tuple(mapped(name) for name in WALK_ARRAYS)
+        model = PackedForest(**{
+            name: mapped(f'model_{name}') for name in (
+                'classes', 'node_offsets', 'children_left', 'children_right',
+                'feature', 'threshold', 'value'
+            )
+        }, walk=walk, params=manifest['model'].get('params'))
+    elif kind == 'linear':
+        model = PackedLinear(**{name: mapped(f'model_{name}') for name in ('classes', 'coef', 'intercept')},
+                             params=manifest['model'].get('params'), t=manifest['model'].get('t'))
+    else:
+        raise ValueError(f'Unknown model kind in artifact: {kind}')
+
+    params = _restore_params(manifest['vectorizer']['params'])
+    if manifest['vectorizer']['kind'] == 'tfidf':
+        vectorizer = TfidfVectorizer(**params)
+        terms = mapped('vectorizer_terms')
+        vectorizer.vocabulary_ = {term: index for index, term in enumerate(terms.tolist())}
+        vectorizer.idf_ = mapped('vectorizer_idf')
+    else:
+        vectorizer = HashingVectorizer(**params)
+
+    return model, vectorizer, manifest.get('model_version')
+
+
+def _vectorizer_params(vectorizer):
+    """JSON-serializable vectorizer constructor parameters"""
+    params = {}
+    for name, value in vectorizer.get_params().items():
+        if name == 'vocabulary':
+            # Stored as the vectorizer_terms array instead
+            continue
+        if name == 'dtype':
+            value = np.dtype(value).name
+        elif isinstance(value, tuple):
+            value = list(value)
+        elif isinstance(value, frozenset):
+            value = sorted(value)
+        elif callable(value):
+            raise ValueError(f'Vectorizer parameter {name!r} is callable and cannot be mapped')
+        params[name] = value
+    return params
+
+
+def _restore_params(params):
+    params = dict(params)
+    if 'dtype' in params:
+        params['dtype'] = np.dtype(params['dtype']).type
+    if isinstance(params.get('ngram_range'), list):
+        params['ngram_range'] = tuple(params['ngram_range'])
+    return params
+
+
+def _estimator_params(model):
+    """Constructor parameters of an sklearn estimator that can be stored as JSON"""
+    return {
+        name: value for name, value in model.get_params().items()
+        if value is None or isinstance(value, (bool, int, float, str))
+    }
+
+
+def _shift_children(children, shift):
+    children = np.asarray(children, dtype=np.int64)
+    return np.where(children == TREE_LEAF, TREE_LEAF, children + shift)
+
+
+def _dense_float32(X):
+    if hasattr(X, 'indptr'):
+        # Scatter CSR rows directly; cheaper than toarray() for single rows
+        dense = np.zeros(X.shape, dtype=np.float32)
+        rows = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+        dense[rows, X.indices] = X.data
+        return dense
+    if hasattr(X, 'toarray'):
+        X = X.toarray()
+    return np.asarray(X, dtype=np.float32)
@@ -0,0 +1,146 @@
+"""Author registry index with alias and diacritic normalization"""
+
+import csv
+import json
+import re
+import unicodedata
+from array import array
+
+# Letters NFKD does not decompose into a base letter and a mark
+_FOLD_LETTERS = str.maketrans({
+    'ø': 'o', 'Ø': 'o', 'ł': 'l', 'Ł': 'l', 'đ': 'd', 'Đ': 'd', 'ð': 'd', 'Ð': 'd',
+    'þ': 'th', 'Þ': 'th', 'æ': 'ae', 'Æ': 'ae', 'œ': 'oe', 'Œ': 'oe', 'ı': 'i'
+})
+_NON_WORD = re.compile(r'[\W_]+')
+
+# Words of an author string considered; longer strings are not bylines
+MAX_AUTHOR_WORDS = 64
+
+
+def normalize_name(name):
+    """
+    Normalize a person or outlet name for matching
+
+    Folds case and diacritics ("José Müller" -> "jose muller") and turns
+    punctuation into single spaces ("O'Brien, J." -> "o brien j").
+    """
+    if not name.isascii():
+        name = unicodedata.normalize('NFKD', name.translate(_FOLD_LETTERS))
+        name = ''.join(ch for ch in name if not unicodedata.combining(ch))
+    return ' '.join(_NON_WORD.sub(' ', name.casefold()).split())
+
+
+def read_author_registry(path):
+    """
+    Read registry entries from a CSV (header row) or JSON Lines file
+
+    Each record has name and score, and optionally aliases (a list, or
+    semicolon-separated in CSV). Other fields (type, outlet, ...) are kept
+    in the entry.
+
+    Yields:
+        (name, score, aliases, fields) tuples
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.csv'):
+            records = csv.DictReader(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+        for record in records:
+            record = dict(record)
+            name, score = record.pop('name'), float(record.pop('score'))
+            aliases = record.pop('aliases', None) or []
+            if isinstance(aliases, str):
+                aliases = [alias.strip() for alias in aliases.split(';') if alias.strip()]
+            yield name, score, aliases, {key: value for key, value in record.items() if value not in (None, '')}
+
+
+class AuthorIndex:
+    """
+    Registry of journalists and outlets with credibility scores
+
+    Every name and alias is stored under its normalized form in one hash
+    table. An author string matches an entry when a run of its normalized
+    words equals one of those forms, so "By Jane Doe, Reuters" finds both
+    "Jane Doe" and "Reuters". Matching looks up each run of words up to
+    the longest registered name, which costs the same for a registry of
+    ten entries or a million. The longest matching run wins, then the
+    leftmost.
+    """
+
+    def __init__(self, entries=()):
+        """
+        Args:
+            entries: (name, score, aliases, fields) tuples, as read_author_registry yields
+        """
+        self._keys = {}  # normalized name or alias -> entry id
+        self._names = []
+        self._scores = array('d')
+        self._aliases = []
+        self._fields = []
+        self.max_words = 0
+        for name, score, aliases, fields in entries:
+            self.add(name, score, aliases, **fields)
+
+    @classmethod
+    def from_file(cls, path):
+        """Build an index from a CSV or JSON Lines registry (see read_author_registry)"""
+        return cls(read_author_registry(path))
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, name, score, aliases=(), **fields):
+        """
+        Register an author or outlet
+
+        A name or alias already registered now refers to this entry.
+
+        Returns:
+            Entry id
+        """
+        entry_id = len(self._names)
+        self._names.append(name)
+        self._scores.append(score)
+        self._aliases.append(tuple(aliases))
+        self._fields.append(fields or None)
+        for key in (name, *aliases):
+            key = normalize_name(key)
+            if key:
+                self._keys[key] = entry_id
+                self.max_words = max(self.max_words, key.count(' ') + 1)
+        return entry_id
+
+    def entry(self, entry_id):
+        """Registry entry as a new dict: name, score, aliases and any extra fields"""
+        entry = {
+            'name': self._names[entry_id],
+            'score': self._scores[entry_id],
+            'aliases': list(self._aliases[entry_id])
+        }
+        entry.update(self._fields[entry_id] or {})
+        return entry
+
+    def match_id(self, author):
+        """Id of the entry matching author string, or None"""
+        words = normalize_name(author).split()[:MAX_AUTHOR_WORDS]
+        keys = self._keys
+        for length in range(min(self.max_words, len(words)), 0, -1):
+            for start in range(len(words) - length + 1):
+                entry_id = keys.get(' '.join(words[start:start + length]))
+                if entry_id is not None:
+                    return entry_id
+        return None
+
+    def match(self, author):
+        """Registry entry matching author string, or None"""
+        entry_id = self.match_id(author) if author else None
+        return None if entry_id is None else self.entry(entry_id)
+
+    def match_many(self, authors):
+        """match() for a list of author strings, matching each distinct string once"""
+        ids = {}
+        for author in authors:
+            if author and author not in ids:
+                ids[author] = self.match_id(author)
+        return [None if not author or ids[author] is None else self.entry(ids[author]) for author in authors]
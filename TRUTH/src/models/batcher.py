@@ -0,0 +1,130 @@
+"""Micro-batching front end for the fake news detector"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from src.config import MICRO_BATCH_MAX_SIZE, MICRO_BATCH_WAIT_MS
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-document predictions into batched calls
+
+    Callers block in predict() while a background thread collects requests
+    that arrive within a short window (or until max_batch_size is reached)
+    and scores them with one FakeNewsDetector.predict_batch call. Only useful
+    when the process serves requests concurrently (e.g. gunicorn gthread
+    workers); with sync workers every batch has size 1.
+    """
+
+    def __init__(self, detector, max_batch_size=None, max_wait_ms=None):
+        self.detector = detector
+        self.max_batch_size = max_batch_size or MICRO_BATCH_MAX_SIZE
+        self.max_wait = (MICRO_BATCH_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000.0
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._pid = None
+        self._reset_stats()
+
+    def predict(self, text):
+        """Predict a single text; same result shape as FakeNewsDetector.predict"""
+        return self.submit(text).result()
+
+    def submit(self, text):
+        """Queue a text for scoring and return a Future for its result"""
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((text, future, time.perf_counter()))
+        return future
+
+    def stats(self):
+        """Return queue depth, batch size and wait time statistics"""
+        with self._lock:
+            batches = self._batches
+            requests = self._requests
+            return {
+                'queue_depth': self._queue.qsize(),
+                'batches': batches,
+                'requests': requests,
+                'avg_batch_size': requests / batches if batches else 0.0,
+                'max_batch_size': self._max_batch_seen,
+                'avg_wait_ms': self._total_wait / requests * 1000 if requests else 0.0,
+                'max_wait_ms': self._max_wait_seen * 1000,
+                'max_batch_size_limit': self.max_batch_size,
+                'max_wait_ms_limit': self.max_wait * 1000
+            }
+
+    def reset_stats(self):
+        """Clear accumulated statistics"""
+        with self._lock:
+            self._reset_stats()
+
+    def _reset_stats(self):
+        self._batches = 0
+        self._requests = 0
+        self._max_batch_seen = 0
+        self._total_wait = 0.0
+        self._max_wait_seen = 0.0
+
+    def _ensure_worker(self):
+        """Start the worker thread, restarting it after a fork (gunicorn preload) or if it died"""
+        if self._worker is not None and self._pid == os.getpid() and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or self._pid != os.getpid() or not self._worker.is_alive():
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._worker = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+                self._worker.start()
+
+    def _collect(self):
+        """Block for the first request, then gather more until the window closes"""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                self._score(batch)
+            except Exception as e:
+                # Keep serving: the failure goes to the callers, not the thread
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _score(self, batch):
+        """Score one batch and resolve its futures, skipping cancelled ones"""
+        started = time.perf_counter()
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        texts = [text for text, _, _ in batch]
+
+        results = self.detector.predict_batch(texts, batch_size=len(texts))
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
+
+        waits = [started - enqueued for _, _, enqueued in batch]
+        with self._lock:
+            self._batches += 1
+            self._requests += len(batch)
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+            self._total_wait += sum(waits)
+            self._max_wait_seen = max(self._max_wait_seen, max(waits))
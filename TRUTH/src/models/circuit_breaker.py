@@ -0,0 +1,181 @@
+"""Per-host circuit breaker and adaptive timeouts for source probing"""
+
+import math
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+
+from src.config import (
+    ADAPTIVE_TIMEOUT_FACTOR, ADAPTIVE_TIMEOUT_MIN, ADAPTIVE_TIMEOUT_PERCENTILE, BREAKER_FAILURES,
+    BREAKER_MAX_HOSTS, BREAKER_RESET
+)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Latencies kept per host, and needed before its timeout adapts
+LATENCY_WINDOW = 100
+MIN_SAMPLES = 20
+
+
+class _Host:
+    """Breaker state of one host"""
+
+    __slots__ = ('state', 'failures', 'opened_at', 'trips', 'latencies', 'timeout')
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.timeout = None
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker per host, with timeouts adapted to each host's latency
+
+    After failure_threshold consecutive failed probes a host's circuit
+    opens: allow() refuses it, so callers return at once instead of
+    waiting out a timeout on every request. Once reset_timeout seconds
+    have passed the circuit is half-open and allow() lets one trial probe
+    through; its success closes the circuit, its failure opens it again.
+
+    Latencies of successful requests are kept per host. With enough of
+    them, timeout() is a multiple of their high percentile, clamped
+    between min_timeout and the caller's default, so a fast host that
+    hangs is given up on long before the default timeout.
+    """
+
+    def __init__(self, failure_threshold=None, reset_timeout=None, percentile=ADAPTIVE_TIMEOUT_PERCENTILE,
+                 factor=ADAPTIVE_TIMEOUT_FACTOR, min_timeout=ADAPTIVE_TIMEOUT_MIN, max_hosts=BREAKER_MAX_HOSTS,
+                 clock=time.monotonic):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open a circuit (defaults to BREAKER_FAILURES)
+            reset_timeout: Seconds a circuit stays open before a trial probe (defaults to BREAKER_RESET)
+            percentile: Latency percentile the adaptive timeout is based on
+            factor: Multiple of that percentile allowed before timing out
+            min_timeout: Lowest adaptive timeout in seconds
+            max_hosts: Hosts tracked, least recently seen ones forgotten first
+            clock: Time source
+        """
+        self.failure_threshold = failure_threshold or BREAKER_FAILURES
+        self.reset_timeout = BREAKER_RESET if reset_timeout is None else reset_timeout
+        self.percentile = percentile
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.max_hosts = max_hosts
+        self._clock = clock
+        self._hosts = OrderedDict()
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.trips = 0
+
+    def _host(self, host):
+        entry = self._hosts.get(host)
+        if entry is None:
+            entry = self._hosts[host] = _Host()
+            while len(self._hosts) > self.max_hosts:
+                self._hosts.popitem(last=False)
+        else:
+            self._hosts.move_to_end(host)
+        return entry
+
+    def allow(self, host):
+        """
+        Whether a request to host may go ahead
+
+        A half-open circuit admits a single trial request; the caller must
+        report its result with record_success or record_failure. A trial
+        that is not reported within reset_timeout is replaced by another.
+        """
+        with self._lock:
+            entry = self._host(host)
+            if entry.state == CLOSED:
+                return True
+            now = self._clock()
+            if now - entry.opened_at >= self.reset_timeout:
+                entry.state = HALF_OPEN
+                entry.opened_at = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, host, latency=None):
+        """Close host's circuit and record the request's latency in seconds"""
+        with self._lock:
+            entry = self._host(host)
+            entry.state = CLOSED
+            entry.failures = 0
+            if latency is not None:
+                entry.latencies.append(latency)
+                entry.timeout = None
+
+    def record_failure(self, host):
+        """Count a failed request, opening host's circuit at the threshold or after a failed trial"""
+        with self._lock:
+            entry = self._host(host)
+            entry.failures += 1
+            if entry.state == HALF_OPEN or (entry.state == CLOSED and entry.failures >= self.failure_threshold):
+                entry.state = OPEN
+                entry.opened_at = self._clock()
+                entry.trips += 1
+                self.trips += 1
+
+    def state(self, host):
+        """'closed', 'open' or 'half_open' (open past its reset time, or probing with a trial)"""
+        with self._lock:
+            entry = self._hosts.get(host)
+            if entry is None or entry.state == CLOSED:
+                return CLOSED
+            return HALF_OPEN if self._clock() - entry.opened_at >= self.reset_timeout else entry.state
+
+    def timeout(self, host, default):
+        """
+        Request timeout for host in seconds
+
+        Args:
+            host: Host name (with port, if any)
+            default: Timeout used until the host has MIN_SAMPLES latencies, and the upper bound
+
+        Returns:
+            factor times the host's latency percentile, between min_timeout and default
+        """
+        with self._lock:
+            entry = self._hosts.get(host)
+            if entry is None or len(entry.latencies) < MIN_SAMPLES:
+                return default
+            if entry.timeout is None:
+                latencies = sorted(entry.latencies)
+                rank = max(math.ceil(self.percentile / 100 * len(latencies)) - 1, 0)
+                entry.timeout = latencies[rank] * self.factor
+            return min(max(entry.timeout, self.min_timeout), default)
+
+    def stats(self):
+        """Return breaker counts, and the state of every host whose circuit is not closed"""
+        now = self._clock()
+        with self._lock:
+            hosts = {}
+            tripped = sorted((entry.trips, host) for host, entry in self._hosts.items() if entry.trips)
+            for host, entry in self._hosts.items():
+                if entry.state == CLOSED:
+                    continue
+                hosts[host] = {
+                    'state': HALF_OPEN if now - entry.opened_at >= self.reset_timeout else entry.state,
+                    'failures': entry.failures,
+                    'trips': entry.trips,
+                    'since': round(now - entry.opened_at, 3),
+                }
+            states = Counter(host['state'] for host in hosts.values())
+            return {
+                'tracked': len(self._hosts),
+                'open': states[OPEN],
+                'half_open': states[HALF_OPEN],
+                'trips': self.trips,
+                'rejected': self.rejected,
+                'top_trips': {host: trips for trips, host in reversed(tripped[-10:])},
+                'hosts': hosts,
+            }
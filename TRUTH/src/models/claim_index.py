@@ -0,0 +1,184 @@
+"""Inverted keyword index for fact-check claim lookup"""
+
+from collections import Counter
+
+from src.utils.lexicon import AhoCorasick
+
+# A claim matches a fact-check when this share of the fact-check's keywords
+# occur in it (see FactChecker._match_claim)
+MATCH_RATIO = 0.6
+
+# Keywords in more than this share of fact-checks are only indexed when needed
+COMMON_KEYWORD_SHARE = 0.01
+
+
+class FactCheckDB(dict):
+    """
+    Fact-check database dict that counts its modifications
+
+    Indexes over the database (ClaimIndex, ClaimMatrix, MinHashIndex)
+    compare version against the one they were built at, so adding,
+    replacing or deleting entries, directly or through
+    FactChecker.add_fact_check, is always noticed. Replace fact-checks
+    rather than mutating their dicts in place.
+    """
+
+    version = 0
+
+    def _modified(method):
+        def wrapper(self, *args, **kwargs):
+            self.version += 1
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    __setitem__ = _modified(dict.__setitem__)
+    __delitem__ = _modified(dict.__delitem__)
+    __ior__ = _modified(dict.__ior__)
+    clear = _modified(dict.clear)
+    pop = _modified(dict.pop)
+    popitem = _modified(dict.popitem)
+    setdefault = _modified(dict.setdefault)
+    update = _modified(dict.update)
+    del _modified
+
+
+def db_version(fact_check_db):
+    """
+    Change signal of a fact-check database
+
+    The version counter of a FactCheckDB or SQLiteFactStore; for other
+    mappings, a hash of every key and claim (costs a pass over the database).
+    """
+    version = getattr(fact_check_db, 'version', None)
+    if version is not None:
+        return version
+    return hash(tuple((key, fact_check['claim']) for key, fact_check in fact_check_db.items()))
+
+
+def claim_keywords(claim):
+    """Normalized keywords of a fact-check claim, as FactChecker._match_claim splits them"""
+    return claim.lower().split()
+
+
+def required_matches(n_keywords, ratio=MATCH_RATIO):
+    """Fewest matching keywords out of n_keywords that reach ratio (None if unreachable)"""
+    for matches in range(1, n_keywords + 1):
+        if matches / n_keywords >= ratio:
+            return matches
+    return None
+
+
+def indexed_keywords(words, frequency, common, ratio=MATCH_RATIO):
+    """
+    Keyword positions to index a fact-check under (see ClaimIndex)
+
+    Args:
+        words: The fact-check's keywords
+        frequency: Number of fact-checks containing each keyword
+        common: Frequency above which a keyword counts as common
+        ratio: Match ratio
+
+    Returns:
+        (keywords to index, hits among them a matching claim needs);
+        ([], None) if the fact-check can never match
+    """
+    needed = required_matches(len(words), ratio)
+    if needed is None:
+        return [], None
+
+    # The rarest n - t + 1 positions, plus one more unless it is a common keyword
+    rarest = sorted(words, key=lambda word: (frequency[word], word))
+    indexed = len(words) - needed + 1
+    if indexed < len(words) and frequency[rarest[indexed]] <= common:
+        indexed += 1
+    return rarest[:indexed], needed - (len(words) - indexed)
+
+
+class ClaimIndex:
+    """
+    Candidate filter over a fact-check database
+
+    A fact-check with n keywords matches when at least t of them occur in
+    the claim, so at least t - (n - q) of any q of its keywords must occur.
+    Each fact-check is indexed under its n - t + 1 rarest keyword
+    positions, plus the next rarest unless that one is a common keyword
+    (then a candidate must contain two of its rare keywords, not just one).
+    One Aho-Corasick scan of the claim finds the indexed keywords it
+    contains; hits are counted over their posting lists and only
+    fact-checks with enough hits to reach the match ratio are returned, so
+    a lookup costs the claim length plus the postings of the rare keywords
+    it shares, not the database size. Keywords match as substrings of
+    the lowercased claim, as in FactChecker._match_claim, and candidates
+    come back in database order so the first verified candidate is the one
+    a full scan would find.
+    """
+
+    def __init__(self, fact_check_db, ratio=MATCH_RATIO):
+        self.ratio = ratio
+        self.build(fact_check_db)
+
+    def build(self, fact_check_db):
+        """Index every fact-check in fact_check_db, replacing the current index"""
+        self._db = fact_check_db
+        self._version = db_version(fact_check_db)
+        self._keys = []
+        self._needed = []
+        self._postings = {}
+        self._automaton = None
+
+        keywords = [claim_keywords(fact_check['claim']) for fact_check in fact_check_db.values()]
+        frequency = Counter(keyword for words in keywords for keyword in set(words))
+        common = max(COMMON_KEYWORD_SHARE * len(keywords), 1)
+        for key, words in zip(fact_check_db, keywords):
+            self._index(key, words, frequency, common)
+
+    def add(self, key, fact_check):
+        """
+        Index a fact-check appended to the database under a new key
+
+        Keyword rarity is estimated from the current posting lists; any
+        choice of indexed keywords is correct, rarer ones just prune more.
+        """
+        words = claim_keywords(fact_check['claim'])
+        frequency = {word: len(self._postings.get(word, ())) for word in words}
+        self._index(key, words, frequency, max(COMMON_KEYWORD_SHARE * len(self._keys), 1))
+        self._version = db_version(self._db)
+
+    def _index(self, key, words, frequency, common):
+        """Post a fact-check under its rarest keyword positions"""
+        ordinal = len(self._keys)
+        self._keys.append(key)
+        indexed, needed = indexed_keywords(words, frequency, common, self.ratio)
+        self._needed.append(needed)
+        for keyword in indexed:
+            postings = self._postings.get(keyword)
+            if postings is None:
+                postings = self._postings[keyword] = []
+                self._automaton = None
+            postings.append(ordinal)
+
+    def is_stale(self, fact_check_db):
+        """True if fact_check_db is not the indexed database or has changed since (see db_version)"""
+        return fact_check_db is not self._db or db_version(fact_check_db) != self._version
+
+    def candidates(self, claim_lower):
+        """
+        Keys of the fact-checks a lowercased claim could match
+
+        Args:
+            claim_lower: Lowercased claim text
+
+        Returns:
+            List of database keys in database order
+        """
+        if self._automaton is None:
+            self._terms = list(self._postings)
+            self._automaton = AhoCorasick(self._terms)
+
+        hits = Counter()
+        for term_id in self._automaton.present(claim_lower):
+            hits.update(self._postings[self._terms[term_id]])
+        needed = self._needed
+        return [self._keys[ordinal] for ordinal in sorted(hits) if hits[ordinal] >= needed[ordinal]]
@@ -0,0 +1,151 @@
+"""Bulk claim verification with sparse matrix products"""
+
+from collections import Counter
+from itertools import chain
+
+import numpy as np
+from scipy import sparse
+
+from src.models.claim_index import COMMON_KEYWORD_SHARE, MATCH_RATIO, claim_keywords, db_version, indexed_keywords
+from src.utils.lexicon import AhoCorasick
+
+# Claims per matrix product, bounding the size of the intermediate matrices
+MATRIX_CHUNK = 20000
+
+# Distinct claim words whose contained keywords are remembered between batches
+WORD_CACHE_SIZE = 200000
+
+NEVER = np.iinfo(np.int32).max
+
+
+class ClaimMatrix:
+    """
+    Fact-check database as sparse keyword matrices, for verifying many claims at once
+
+    Every distinct fact-check keyword is a term. A claim contains a term
+    when the term is a substring of one of its words (keywords never span
+    whitespace), which is FactChecker._match_claim's substring test; the
+    terms of each distinct word are found once with an Aho-Corasick scan
+    and cached, so tokenizing a batch is mostly dictionary lookups. The
+    claims of a batch become a binary claim-by-term matrix C.
+
+    Multiplying C by the fact-check-by-term count matrix would give every
+    match count, but common keywords make that product nearly dense, so it
+    is done in two steps. C times the matrix of indexed keyword positions
+    (chosen as in ClaimIndex) gives candidate pairs, those with enough
+    indexed hits to possibly reach the match ratio. The exact match count of
+    each candidate pair is then the row-wise product of its claim row and
+    its fact-check's full term row. Thresholds and the first match (in
+    database order) per claim are selected with array operations, so
+    verdicts are the ones verify_claim would give.
+    """
+
+    def __init__(self, fact_check_db, ratio=MATCH_RATIO):
+        self.ratio = ratio
+        self.build(fact_check_db)
+
+    def build(self, fact_check_db):
+        """Build the term matrices of fact_check_db, replacing the current ones"""
+        self._db = fact_check_db
+        self._version = db_version(fact_check_db)
+        self._keys = list(fact_check_db)
+        keywords = [claim_keywords(fact_check['claim']) for fact_check in fact_check_db.values()]
+        frequency = Counter(keyword for words in keywords for keyword in set(words))
+        common = max(COMMON_KEYWORD_SHARE * len(keywords), 1)
+
+        self._terms = {}
+        rows, columns, indexed_rows, indexed_columns = [], [], [], []
+        needed = np.full(len(keywords), NEVER, dtype=np.int64)
+        indexed_needed = np.full(len(keywords), NEVER, dtype=np.int64)
+        for row, words in enumerate(keywords):
+            indexed, indexed_hits = indexed_keywords(words, frequency, common, self.ratio)
+            if indexed_hits is None:
+                continue
+            needed[row] = indexed_hits + len(words) - len(indexed)
+            indexed_needed[row] = indexed_hits
+            for word in words:
+                rows.append(row)
+                columns.append(self._terms.setdefault(word, len(self._terms)))
+            indexed_rows += [row] * len(indexed)
+            indexed_columns += [self._terms[word] for word in indexed]
+
+        shape = (len(keywords), len(self._terms))
+        # Fact-check x term: keyword positions (a repeated keyword counts once per position)
+        self._counts = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, columns)), shape=shape)
+        # Term x fact-check: indexed keyword positions only
+        self._indexed = sparse.csr_matrix(
+            (np.ones(len(indexed_rows), dtype=np.int32), (indexed_columns, indexed_rows)), shape=shape[::-1]
+        )
+        self._needed = needed
+        self._indexed_needed = indexed_needed
+        self._automaton = AhoCorasick(list(self._terms)) if self._terms else None
+        self._word_terms = {}
+
+    def is_stale(self, fact_check_db):
+        """True if fact_check_db is not the indexed database or has changed since (see db_version)"""
+        return fact_check_db is not self._db or db_version(fact_check_db) != self._version
+
+    def claim_terms(self, claims_lower):
+        """
+        Binary claim-by-term matrix of lowercased claims
+
+        Args:
+            claims_lower: List of lowercased claim texts
+
+        Returns:
+            CSR matrix of shape (len(claims_lower), number of terms)
+        """
+        if len(self._word_terms) > WORD_CACHE_SIZE:
+            self._word_terms = {}
+        word_terms = self._word_terms
+        present = self._automaton.present
+
+        rows = []
+        for claim in claims_lower:
+            terms = set()
+            for word in set(claim.split()):
+                found = word_terms.get(word)
+                if found is None:
+                    found = word_terms[word] = tuple(present(word))
+                terms.update(found)
+            rows.append(terms)
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(terms) for terms in rows], out=indptr[1:])
+        indices = np.fromiter(chain.from_iterable(rows), dtype=np.int32, count=indptr[-1])
+        data = np.ones(len(indices), dtype=np.int32)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(self._terms)))
+
+    def match(self, claims_lower, chunk_size=MATRIX_CHUNK):
+        """
+        Key of the first fact-check (in database order) each claim matches
+
+        Args:
+            claims_lower: List of lowercased claim texts
+            chunk_size: Claims per matrix product
+
+        Returns:
+            List of database keys, None for claims that match nothing
+        """
+        if self._automaton is None:
+            return [None] * len(claims_lower)
+        keys = []
+        for start in range(0, len(claims_lower), chunk_size):
+            first = self._first_matches(self.claim_terms(claims_lower[start:start + chunk_size]))
+            keys += [self._keys[f] if f < len(self._keys) else None for f in first.tolist()]
+        return keys
+
+    def _first_matches(self, claims):
+        """Row index of the first fact-check each claim row matches (len(db) if none)"""
+        # Candidate pairs: enough indexed keyword hits to reach the ratio
+        indexed_hits = (claims @ self._indexed).tocoo()
+        candidate = indexed_hits.data >= self._indexed_needed[indexed_hits.col]
+        pair_claims, pair_facts = indexed_hits.row[candidate], indexed_hits.col[candidate]
+
+        # Exact keyword hits of each candidate pair, then the ratio threshold
+        hits = np.asarray(claims[pair_claims].multiply(self._counts[pair_facts]).sum(axis=1)).ravel()
+        matched = hits >= self._needed[pair_facts]
+
+        first = np.full(claims.shape[0], len(self._keys), dtype=np.int64)
+        np.minimum.at(first, pair_claims[matched], pair_facts[matched])
+        return first
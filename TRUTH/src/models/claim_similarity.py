@@ -0,0 +1,223 @@
+"""Approximate near-duplicate claim matching with MinHash and LSH"""
+
+import hashlib
+import json
+import os
+import re
+import zlib
+
+import numpy as np
+
+from src.models.claim_index import db_version
+
+WORD = re.compile(r'\w+')
+EMPTY_SIGNATURE = np.iinfo(np.uint32).max
+
+# Claims hashed per vectorized block when building signatures
+SIGNATURE_BLOCK = 1000
+
+
+def shingles(text, size=4):
+    """Character shingles of a claim, after lowercasing and collapsing it to its words"""
+    normalized = ' '.join(WORD.findall(text.lower()))
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def jaccard(a, b):
+    """Jaccard similarity of two sets (0 when both are empty)"""
+    if not a or not b:
+        return 0.0
+    overlap = len(a & b)
+    return overlap / (len(a) + len(b) - overlap)
+
+
+def fingerprint(fact_check_db):
+    """Digest of a fact-check database's keys and claims, to tie a saved index to its database"""
+    return _digest((key, fact_check['claim']) for key, fact_check in fact_check_db.items())
+
+
+def _digest(pairs):
+    h = hashlib.blake2b(digest_size=16)
+    for key, claim in pairs:
+        h.update(json.dumps([key, claim]).encode('utf-8'))
+    return h.hexdigest()
+
+
+class MinHashIndex:
+    """
+    Locality-sensitive index of fact-check claims for near-duplicate lookup
+
+    Each claim becomes a set of character shingles, summarized by a
+    MinHash signature (one minimum per hash function, so two signatures
+    agree per position with probability equal to the claims' Jaccard
+    similarity). Signatures are cut into bands; claims whose band hashes
+    collide with the query's become candidates, found by binary search in
+    one sorted array per band, and are then re-scored by their exact
+    shingle Jaccard similarity. With 32 bands of 4 rows, pairs at
+    similarity 0.5 collide in some band ~87% of the time and pairs at 0.2
+    ~5% of the time, so lookups touch only near-duplicates however large
+    the database is.
+    """
+
+    def __init__(self, num_perm=128, bands=32, threshold=0.5, shingle_size=4, seed=1):
+        if num_perm % bands:
+            raise ValueError('num_perm must be a multiple of bands')
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        # Multiply-shift hash family: h(x) = (a * x + b) mod 2^64 >> 32, a odd
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+        self._band_weights = rng.integers(1, 2 ** 63, self.rows, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+        self._db = None
+        self._version = None
+        self._keys = []
+        self._claims = []
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._tables = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _shingle_hashes(self, text):
+        return np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles(text, self.shingle_size)),
+            dtype=np.uint64
+        )
+
+    def signatures(self, texts):
+        """
+        MinHash signatures for a list of texts
+
+        Returns:
+            uint32 array of shape (len(texts), num_perm); texts without
+            shingles get EMPTY_SIGNATURE in every position
+        """
+        result = np.full((len(texts), self.num_perm), EMPTY_SIGNATURE, dtype=np.uint32)
+        for start in range(0, len(texts), SIGNATURE_BLOCK):
+            hashes = [self._shingle_hashes(text) for text in texts[start:start + SIGNATURE_BLOCK]]
+            rows = [i for i, h in enumerate(hashes) if len(h)]
+            if not rows:
+                continue
+            stacked = np.concatenate([hashes[i] for i in rows])
+            offsets = np.cumsum([0] + [len(hashes[i]) for i in rows[:-1]])
+            hashed = (stacked[:, None] * self._a + self._b) >> np.uint64(32)
+            result[start + np.asarray(rows)] = np.minimum.reduceat(hashed, offsets, axis=0)
+        return result
+
+    def _band_hashes(self, signatures):
+        """One uint64 hash per (signature, band)"""
+        banded = signatures.reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+        return (banded * self._band_weights).sum(axis=2, dtype=np.uint64)
+
+    def build(self, fact_check_db):
+        """Index every claim in fact_check_db, replacing the current index"""
+        self._keys = list(fact_check_db)
+        self._claims = [fact_check['claim'] for fact_check in fact_check_db.values()]
+        self._signatures = self.signatures(self._claims)
+        self._db = fact_check_db
+        self._version = db_version(fact_check_db)
+        self._tables = None
+        self._sorted_tables()
+        return self
+
+    def add(self, key, claim):
+        """Index a claim appended to the database; band tables are re-sorted on the next query"""
+        self._keys.append(key)
+        self._claims.append(claim)
+        self._signatures = np.vstack([self._signatures, self.signatures([claim])])
+        self._tables = None
+        if self._db is not None:
+            self._version = db_version(self._db)
+
+    def _sorted_tables(self):
+        if self._tables is None:
+            band_hashes = self._band_hashes(self._signatures)
+            order = np.argsort(band_hashes, axis=0, kind='stable')
+            self._tables = (np.take_along_axis(band_hashes, order, axis=0).T.copy(), order.T.copy())
+        return self._tables
+
+    def candidates(self, claim):
+        """Ordinals of indexed claims sharing at least one band with claim"""
+        if not self._keys:
+            return set()
+        hashes, order = self._sorted_tables()
+        query = self._band_hashes(self.signatures([claim]))[0]
+        found = set()
+        for band in range(self.bands):
+            lo = np.searchsorted(hashes[band], query[band], side='left')
+            hi = np.searchsorted(hashes[band], query[band], side='right')
+            found.update(order[band, lo:hi].tolist())
+        return found
+
+    def query(self, claim, threshold=None):
+        """
+        Find indexed claims similar to claim
+
+        Args:
+            claim: Claim text
+            threshold: Minimum exact Jaccard similarity (defaults to self.threshold)
+
+        Returns:
+            List of (key, similarity), most similar first, ties in index order
+        """
+        threshold = self.threshold if threshold is None else threshold
+        query_shingles = shingles(claim, self.shingle_size)
+        matches = []
+        for ordinal in sorted(self.candidates(claim)):
+            similarity = jaccard(query_shingles, shingles(self._claims[ordinal], self.shingle_size))
+            if similarity >= threshold:
+                matches.append((ordinal, similarity))
+        matches.sort(key=lambda match: -match[1])
+        return [(self._keys[ordinal], similarity) for ordinal, similarity in matches]
+
+    def is_stale(self, fact_check_db):
+        """True if fact_check_db is not the indexed database or has changed since (see db_version)"""
+        return fact_check_db is not self._db or db_version(fact_check_db) != self._version
+
+    def save(self, path):
+        """Write signatures, keys and parameters to an .npz file (atomically)"""
+        meta = {
+            'num_perm': self.num_perm, 'bands': self.bands, 'threshold': self.threshold,
+            'shingle_size': self.shingle_size, 'seed': self.seed,
+            'fingerprint': _digest(zip(self._keys, self._claims)), 'keys': self._keys
+        }
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        staging = f'{path}.{os.getpid()}.tmp'
+        with open(staging, 'wb') as f:
+            np.savez(f, signatures=self._signatures, meta=np.array(json.dumps(meta)))
+        os.replace(staging, path)
+
+    @classmethod
+    def load(cls, path, fact_check_db):
+        """
+        Load an index saved for fact_check_db
+
+        Returns:
+            The index, or None if the file is missing or was saved for a
+            different database
+        """
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            signatures = data['signatures']
+        if meta['fingerprint'] != fingerprint(fact_check_db):
+            return None
+
+        index = cls(meta['num_perm'], meta['bands'], meta['threshold'], meta['shingle_size'], meta['seed'])
+        index._keys = meta['keys']
+        index._claims = [fact_check_db[key]['claim'] for key in index._keys]
+        index._signatures = signatures
+        index._db = fact_check_db
+        index._version = db_version(fact_check_db)
+        index._sorted_tables()
+        return index
@@ -2,44 +2,321 @@
 
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
 from sklearn.pipeline import Pipeline
+from collections import namedtuple
+from itertools import islice
+import copy
+import hashlib
 import pickle
 import os
+import time
+import uuid
 
-from src.utils.text_processor import TextPreprocessor
+from src.config import (
+    COMPILE_FOREST, PREDICT_BATCH_SIZE, PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL,
+    STREAMING_HASH_FEATURES, TRAIN_BATCH_SIZE, UPDATE_NEW_TREES
+)
+from src.models.artifact import PackedForest, PackedLinear, is_mapped_artifact, load_artifact, save_artifact
+from src.utils.cache import LRUCache
+from src.utils.text_processor import Document, TextPreprocessor
+
+
+# Everything a prediction needs, swapped as one immutable reference so readers
+# never see a model paired with another version's vectorizer
+ModelState = namedtuple('ModelState', ['model', 'vectorizer', 'compiled_model', 'version'])
 
 
 class FakeNewsDetector:
     """Detects fake news using NLP and ML techniques"""
     
+    CLASSES = np.array([0, 1])  # 0 = fake, 1 = real
+    
     def __init__(self):
-        self.model = None
-        self.vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
+        self._state = ModelState(None, self._build_vectorizer(), None, None)
         self.preprocessor = TextPreprocessor()
-        self.model_path = "models/fake_news_detector.pkl"
+        self.model_path = "models/fake_news_detector"
+        self.legacy_model_path = "models/fake_news_detector.pkl"
+        self.batch_size = PREDICT_BATCH_SIZE
+        self.compile_forest = COMPILE_FOREST
+        self.cache = LRUCache(PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL)
+        self.update_history = []
+    
+    @property
+    def model(self):
+        return self._state.model
+    
+    @property
+    def vectorizer(self):
+        return self._state.vectorizer
+    
+    @property
+    def compiled_model(self):
+        return self._state.compiled_model
+    
+    @property
+    def model_version(self):
+        return self._state.version
+    
+    @staticmethod
+    def _build_vectorizer(**params):
+        params = {'max_features': 5000, 'stop_words': 'english', **params}
+        return TfidfVectorizer(**params)
+    
+    @staticmethod
+    def _build_forest(**params):
+        params = {'n_estimators': 100, 'random_state': 42, 'n_jobs': -1, **params}
+        return RandomForestClassifier(**params)
+    
+    def _clean(self, text):
+        """Cleaned text, reusing a Document's cached cleaning"""
+        if isinstance(text, Document):
+            return text.cleaned
+        return self.preprocessor.clean_text(text)
+    
+    def _clean_batch(self, texts):
+        """Clean a list of texts or Documents"""
+        texts = list(texts)
+        if any(isinstance(text, Document) for text in texts):
+            return [self._clean(text) for text in texts]
+        return self.preprocessor.clean_texts(texts)
     
-    def train(self, texts, labels):
+    @staticmethod
+    def _is_compact(vectorizer):
+        return np.dtype(getattr(vectorizer, 'dtype', np.float64)) == np.float32
+    
+    def train(self, texts, labels, compact_features=None, vectorizer_params=None, forest_params=None):
         """
         Train the fake news detection model
         
         Args:
             texts: List of text samples
             labels: List of labels (0 = fake, 1 = real)
+            vectorizer_params: TfidfVectorizer overrides (e.g. from tuning)
+            forest_params: RandomForestClassifier overrides (e.g. from tuning)
+            compact_features: Train in compact mode, keeping only this many
+                of the terms the forest found most important (see below)
+        
+        Compact mode fits a first forest on the full vocabulary, prunes the
+        vocabulary to the compact_features most important terms, then refits
+        the vectorizer (emitting float32) and forest on that pruned space.
+        Feature matrices, vocabulary and the packed forest (float32
+        thresholds/values) all shrink, at some cost in accuracy. If the
+        first forest never splits, the whole vocabulary is kept.
         """
         # Preprocess texts
-        cleaned_texts = [self.preprocessor.clean_text(text) for text in texts]
+        cleaned_texts = self._clean_batch(texts)
         
         # Vectorize texts
-        X = self.vectorizer.fit_transform(cleaned_texts)
+        vectorizer_params = vectorizer_params or {}
+        vectorizer = self._build_vectorizer(**vectorizer_params)
+        X = vectorizer.fit_transform(cleaned_texts)
         y = np.array(labels)
         
         # Train Random Forest classifier
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-        self.model.fit(X, y)
+        model = self._build_forest(**(forest_params or {}))
+        model.fit(X, y)
+        
+        if compact_features:
+            terms = np.array(sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get))
+            ranked = np.argsort(-model.feature_importances_, kind='stable')
+            ranked = ranked[model.feature_importances_[ranked] > 0][:compact_features]
+            if not ranked.size:
+                # The forest never split (degenerate data), so nothing ranks; keep every term
+                ranked = np.arange(len(terms))
+            
+            vectorizer = self._build_vectorizer(**{
+                **vectorizer_params, 'vocabulary': terms[np.sort(ranked)].tolist(), 'dtype': np.float32
+            })
+            X = vectorizer.fit_transform(cleaned_texts)
+            model = self._build_forest(**(forest_params or {}))
+            model.fit(X, y)
+        
+        self._set_model(model, vectorizer)
+        self.update_history = []
+        return self
+    
+    def train_streaming(self, samples, batch_size=None, n_features=None):
+        """
+        Train out-of-core from a stream of labeled samples
+        
+        Uses a stateless hashing featurizer and an incrementally trained
+        linear classifier, so memory depends on batch_size and n_features
+        but not on the size of the corpus.
+        
+        Args:
+            samples: Iterable of (text, label) pairs (0 = fake, 1 = real)
+            batch_size: Samples per partial_fit call (defaults to TRAIN_BATCH_SIZE)
+            n_features: Hashing featurizer width (defaults to STREAMING_HASH_FEATURES)
+        """
+        batch_size = batch_size or TRAIN_BATCH_SIZE
+        vectorizer = HashingVectorizer(
+            n_features=n_features or STREAMING_HASH_FEATURES,
+            stop_words='english',
+            alternate_sign=False
+        )
+        model = SGDClassifier(loss='log_loss', random_state=42)
+        
+        samples = iter(samples)
+        seen = 0
+        while True:
+            chunk = list(islice(samples, batch_size))
+            if not chunk:
+                break
+            
+            texts, labels = zip(*chunk)
+            X = vectorizer.transform(self._clean_batch(texts))
+            model.partial_fit(X, np.array(labels), classes=self.CLASSES)
+            seen += len(chunk)
+        
+        if not seen:
+            raise ValueError('No training samples provided')
+        
+        self._set_model(model, vectorizer)
+        self.update_history = []
+        return self
+    
+    def update(self, texts, labels, n_new_trees=None, max_trees=None,
+               eval_texts=None, eval_labels=None):
+        """
+        Incrementally update the trained model with a new labeled batch
+        
+        The vectorizer vocabulary is kept as-is (unseen words are ignored).
+        Forests grow by n_new_trees trees fitted on the new batch only (warm
+        start), optionally retiring the oldest trees beyond max_trees; models
+        from train_streaming continue with partial_fit, also after a round
+        trip through a mapped artifact. The updated model is swapped in
+        atomically.
+        
+        Args:
+            texts: New text samples
+            labels: New labels (0 = fake, 1 = real)
+            n_new_trees: Trees to add (defaults to UPDATE_NEW_TREES; 0 only retires trees)
+            max_trees: Keep at most this many of the newest trees
+            eval_texts, eval_labels: Optional held-out set scored after the update
+            
+        Returns:
+            Report dictionary, also appended to update_history
+        """
+        state = self._state
+        if state.model is None:
+            raise ValueError('Model not trained yet')
+        
+        labels = np.asarray(labels)
+        if not set(labels.tolist()) >= set(state.model.classes_.tolist()):
+            raise ValueError('Update batch must contain every class the model was trained on')
+        if n_new_trees is None:
+            n_new_trees = UPDATE_NEW_TREES
+        
+        start = time.perf_counter()
+        X = state.vectorizer.transform(self._clean_batch(texts))
+        model = state.model
+        trees_before = self._tree_count(model)
+        
+        if isinstance(model, RandomForestClassifier):
+            # Grow a shallow copy so the live forest's tree list is never mutated
+            model = copy.copy(model)
+            model.estimators_ = list(model.estimators_)
+            model.set_params(warm_start=True, n_estimators=len(model.estimators_) + n_new_trees)
+            if n_new_trees:
+                model.fit(X, labels)
+            if max_trees and len(model.estimators_) > max_trees:
+                model.estimators_ = model.estimators_[-max_trees:]
+                model.n_estimators = max_trees
+        elif isinstance(model, PackedForest):
+            if n_new_trees:
+                # Grow the new trees with the hyperparameters the forest was trained with
+                params = {**(model.params or {}), 'n_estimators': n_new_trees, 'warm_start': False}
+                fresh = self._build_forest(**params)
+                fresh.fit(X, labels)
+                fresh = PackedForest.from_estimator(fresh, compact=model.is_compact)
+                model = PackedForest.concatenate([model, fresh])
+            if max_trees:
+                model = model.newest(max_trees)
+        elif isinstance(model, (SGDClassifier, PackedLinear)):
+            model = model.to_estimator() if isinstance(model, PackedLinear) else copy.deepcopy(model)
+            model.partial_fit(X, labels)
+            n_new_trees = 0
+        else:
+            raise ValueError(f'{type(model).__name__} models cannot be updated incrementally')
+        
+        self._set_model(model, state.vectorizer)
+        n_trees = self._tree_count(model)
+        
+        report = {
+            'model_version': self.model_version,
+            'samples': len(labels),
+            'trees_added': n_new_trees,
+            'trees_retired': trees_before + n_new_trees - n_trees,
+            'n_trees': n_trees,
+            'train_time': time.perf_counter() - start,
+            'accuracy': None
+        }
+        if eval_texts is not None:
+            report['accuracy'] = self.evaluate(eval_texts, eval_labels)
+        self.update_history.append(report)
+        return report
+    
+    @staticmethod
+    def _tree_count(model):
+        if isinstance(model, PackedForest):
+            return model.n_trees
+        return len(getattr(model, 'estimators_', []))
+    
+    def evaluate(self, texts, labels):
+        """Return the accuracy of the current model on a labeled set"""
+        state = self._state
+        if state.model is None:
+            raise ValueError('Model not trained yet')
+        
+        X = state.vectorizer.transform(self._clean_batch(texts))
+        predicted = state.model.classes_.take(state.model.predict_proba(X).argmax(axis=1))
+        return float(np.mean(predicted == np.asarray(labels)))
+    
+    def compile_model(self):
+        """
+        Compile the trained forest into packed node arrays
         
+        Single-document predictions then use the vectorized PackedForest
+        evaluator instead of RandomForestClassifier.predict_proba, avoiding
+        sklearn's validation and joblib dispatch overhead. Probabilities
+        are identical.
+        """
+        state = self._state
+        self._state = state._replace(compiled_model=self._compile(state.model, state.vectorizer))
         return self
     
+    @staticmethod
+    def _compile(model, vectorizer):
+        if isinstance(model, PackedForest):
+            return model
+        if isinstance(model, RandomForestClassifier):
+            return PackedForest.from_estimator(model, compact=FakeNewsDetector._is_compact(vectorizer))
+        return None
+    
+    def _set_model(self, model, vectorizer, version=None):
+        """
+        Install a trained model and vectorizer pair
+        
+        The new state is built completely before a single reference
+        assignment publishes it; predictions already running keep the
+        state they started with.
+        """
+        # Mapped forests are already packed, so compiling them is free
+        compiled = None
+        if self.compile_forest or isinstance(model, PackedForest):
+            compiled = self._compile(model, vectorizer)
+        
+        self._state = ModelState(model, vectorizer, compiled, version or uuid.uuid4().hex[:12])
+        self.cache.clear()
+    
+    @staticmethod
+    def _cache_key(state, cleaned_text):
+        """Cache key for a cleaned text under a model version"""
+        digest = hashlib.blake2b(cleaned_text.encode('utf-8'), digest_size=16).digest()
+        return (state.version, digest)
+    
     def predict(self, text):
         """
         Predict if text is fake or real news
@@ -50,45 +327,138 @@ class FakeNewsDetector:
         Returns:
             Dictionary with prediction and confidence
         """
-        if self.model is None:
+        state = self._state
+        if state.model is None:
             return {'error': 'Model not trained yet'}
         
-        cleaned_text = self.preprocessor.clean_text(text)
-        X = self.vectorizer.transform([cleaned_text])
+        cleaned_text = self._clean(text)
+        key = self._cache_key(state, cleaned_text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return dict(cached)
         
-        prediction = self.model.predict(X)[0]
-        confidence = max(self.model.predict_proba(X)[0])
+        X = state.vectorizer.transform([cleaned_text])
         
-        return {
-            'prediction': 'real' if prediction == 1 else 'fake',
-            'confidence': float(confidence),
-            'label': int(prediction)
-        }
+        scorer = state.compiled_model or state.model
+        result = self._results_from_proba(state, scorer.predict_proba(X))[0]
+        self.cache.set(key, result)
+        return dict(result)
+    
+    def predict_batch(self, texts, batch_size=None):
+        """
+        Make predictions for multiple texts
+        
+        Texts are cleaned, vectorized and scored one chunk at a time, with a
+        single predict_proba call per chunk.
+        
+        Args:
+            texts: Iterable of input texts
+            batch_size: Rows per chunk (defaults to PREDICT_BATCH_SIZE)
+            
+        Returns:
+            List of prediction dictionaries, in input order
+        """
+        return list(self.iter_predict_batch(texts, batch_size))
     
-    def predict_batch(self, texts):
-        """Make predictions for multiple texts"""
-        results = []
-        for text in texts:
-            results.append(self.predict(text))
-        return results
+    def iter_predict_batch(self, texts, batch_size=None):
+        """Yield predictions for an iterable of texts, chunk by chunk"""
+        batch_size = batch_size or self.batch_size
+        state = self._state
+        texts = iter(texts)
+        
+        while True:
+            chunk = list(islice(texts, batch_size))
+            if not chunk:
+                return
+            
+            if state.model is None:
+                yield from ({'error': 'Model not trained yet'} for _ in chunk)
+                continue
+            
+            cleaned_texts = self._clean_batch(chunk)
+            keys = [self._cache_key(state, cleaned) for cleaned in cleaned_texts]
+            results = [self.cache.get(key) for key in keys]
+            misses = [i for i, result in enumerate(results) if result is None]
+            
+            if misses:
+                X = state.vectorizer.transform([cleaned_texts[i] for i in misses])
+                scored = self._results_from_proba(state, state.model.predict_proba(X))
+                for i, result in zip(misses, scored):
+                    self.cache.set(keys[i], result)
+                    results[i] = result
+            
+            yield from (dict(result) for result in results)
     
-    def save_model(self, path=None):
-        """Save trained model to disk"""
+    @staticmethod
+    def _results_from_proba(state, proba):
+        """Build prediction dictionaries from a predict_proba matrix"""
+        # Same argmax/classes_ lookup that model.predict performs internally
+        best = proba.argmax(axis=1)
+        labels = state.model.classes_.take(best)
+        confidences = proba[np.arange(len(best)), best]
+        
+        return [
+            {
+                'prediction': 'real' if label == 1 else 'fake',
+                'confidence': float(confidence),
+                'label': int(label),
+                'model_version': state.version
+            }
+            for label, confidence in zip(labels, confidences)
+        ]
+    
+    def save_model(self, path=None, version=None):
+        """
+        Save trained model to disk
+        
+        Paths ending in .pkl are written as a pickle; any other path is
+        written as a memory-mappable artifact directory.
+        
+        Args:
+            path: Destination (defaults to model_path)
+            version: Version label stored with the model (defaults to model_version)
+        """
         path = path or self.model_path
+        state = self._state
+        version = version or state.version
+        if not path.endswith('.pkl'):
+            save_artifact(path, state.model, state.vectorizer, version,
+                          compact=self._is_compact(state.vectorizer))
+            return
+        
         os.makedirs(os.path.dirname(path), exist_ok=True)
         with open(path, 'wb') as f:
             pickle.dump({
-                'model': self.model,
-                'vectorizer': self.vectorizer
+                'model': state.model,
+                'vectorizer': state.vectorizer,
+                'version': version
             }, f)
     
-    def load_model(self, path=None):
-        """Load trained model from disk"""
-        path = path or self.model_path
-        if os.path.exists(path):
-            with open(path, 'rb') as f:
-                data = pickle.load(f)
-                self.model = data['model']
-                self.vectorizer = data['vectorizer']
-            return True
+    def load_model(self, path=None, version=None):
+        """
+        Load trained model from disk
+        
+        Mapped artifact directories are opened read-only with shared memory
+        maps; pickle files (including the legacy default path) are unpickled.
+        The new model replaces the current one atomically.
+        
+        Args:
+            path: Artifact directory or pickle file (defaults to model_path)
+            version: Version label overriding the one stored with the model
+        """
+        if path is None:
+            candidates = [self.model_path, self.legacy_model_path]
+        else:
+            candidates = [path]
+        
+        for path in candidates:
+            if is_mapped_artifact(path):
+                model, vectorizer, stored_version = load_artifact(path)
+                self._set_model(model, vectorizer, version or stored_version)
+                return True
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    data = pickle.load(f)
+                self._set_model(data['model'], data['vectorizer'], version or data.get('version'))
+                return True
         return False
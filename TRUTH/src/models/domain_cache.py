@@ -0,0 +1,154 @@
+"""Per-domain cache of source credibility results"""
+
+import copy
+import json
+import time
+from collections import Counter
+
+from src.config import (
+    CREDIBILITY_CACHE_DB, CREDIBILITY_CACHE_SIZE, CREDIBILITY_CACHE_TTL, CREDIBILITY_FAILURE_TTL,
+    CREDIBILITY_TIMEOUT_TTL
+)
+from src.utils.cache import LRUCache
+from src.utils.db import ConnectionPool
+
+# Disk writes between removals of expired and excess rows
+PRUNE_EVERY = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS domain_results (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS domain_results_created ON domain_results (created_at);
+"""
+
+
+class DomainCache:
+    """
+    Credibility results by domain, with a TTL per kind of outcome
+
+    Results of successful checks ('ok') are kept for ttl seconds; checks
+    that failed ('failure') or timed out ('timeout') are cached too, for
+    their own shorter TTLs, so an unreachable site is not probed on every
+    request but is retried soon. Entries live in a bounded in-memory LRU
+    cache and, when path is set, in a SQLite file that survives restarts
+    and is shared by every worker process: a memory miss falls back to the
+    file and copies the entry into memory for its remaining lifetime.
+    """
+
+    def __init__(self, maxsize=CREDIBILITY_CACHE_SIZE, ttl=CREDIBILITY_CACHE_TTL,
+                 failure_ttl=CREDIBILITY_FAILURE_TTL, timeout_ttl=CREDIBILITY_TIMEOUT_TTL,
+                 path=CREDIBILITY_CACHE_DB, clock=time.time):
+        """
+        Args:
+            maxsize: Entries kept in memory, and in the file (0 disables caching)
+            ttl: Seconds to keep 'ok' results
+            failure_ttl: Seconds to keep 'failure' results
+            timeout_ttl: Seconds to keep 'timeout' results
+            path: SQLite file backing the cache (None or '' for memory only)
+            clock: Wall-clock time source, shared by processes using the file
+        """
+        self.ttls = {'ok': ttl, 'failure': failure_ttl, 'timeout': timeout_ttl}
+        self.memory = LRUCache(maxsize, clock=clock)
+        self.path = path or None
+        self._clock = clock
+        self.disk_hits = 0
+        self.stored = Counter()
+        self._writes = 0
+        self.pool = None
+        if self.path and maxsize > 0:
+            self.pool = ConnectionPool(self.path, size=2)
+            with self.pool.connection() as connection:
+                connection.executescript(SCHEMA)
+
+    def get(self, key):
+        """Return a copy of the cached result for key, or None"""
+        result = self.memory.get(key)
+        if result is None and self.pool is not None:
+            result = self._load(key)
+        return copy.deepcopy(result)
+
+    def _load(self, key):
+        now = self._clock()
+        with self.pool.connection() as connection:
+            row = connection.execute(
+                'SELECT result, created_at, expires_at FROM domain_results WHERE key = ? AND expires_at > ?',
+                (key, now)
+            ).fetchone()
+        if row is None:
+            return None
+        result, created_at, expires_at = row
+        result = json.loads(result)
+        self.disk_hits += 1
+        self.memory.set(key, result, ttl=expires_at - now, age=max(now - created_at, 0.0))
+        return result
+
+    def set(self, key, result, outcome='ok'):
+        """
+        Cache result under key
+
+        Args:
+            key: Cache key (see SourceCredibilityAnalyzer.cache_key)
+            result: JSON-serializable result dict
+            outcome: 'ok', 'failure' or 'timeout', selecting the TTL
+        """
+        ttl = self.ttls[outcome]
+        if not ttl or self.memory.maxsize <= 0:
+            return
+        result = copy.deepcopy(result)
+        self.memory.set(key, result, ttl=ttl)
+        self.stored[outcome] += 1
+        if self.pool is None:
+            return
+
+        now = self._clock()
+        with self.pool.connection() as connection, connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO domain_results VALUES (?, ?, ?, ?, ?)',
+                (key, json.dumps(result), outcome, now, now + ttl)
+            )
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                self._prune(connection, now)
+
+    def _prune(self, connection, now):
+        """Drop expired rows, then the oldest rows beyond maxsize"""
+        connection.execute('DELETE FROM domain_results WHERE expires_at <= ?', (now,))
+        connection.execute(
+            'DELETE FROM domain_results WHERE key IN '
+            '(SELECT key FROM domain_results ORDER BY created_at DESC LIMIT -1 OFFSET ?)',
+            (self.memory.maxsize,)
+        )
+
+    def clear(self):
+        """Drop all entries, in memory and on disk (counters are kept)"""
+        self.memory.clear()
+        if self.pool is not None:
+            with self.pool.connection() as connection, connection:
+                connection.execute('DELETE FROM domain_results')
+
+    def stats(self):
+        """
+        Return hit rates, sizes and entry ages
+
+        hit_rate counts lookups answered from memory or disk; memory_hit_rate
+        only those answered from this process's memory.
+        """
+        stats = self.memory.stats()
+        lookups = stats['hits'] + stats['misses']
+        stats['memory_hit_rate'] = stats['hit_rate']
+        stats['hit_rate'] = (stats['hits'] + self.disk_hits) / lookups if lookups else 0.0
+        stats['ttl'] = dict(self.ttls)
+        stats['stored'] = dict(self.stored)
+        stats['disk_hits'] = self.disk_hits
+        stats['disk_path'] = self.path
+        if self.pool is not None:
+            with self.pool.connection() as connection:
+                stats['disk_entries'] = connection.execute(
+                    'SELECT count(*) FROM domain_results WHERE expires_at > ?', (self._clock(),)
+                ).fetchone()[0]
+        return stats
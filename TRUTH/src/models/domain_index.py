@@ -0,0 +1,431 @@
+"""Compact domain reputation index with public-suffix-aware parent lookup
+
+Build an index file from a blocklist or reputation list with:
+
+    python -m src.models.domain_index <domains.txt|.csv> [output] [default_score]
+
+Input lines are "domain", "domain,score", "domain score", rank-first
+entries ("1,domain", as in Tranco) or hosts-file entries ("0.0.0.0 domain
+[alias ...]"); '#' starts a comment. Other lines, such as a CSV header,
+are skipped.
+"""
+
+import hashlib
+import io
+import ipaddress
+import json
+import math
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+from src.config import DOMAIN_REPUTATION_PATH, PUBLIC_SUFFIX_LIST
+
+MAGIC = b'TRUTHDI1'
+
+# Scores are stored as integers in units of 1/SCORE_SCALE
+SCORE_SCALE = 10000
+
+# Entries hashed per block while building
+BUILD_CHUNK = 1000000
+
+# Longest domain name in bytes (RFC 1035); longer entries are skipped
+MAX_DOMAIN_LENGTH = 253
+
+HOSTS_ADDRESSES = frozenset(['0.0.0.0', '127.0.0.1', '::', '::1'])
+
+# Multi-label public suffixes used when no public suffix list file is configured.
+# Single-label TLDs need no entry: the list's default rule makes every TLD a suffix.
+DEFAULT_PUBLIC_SUFFIXES = (
+    'co.uk', 'org.uk', 'ac.uk', 'gov.uk', 'me.uk', 'net.uk', 'ltd.uk', 'plc.uk', 'sch.uk', 'nhs.uk', 'police.uk',
+    'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au', 'asn.au', 'id.au',
+    'co.nz', 'net.nz', 'org.nz', 'ac.nz', 'govt.nz',
+    'co.za', 'org.za', 'net.za', 'gov.za', 'ac.za',
+    'co.jp', 'ne.jp', 'or.jp', 'ac.jp', 'go.jp',
+    'co.in', 'net.in', 'org.in', 'gov.in', 'ac.in',
+    'com.br', 'net.br', 'org.br', 'gov.br',
+    'com.cn', 'net.cn', 'org.cn', 'gov.cn',
+    'com.mx', 'org.mx', 'gob.mx', 'com.ar', 'com.tr', 'co.kr', 'or.kr',
+    'com.sg', 'com.hk', 'com.tw', 'co.il', 'com.ng', 'co.ke',
+    'blogspot.com', 'github.io', 'herokuapp.com', 'appspot.com', 'netlify.app', 'pages.dev',
+    'azurewebsites.net', 'cloudfront.net'
+)
+
+
+def normalize_domain(domain):
+    """Lowercase a host name and drop a port, a trailing dot and a leading 'www.'"""
+    domain = domain.strip().lower()
+    if domain.startswith('['):
+        domain = domain[1:].split(']', 1)[0]
+    elif domain.count(':') == 1:
+        domain = domain.split(':', 1)[0]
+    domain = domain.rstrip('.')
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    return domain
+
+
+def domain_hash(domain):
+    """Stable 64-bit hash of a normalized domain"""
+    return int.from_bytes(hashlib.blake2b(domain.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _is_ip(domain):
+    if not (domain[-1].isdigit() or ':' in domain):
+        return False
+    try:
+        ipaddress.ip_address(domain)
+        return True
+    except ValueError:
+        return False
+
+
+def _number(field):
+    """field as a finite float, or None"""
+    try:
+        value = float(field)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+class PublicSuffixList:
+    """
+    Public suffix rules (publicsuffix.org format): plain, wildcard and exception rules
+
+    Decides where a domain's registrable part starts, so that an entry for
+    example.co.uk covers news.example.co.uk while nothing can be listed
+    for all of co.uk or blogspot.com at once.
+    """
+
+    def __init__(self, rules=DEFAULT_PUBLIC_SUFFIXES):
+        self._rules = set()
+        self._wildcards = set()
+        self._exceptions = set()
+        for rule in rules:
+            rule = rule.strip().lower()
+            if not rule or rule.startswith('//'):
+                continue
+            rule = rule.split()[0]
+            if rule.startswith('!'):
+                self._exceptions.add(rule[1:])
+            elif rule.startswith('*.'):
+                self._wildcards.add(rule[2:])
+            else:
+                self._rules.add(rule)
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a public_suffix_list.dat file"""
+        with open(path, encoding='utf-8') as f:
+            return cls(f)
+
+    def suffix_labels(self, labels):
+        """Number of trailing labels that form the public suffix"""
+        for i in range(len(labels)):
+            suffix = '.'.join(labels[i:])
+            if suffix in self._exceptions:
+                return len(labels) - i - 1
+            if suffix in self._rules or (i + 1 < len(labels) and '.'.join(labels[i + 1:]) in self._wildcards):
+                return len(labels) - i
+        return 1  # default rule "*": the TLD is a public suffix
+
+    def parents(self, domain):
+        """
+        The domain and its parents down to the registrable domain, most specific first
+
+        A public suffix itself or an IP address only yields itself.
+        """
+        if not domain:
+            return []
+        labels = domain.split('.')
+        if len(labels) == 1 or _is_ip(domain):
+            return [domain]
+        registrable = self.suffix_labels(labels) + 1
+        if registrable > len(labels):
+            return [domain]
+        return ['.'.join(labels[i:]) for i in range(len(labels) - registrable + 1)]
+
+
+_default_suffixes = None
+
+
+def default_public_suffixes():
+    """PublicSuffixList from PUBLIC_SUFFIX_LIST, or the built-in rules"""
+    global _default_suffixes
+    if _default_suffixes is None:
+        _default_suffixes = (PublicSuffixList.from_file(PUBLIC_SUFFIX_LIST) if PUBLIC_SUFFIX_LIST
+                             else PublicSuffixList())
+    return _default_suffixes
+
+
+def read_domain_list(path, default_score=0.1):
+    """
+    Read a blocklist or reputation list (see the module docstring)
+
+    Every name on a hosts-file line is listed with default_score; ranks
+    and fields that are not scores are ignored. Names longer than
+    MAX_DOMAIN_LENGTH are left out of indexes built from it.
+
+    Yields:
+        (domain, score) pairs
+    """
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            fields = line.split('#', 1)[0].replace(',', ' ').split()
+            if not fields:
+                continue
+            if fields[0] in HOSTS_ADDRESSES:
+                yield from ((domain, default_score) for domain in fields[1:])
+            elif len(fields) == 1:
+                yield fields[0], default_score
+            elif _number(fields[1]) is not None:
+                yield fields[0], float(fields[1])
+            elif _number(fields[0]) is not None:
+                yield fields[1], default_score  # rank-first list
+
+
+class DomainIndex:
+    """
+    Domain -> score index over a sorted array of 64-bit domain hashes
+
+    Entries are four parallel arrays sorted by hash (hash, score, and the
+    offset and length of the domain in a byte blob used to confirm a hash
+    match), so an index costs 19 bytes per domain plus the domain
+    text and can be memory-mapped from a prebuilt file: workers share the
+    page cache and load in constant time. A lookup hashes the domain and
+    its parents down to the registrable domain (per the public suffix
+    list) and finds them with one binary search; the most specific listed
+    one wins, so an entry for cnn.com covers edition.cnn.com.
+    """
+
+    def __init__(self, hashes, scores, starts, lengths, blob, suffixes=None):
+        self._hashes = hashes
+        self._scores = scores
+        self._starts = starts
+        self._lengths = lengths
+        self._blob = blob
+        self.suffixes = suffixes or default_public_suffixes()
+
+    def __len__(self):
+        return len(self._hashes)
+
+    @classmethod
+    def from_entries(cls, entries, suffixes=None):
+        """Build an in-memory index from (domain, score) pairs; later duplicates win"""
+        blob = io.BytesIO()
+        arrays = _collect(entries, blob)
+        return cls(*arrays, np.frombuffer(blob.getvalue(), dtype=np.uint8), suffixes)
+
+    @staticmethod
+    def build(entries, path):
+        """
+        Write an index file from (domain, score) pairs; later duplicates win
+
+        Returns:
+            Number of distinct domains indexed
+        """
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.TemporaryFile(dir=directory) as blob:
+            hashes, scores, starts, lengths = _collect(entries, blob)
+            blob_size = blob.tell()
+
+            sections, offset = {}, 0
+            for name, array in (('hashes', hashes), ('scores', scores), ('starts', starts), ('lengths', lengths)):
+                sections[name] = [offset, array.dtype.str, len(array)]
+                offset += _aligned(array.nbytes)
+            sections['blob'] = [offset, '|u1', blob_size]
+            header = json.dumps({'count': len(hashes), 'sections': sections}).encode('utf-8')
+            data_start = _aligned(len(MAGIC) + 4 + len(header))
+
+            staging = f'{path}.{os.getpid()}.tmp'
+            with open(staging, 'wb') as f:
+                f.write(MAGIC + len(header).to_bytes(4, 'little') + header)
+                for array in (hashes, scores, starts, lengths):
+                    f.write(b'\0' * (_aligned(f.tell()) - f.tell()))
+                    f.write(array.tobytes())
+                f.write(b'\0' * (data_start + sections['blob'][0] - f.tell()))
+                blob.seek(0)
+                shutil.copyfileobj(blob, f, 1 << 20)
+            os.replace(staging, path)
+        return len(hashes)
+
+    @classmethod
+    def load(cls, path, suffixes=None):
+        """Memory-map an index file written by build()"""
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a domain index file: {path}")
+            header_size = int.from_bytes(f.read(4), 'little')
+            header = json.loads(f.read(header_size))
+        data_start = _aligned(len(MAGIC) + 4 + header_size)
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Plain arrays over the mapping: element access on np.memmap is several times slower
+        arrays = [
+            np.frombuffer(mapped, dtype=dtype, count=count, offset=data_start + offset)
+            for offset, dtype, count in (header['sections'][name]
+                                         for name in ('hashes', 'scores', 'starts', 'lengths', 'blob'))
+        ]
+        return cls(*arrays, suffixes)
+
+    def _domain_at(self, position):
+        start = int(self._starts[position])
+        return bytes(self._blob[start:start + int(self._lengths[position])]).decode('utf-8')
+
+    def _find(self, domain, key, position):
+        """Score of domain given the search position of its hash, or None"""
+        hashes = self._hashes
+        while position < len(hashes) and hashes[position] == key:
+            if self._domain_at(position) == domain:
+                return int(self._scores[position]) / SCORE_SCALE
+            position += 1
+        return None
+
+    def get(self, domain):
+        """Score listed for exactly this domain, or None"""
+        domain = normalize_domain(domain)
+        key = domain_hash(domain)
+        return self._find(domain, key, int(self._hashes.searchsorted(np.uint64(key))))
+
+    def lookup(self, domain):
+        """
+        Most specific listed entry covering domain
+
+        Args:
+            domain: Host name (a port and leading 'www.' are ignored)
+
+        Returns:
+            (listed domain, score), or None if neither the domain nor a
+            parent above its public suffix is listed
+        """
+        candidates = self.suffixes.parents(normalize_domain(domain))
+        if not candidates or not len(self._hashes):
+            return None
+        keys = [domain_hash(candidate) for candidate in candidates]
+        positions = self._hashes.searchsorted(np.array(keys, dtype=np.uint64)).tolist()
+        for candidate, key, position in zip(candidates, keys, positions):
+            score = self._find(candidate, key, position)
+            if score is not None:
+                return candidate, score
+        return None
+
+    def lookup_many(self, domains):
+        """lookup() for many domains, with one binary search for all of them"""
+        candidates = [self.suffixes.parents(normalize_domain(domain)) if domain else [] for domain in domains]
+        flat = [candidate for parents in candidates for candidate in parents]
+        if not flat or not len(self._hashes):
+            return [None] * len(domains)
+        keys = [domain_hash(candidate) for candidate in flat]
+        positions = self._hashes.searchsorted(np.array(keys, dtype=np.uint64)).tolist()
+
+        matches, i = [], 0
+        for parents in candidates:
+            match = None
+            for candidate in parents:
+                if match is None:
+                    score = self._find(candidate, keys[i], positions[i])
+                    if score is not None:
+                        match = (candidate, score)
+                i += 1
+            matches.append(match)
+        return matches
+
+    def score(self, domain):
+        """Score of the most specific entry covering domain, or None"""
+        match = self.lookup(domain)
+        return match[1] if match else None
+
+    def memory_usage(self):
+        """Bytes of index data (mapped, not necessarily resident, for a loaded file)"""
+        return sum(array.nbytes for array in (self._hashes, self._scores, self._starts, self._lengths, self._blob))
+
+
+def _aligned(offset, alignment=8):
+    return -(-offset // alignment) * alignment
+
+
+def _collect(entries, blob):
+    """
+    Hash entries into sorted arrays, writing domain text to blob
+
+    Returns:
+        (hashes, scores, starts, lengths) sorted by hash, duplicates removed
+    """
+    hashes, scores, lengths = [], [], []
+    chunk = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) == BUILD_CHUNK:
+            _collect_chunk(chunk, blob, hashes, scores, lengths)
+            chunk = []
+    _collect_chunk(chunk, blob, hashes, scores, lengths)
+
+    hashes = np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint64)
+    scores = np.concatenate(scores) if scores else np.empty(0, dtype=np.uint16)
+    lengths = np.concatenate(lengths) if lengths else np.empty(0, dtype=np.uint8)
+    starts = np.zeros(len(lengths), dtype=np.uint64)
+    np.cumsum(lengths[:-1], out=starts[1:], dtype=np.uint64)
+
+    order = np.argsort(hashes, kind='stable')
+    hashes, scores, starts, lengths = hashes[order], scores[order], starts[order], lengths[order]
+
+    # Equal hashes are duplicates (or, very rarely, collisions): keep the last of each domain
+    same = np.flatnonzero(hashes[1:] == hashes[:-1])
+    if len(same):
+        blob.seek(0)
+        text = blob.read() if hasattr(blob, 'read') else blob.getvalue()
+        blob.seek(0, os.SEEK_END)
+        keep = np.ones(len(hashes), dtype=bool)
+        run_starts = same[np.r_[True, np.diff(same) > 1]]
+        for first in run_starts.tolist():
+            last = first
+            while last + 1 < len(hashes) and hashes[last + 1] == hashes[first]:
+                last += 1
+            latest = {}
+            for position in range(first, last + 1):
+                start = int(starts[position])
+                latest[text[start:start + int(lengths[position])]] = position
+            keep[first:last + 1] = False
+            keep[list(latest.values())] = True
+        hashes, scores, starts, lengths = hashes[keep], scores[keep], starts[keep], lengths[keep]
+    return hashes, scores, starts, lengths
+
+
+def _collect_chunk(chunk, blob, hashes, scores, lengths):
+    # Longer names are not valid domains, and their lengths would not fit the uint8 length array
+    chunk = [(domain, score) for domain, score in
+             ((normalize_domain(domain).encode('utf-8'), score) for domain, score in chunk)
+             if len(domain) <= MAX_DOMAIN_LENGTH]
+    domains = [domain for domain, _ in chunk]
+    blob.write(b''.join(domains))
+    hashes.append(np.fromiter(
+        (int.from_bytes(hashlib.blake2b(domain, digest_size=8).digest(), 'little') for domain in domains),
+        dtype=np.uint64, count=len(domains)
+    ))
+    scores.append(np.fromiter(
+        (round(min(max(score, 0.0), 1.0) * SCORE_SCALE) for _, score in chunk), dtype=np.uint16, count=len(chunk)
+    ))
+    lengths.append(np.fromiter((len(domain) for domain in domains), dtype=np.uint8, count=len(domains)))
+
+
+def load_reputation_index(path=DOMAIN_REPUTATION_PATH):
+    """The DomainIndex at path, or None if no file is configured or it does not exist"""
+    if not path or not os.path.exists(path):
+        return None
+    return DomainIndex.load(path)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: python -m src.models.domain_index <domains.txt|.csv> [output] [default_score]')
+        sys.exit(1)
+    output = sys.argv[2] if len(sys.argv) > 2 else DOMAIN_REPUTATION_PATH
+    default_score = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    count = DomainIndex.build(read_domain_list(sys.argv[1], default_score), output)
+    print(f"Indexed {count} domains in {output}")
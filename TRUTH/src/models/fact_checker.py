@@ -2,14 +2,116 @@
 
 import requests
 from datetime import datetime
-from src.config import FACT_CHECK_THRESHOLD
+from src.config import (
+    CLAIM_MATCHER, CLAIM_SIMILARITY_THRESHOLD, DATABASE_URL, FACT_CHECK_STORE, FACT_CHECK_THRESHOLD
+)
+from src.models.claim_index import MATCH_RATIO, ClaimIndex, FactCheckDB, claim_keywords
+from src.models.claim_matrix import ClaimMatrix
+from src.models.claim_similarity import MinHashIndex
+from src.models.fact_store import SQLiteFactStore
+from src.utils.text_processor import Document
+
+# Batches of at least this many claims are verified with ClaimMatrix; smaller
+# ones are faster one claim at a time (verdicts are the same either way)
+MATRIX_MIN_CLAIMS = 64
 
 
 class FactChecker:
     """Performs real-time fact-checking on claims"""
     
-    def __init__(self):
-        self.fact_check_db = self._initialize_fact_db()
+    def __init__(self, store=None):
+        """
+        Args:
+            store: Fact-check backend: 'memory' (a dict of the sample
+                fact-checks), 'sqlite' (a SQLiteFactStore at DATABASE_URL,
+                seeded with the sample when empty) or a SQLiteFactStore;
+                defaults to FACT_CHECK_STORE
+        """
+        if store is None:
+            store = FACT_CHECK_STORE
+        if store == 'memory':
+            self.store = None
+            self.fact_check_db = self._initialize_fact_db()
+            self.index = ClaimIndex(self.fact_check_db)
+        else:
+            if store == 'sqlite':
+                store = SQLiteFactStore.from_url(DATABASE_URL)
+                if not store:
+                    store.add_many(self._initialize_fact_db().items())
+            elif not isinstance(store, SQLiteFactStore):
+                raise ValueError(f"Unknown fact-check store: {store}")
+            # The store is both the database and its own claim index
+            self.store = self.fact_check_db = self.index = store
+        # The MinHash index is saved next to the SQLite database it covers;
+        # the in-memory sample is small enough to rebuild in each process
+        self.similarity_path = None
+        if self.store is not None and self.store.path != ':memory:':
+            self.similarity_path = f'{self.store.path}.lsh.npz'
+        self._similarity_index = None
+        self._matrix = None
+    
+    @property
+    def fact_check_db(self):
+        """The fact-check database: a FactCheckDB, or the SQLiteFactStore"""
+        return self._fact_check_db
+    
+    @fact_check_db.setter
+    def fact_check_db(self, fact_check_db):
+        # Plain dicts are copied into a FactCheckDB, so later edits are seen by the indexes
+        if type(fact_check_db) is dict:
+            fact_check_db = FactCheckDB(fact_check_db)
+        self._fact_check_db = fact_check_db
+    
+    def add_fact_check(self, key, fact_check):
+        """Add or replace a fact-check and keep the claim index current"""
+        self._matrix = None
+        if self.store is not None:
+            replaced = key in self.store
+            self.store.add(key, fact_check)
+            if replaced:
+                self._similarity_index = None
+            elif self._similarity_index is not None:
+                self._similarity_index.add(key, fact_check['claim'])
+        elif key in self.fact_check_db:
+            self.fact_check_db[key] = fact_check
+            self.index.build(self.fact_check_db)
+            self._similarity_index = None
+        else:
+            self.fact_check_db[key] = fact_check
+            self.index.add(key, fact_check)
+            if self._similarity_index is not None:
+                self._similarity_index.add(key, fact_check['claim'])
+    
+    @property
+    def similarity_index(self):
+        """
+        MinHash index of the database for near-duplicate matching
+        
+        Loaded from similarity_path (set for SQLite stores) when it was
+        saved for the current database, otherwise built on first use and
+        saved there.
+        """
+        index = self._similarity_index
+        if index is None or index.is_stale(self.fact_check_db):
+            index = None
+            if self.similarity_path:
+                index = MinHashIndex.load(self.similarity_path, self.fact_check_db)
+            if index is None:
+                index = MinHashIndex(threshold=CLAIM_SIMILARITY_THRESHOLD).build(self.fact_check_db)
+                if self.similarity_path:
+                    try:
+                        index.save(self.similarity_path)
+                    except OSError:
+                        pass  # persistence is an optimization; a read-only disk just rebuilds
+            self._similarity_index = index
+        return index
+    
+    @property
+    def claim_matrix(self):
+        """Term matrices of the in-memory database for bulk verification, built on first use"""
+        if self._matrix is None or self._matrix.is_stale(self.fact_check_db):
+            self._matrix = ClaimMatrix(self.fact_check_db)
+        return self._matrix
     
     def _initialize_fact_db(self):
         """Initialize fact-check database with sample data"""
@@ -48,7 +150,7 @@ class FactChecker:
         """Extract potential claims from text"""
         # Simple claim extraction based on patterns
         claims = []
-        sentences = text.split('.')
+        sentences = Document.of(text).segments
         
         for sentence in sentences:
             sentence = sentence.strip()
@@ -64,21 +166,55 @@ class FactChecker:
         
         return any(indicator in sentence_lower for indicator in claim_indicators) and len(sentence) > 10
     
-    def verify_claim(self, claim):
-        """Verify a specific claim"""
-        claim_lower = claim.lower()
-        
-        # Check against database
-        for claim_key, fact_check in self.fact_check_db.items():
-            if self._match_claim(claim_lower, fact_check['claim']):
-                return {
-                    'claim': claim,
-                    'verdict': fact_check['verdict'],
-                    'confidence': fact_check['confidence'],
-                    'explanation': fact_check['explanation'],
-                    'sources': fact_check['sources'],
-                    'checked': True
-                }
+    def verify_claim(self, claim, method=None):
+        """
+        Verify a specific claim
+        
+        Args:
+            claim: Claim text
+            method: 'keyword' (share of a fact-check's keywords found in the
+                claim) or 'minhash' (most similar near-duplicate fact-check);
+                defaults to CLAIM_MATCHER
+        """
+        method = method or CLAIM_MATCHER
+        if method == 'keyword':
+            claim_key = self._keyword_match(claim.lower())
+        elif method == 'minhash':
+            matches = self.similarity_index.query(claim, CLAIM_SIMILARITY_THRESHOLD)
+            claim_key = matches[0][0] if matches else None
+        else:
+            raise ValueError(f"Unknown claim matching method: {method}")
+        return self._result(claim, claim_key)
+    
+    def verify_claims(self, claims, method=None):
+        """
+        Verify a list of claims, giving the same results as verify_claim
+        
+        Keyword matching of large batches against the in-memory database
+        uses ClaimMatrix, which matches all claims with sparse matrix
+        products instead of one index lookup per claim.
+        
+        Returns:
+            List of verify_claim results, one per claim
+        """
+        method = method or CLAIM_MATCHER
+        if method != 'keyword' or self.store is not None or len(claims) < MATRIX_MIN_CLAIMS:
+            return [self.verify_claim(claim, method) for claim in claims]
+        keys = self.claim_matrix.match([claim.lower() for claim in claims])
+        return [self._result(claim, claim_key) for claim, claim_key in zip(claims, keys)]
+    
+    def _result(self, claim, claim_key):
+        """verify_claim result for a claim matched to claim_key (None if unmatched)"""
+        if claim_key is not None:
+            fact_check = self.fact_check_db[claim_key]
+            return {
+                'claim': claim,
+                'verdict': fact_check['verdict'],
+                'confidence': fact_check['confidence'],
+                'explanation': fact_check['explanation'],
+                'sources': fact_check['sources'],
+                'checked': True
+            }
         
         # If not found, return uncertain
         return {
@@ -90,22 +226,32 @@ class FactChecker:
             'checked': False
         }
     
+    def _keyword_match(self, claim_lower):
+        """Key of the first fact-check (in database order) the claim matches, or None"""
+        # Rebuild if the database was replaced or edited directly
+        if self.index.is_stale(self.fact_check_db):
+            self.index.build(self.fact_check_db)
+        
+        # Check the indexed candidates, in database order
+        for claim_key in self.index.candidates(claim_lower):
+            if self._match_claim(claim_lower, self.fact_check_db[claim_key]['claim']):
+                return claim_key
+        return None
+    
     def _match_claim(self, claim1, claim2):
         """Check if two claims are similar"""
         # Simple substring matching
-        claim2_lower = claim2.lower()
-        keywords = claim2_lower.split()
+        keywords = claim_keywords(claim2)
         
         matching_keywords = sum(1 for keyword in keywords if keyword in claim1)
         match_ratio = matching_keywords / len(keywords) if keywords else 0
         
-        return match_ratio >= 0.6
+        return match_ratio >= MATCH_RATIO
     
-    def verify_claims_batch(self, claims):
+    def verify_claims_batch(self, claims, method=None):
         """Verify multiple claims"""
         results = []
-        for claim in claims:
-            result = self.verify_claim(claim)
+        for result in self.verify_claims(claims, method):
             if result['confidence'] >= FACT_CHECK_THRESHOLD:
                 results.append(result)
         
@@ -113,9 +259,26 @@ class FactChecker:
     
     def get_fact_check_score(self, text):
         """Get overall fact-check score for text"""
-        claims = self.extract_claims(text)
-        verified_claims = self.verify_claims_batch(claims)
+        return self.get_fact_check_scores([text])[0]
+    
+    def get_fact_check_scores(self, texts):
+        """
+        Get fact-check scores for several texts, verifying all their claims in one batch
         
+        Returns:
+            List of get_fact_check_score results, one per text
+        """
+        claims = [self.extract_claims(text) for text in texts]
+        results = iter(self.verify_claims([claim for text_claims in claims for claim in text_claims]))
+        scores = []
+        for text_claims in claims:
+            verified_claims = [result for result in (next(results) for _ in text_claims)
+                               if result['confidence'] >= FACT_CHECK_THRESHOLD]
+            scores.append(self._score(text_claims, verified_claims))
+        return scores
+    
+    def _score(self, claims, verified_claims):
+        """Fact-check score from a text's claims and its verified claims"""
         if not verified_claims:
             return {
                 'score': 0.5,
@@ -0,0 +1,393 @@
+"""Persistent fact-check store in SQLite
+
+Import fact-checks with:
+
+    python -m src.models.fact_store fact_checks.csv|fact_checks.jsonl [database_url]
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+from collections.abc import Mapping
+
+from src.config import DATABASE_URL, FACT_CHECK_POOL_SIZE
+from src.models.claim_index import COMMON_KEYWORD_SHARE, MATCH_RATIO, claim_keywords, indexed_keywords
+from src.utils.db import ConnectionPool
+
+# Rows written per executemany call during bulk imports
+IMPORT_BATCH = 10000
+
+# Writes of at least this many fact-checks merge the full-text index into one
+# segment afterwards (lookups probe every segment, so this keeps them fast)
+OPTIMIZE_AFTER = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fact_checks (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    claim TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    sources TEXT NOT NULL,
+    explanation TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    needed INTEGER
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS fact_check_fts USING fts5(claim, terms, content='');
+CREATE TABLE IF NOT EXISTS store_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+# Tokens stored in the full-text index: 2 adds keyword heads (see head_token)
+TERMS_FORMAT = 2
+
+# Indexed keywords are also stored under their first HEAD_LENGTH characters
+HEAD_LENGTH = 4
+
+SELECT_FACT_CHECK = 'SELECT claim, verdict, confidence, sources, explanation FROM fact_checks WHERE key = ?'
+SELECT_CANDIDATES = (
+    'SELECT f.key, f.keywords, f.needed FROM fact_check_fts JOIN fact_checks f ON f.id = fact_check_fts.rowid '
+    'WHERE fact_check_fts MATCH ? ORDER BY f.id'
+)
+SELECT_META = 'SELECT value FROM store_meta WHERE name = ?'
+
+
+def sqlite_path(database_url):
+    """File path of a sqlite:/// URL (sqlite:///relative.db, sqlite:////absolute.db)"""
+    prefix = 'sqlite:///'
+    if not database_url.startswith(prefix):
+        raise ValueError(f"Not a SQLite database URL: {database_url}")
+    return database_url[len(prefix):]
+
+
+def term_token(keyword):
+    """
+    FTS5 token for an indexed keyword
+
+    Keywords are whitespace-split and may contain punctuation ("covid-19"),
+    which FTS5 tokenizers split on, so each is stored hex-encoded as one
+    alphanumeric token.
+    """
+    return keyword.encode('utf-8').hex()
+
+
+def head_token(keyword):
+    """FTS5 token for the first HEAD_LENGTH characters of an indexed keyword"""
+    return 'h' + term_token(keyword[:HEAD_LENGTH])
+
+
+def claim_heads(claim_lower):
+    """
+    Substrings of the claim's words up to HEAD_LENGTH characters
+
+    A keyword contained in the claim lies within one of its words, so its
+    head is among these; there are at most HEAD_LENGTH per character of
+    the claim, however long the stored keywords are.
+    """
+    heads = set()
+    for word in set(claim_lower.split()):
+        for start in range(len(word)):
+            for end in range(start + 1, min(len(word), start + HEAD_LENGTH) + 1):
+                heads.add(word[start:end])
+    return heads
+
+
+def fact_check_key(fact_check):
+    """Stable key for an imported fact-check without one"""
+    return 'claim_' + hashlib.blake2b(fact_check['claim'].encode('utf-8'), digest_size=8).hexdigest()
+
+
+def read_fact_checks(path):
+    """
+    Read fact-checks from a CSV (header row) or JSON Lines file
+
+    Each record has claim, verdict, confidence, sources and explanation,
+    and optionally key. CSV sources are separated by semicolons.
+
+    Yields:
+        (key, fact_check) pairs
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith('.csv'):
+            records = csv.DictReader(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+        for record in records:
+            sources = record.get('sources') or []
+            if isinstance(sources, str):
+                sources = [source.strip() for source in sources.split(';') if source.strip()]
+            fact_check = {
+                'claim': record['claim'],
+                'verdict': record['verdict'].upper(),
+                'confidence': float(record['confidence']),
+                'sources': sources,
+                'explanation': record.get('explanation') or ''
+            }
+            yield record.get('key') or fact_check_key(fact_check), fact_check
+
+
+class SQLiteFactStore(Mapping):
+    """
+    Fact-check database in a SQLite file
+
+    A read-only mapping from key to fact-check dict, in insertion order,
+    like the in-memory database, so FactChecker uses either one. It is also
+    its own claim index: each fact-check's indexed keywords (chosen as in
+    ClaimIndex) are stored in an FTS5 table, whole and by their first
+    HEAD_LENGTH characters. A claim looks up the heads its words contain,
+    and the fact-checks found are kept when enough of their keywords occur
+    in it as substrings, so candidates and verdicts are the same as with
+    the in-memory index. The FTS5 table also supports full-text search
+    over the claims.
+    """
+
+    def __init__(self, path, pool_size=FACT_CHECK_POOL_SIZE, ratio=MATCH_RATIO):
+        self.path = path
+        self.ratio = ratio
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+            with connection:
+                if connection.execute(SELECT_META, ('terms_format',)).fetchone() != (TERMS_FORMAT,):
+                    self._reindex(connection)
+
+    @property
+    def version(self):
+        """Write counter kept in the database, so every process sees every write (see claim_index.db_version)"""
+        with self.pool.connection() as connection:
+            row = connection.execute(SELECT_META, ('version',)).fetchone()
+        return row[0] if row else 0
+
+    @classmethod
+    def from_url(cls, database_url=DATABASE_URL, **kwargs):
+        """Open the store at a sqlite:/// URL"""
+        return cls(sqlite_path(database_url), **kwargs)
+
+    def __getitem__(self, key):
+        with self.pool.connection() as connection:
+            row = connection.execute(SELECT_FACT_CHECK, (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return self._fact_check(row)
+
+    def __iter__(self):
+        with self.pool.connection() as connection:
+            keys = connection.execute('SELECT key FROM fact_checks ORDER BY id').fetchall()
+        return (key for key, in keys)
+
+    def __len__(self):
+        with self.pool.connection() as connection:
+            return connection.execute('SELECT count(*) FROM fact_checks').fetchone()[0]
+
+    def __contains__(self, key):
+        with self.pool.connection() as connection:
+            return connection.execute('SELECT 1 FROM fact_checks WHERE key = ?', (key,)).fetchone() is not None
+
+    def items(self):
+        """(key, fact_check) pairs in insertion order, read in one query"""
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                'SELECT key, claim, verdict, confidence, sources, explanation FROM fact_checks ORDER BY id'
+            ).fetchall()
+        return [(row[0], self._fact_check(row[1:])) for row in rows]
+
+    def values(self):
+        return [fact_check for _, fact_check in self.items()]
+
+    @staticmethod
+    def _fact_check(row):
+        claim, verdict, confidence, sources, explanation = row
+        return {
+            'claim': claim,
+            'verdict': verdict,
+            'confidence': confidence,
+            'sources': json.loads(sources),
+            'explanation': explanation
+        }
+
+    def add(self, key, fact_check):
+        """Add or replace one fact-check"""
+        self.add_many([(key, fact_check)])
+
+    def add_many(self, fact_checks):
+        """
+        Add or replace fact-checks in one transaction
+
+        Keyword rarity for the index is counted over the batch together
+        with the fact-checks already stored. Replaced fact-checks keep
+        their position.
+
+        Args:
+            fact_checks: Iterable of (key, fact_check) pairs
+
+        Returns:
+            Number of fact-checks written
+        """
+        fact_checks = list(fact_checks)
+        keywords = [claim_keywords(fact_check['claim']) for _, fact_check in fact_checks]
+        batch_frequency = Counter(keyword for words in keywords for keyword in set(words))
+
+        written = 0
+        with self.pool.connection() as connection, connection:
+            stored = connection.execute('SELECT count(*) FROM fact_checks').fetchone()[0]
+            frequency = self._stored_frequency(connection, batch_frequency) if stored else batch_frequency
+            common = max(COMMON_KEYWORD_SHARE * (stored + len(fact_checks)), 1)
+            for start in range(0, len(fact_checks), IMPORT_BATCH):
+                batch = fact_checks[start:start + IMPORT_BATCH]
+                rows = []
+                for (key, fact_check), words in zip(batch, keywords[start:start + IMPORT_BATCH]):
+                    indexed, needed = indexed_keywords(words, frequency, common, self.ratio)
+                    rows.append((key, fact_check, indexed, needed))
+                self._write(connection, rows)
+                written += len(rows)
+            connection.execute(
+                "INSERT INTO store_meta VALUES ('version', 1) ON CONFLICT(name) DO UPDATE SET value = value + 1"
+            )
+        if written >= OPTIMIZE_AFTER:
+            self.optimize()
+        return written
+
+    def optimize(self):
+        """Merge the full-text index into a single segment"""
+        with self.pool.connection() as connection, connection:
+            connection.execute("INSERT INTO fact_check_fts(fact_check_fts) VALUES ('optimize')")
+
+    def _stored_frequency(self, connection, batch_frequency):
+        """Document frequency of the batch's keywords across the batch and the stored index"""
+        connection.execute(
+            'CREATE VIRTUAL TABLE IF NOT EXISTS temp.fact_check_vocab USING fts5vocab(main, fact_check_fts, col)'
+        )
+        frequency = Counter(batch_frequency)
+        tokens = {term_token(keyword): keyword for keyword in batch_frequency}
+        terms = list(tokens)
+        for start in range(0, len(terms), 500):
+            chunk = terms[start:start + 500]
+            for term, count in connection.execute(
+                "SELECT term, doc FROM temp.fact_check_vocab "
+                f"WHERE col = 'terms' AND term IN ({','.join('?' * len(chunk))})", chunk
+            ):
+                frequency[tokens[term]] += count
+        return frequency
+
+    def _reindex(self, connection):
+        """Rebuild the full-text index of every stored fact-check in the current TERMS_FORMAT"""
+        rows = connection.execute('SELECT id, claim, keywords FROM fact_checks').fetchall()
+        connection.execute("INSERT INTO fact_check_fts(fact_check_fts) VALUES ('delete-all')")
+        connection.executemany(
+            'INSERT INTO fact_check_fts (rowid, claim, terms) VALUES (?, ?, ?)',
+            [(row_id, claim, self._terms(keywords.split())) for row_id, claim, keywords in rows]
+        )
+        connection.execute(
+            "INSERT INTO store_meta VALUES ('terms_format', ?) ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+            (TERMS_FORMAT,)
+        )
+
+    def _write(self, connection, rows):
+        """Upsert fact-check rows and replace their full-text entries"""
+        keys = [key for key, _, _, _ in rows]
+        previous = []
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            previous += connection.execute(
+                f"SELECT id, claim, keywords FROM fact_checks WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+        connection.executemany(
+            "INSERT INTO fact_check_fts(fact_check_fts, rowid, claim, terms) VALUES ('delete', ?, ?, ?)",
+            [(row_id, claim, self._terms(keywords.split())) for row_id, claim, keywords in previous]
+        )
+        connection.executemany(
+            'INSERT INTO fact_checks (key, claim, verdict, confidence, sources, explanation, keywords, needed) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET '
+            'claim = excluded.claim, verdict = excluded.verdict, confidence = excluded.confidence, '
+            'sources = excluded.sources, explanation = excluded.explanation, '
+            'keywords = excluded.keywords, needed = excluded.needed',
+            [
+                (key, fact_check['claim'], fact_check['verdict'], fact_check['confidence'],
+                 json.dumps(fact_check.get('sources', [])), fact_check.get('explanation', ''),
+                 ' '.join(indexed), needed)
+                for key, fact_check, indexed, needed in rows
+            ]
+        )
+        ids = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            ids.update(connection.execute(
+                f"SELECT key, id FROM fact_checks WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        connection.executemany(
+            'INSERT INTO fact_check_fts (rowid, claim, terms) VALUES (?, ?, ?)',
+            [(ids[key], fact_check['claim'], self._terms(indexed)) for key, fact_check, indexed, _ in rows]
+        )
+
+    @staticmethod
+    def _terms(keywords):
+        return ' '.join([term_token(keyword) for keyword in keywords] + [head_token(keyword) for keyword in keywords])
+
+    def import_file(self, path):
+        """Bulk import a CSV or JSON Lines file (see read_fact_checks); returns the number imported"""
+        return self.add_many(read_fact_checks(path))
+
+    def is_stale(self, fact_check_db):
+        """The store indexes itself as it is written, so it is never stale"""
+        return False
+
+    def candidates(self, claim_lower):
+        """
+        Keys of the fact-checks a lowercased claim could match
+
+        Args:
+            claim_lower: Lowercased claim text
+
+        Returns:
+            List of keys in insertion order
+        """
+        heads = claim_heads(claim_lower)
+        if not heads:
+            return []
+        query = 'terms : (' + ' OR '.join(f'"{head_token(head)}"' for head in heads) + ')'
+        with self.pool.connection() as connection:
+            rows = connection.execute(SELECT_CANDIDATES, (query,)).fetchall()
+
+        return [
+            key for key, keywords, needed in rows
+            if needed is not None and sum(keyword in claim_lower for keyword in keywords.split()) >= needed
+        ]
+
+    def search(self, text, limit=10):
+        """
+        Full-text search over the stored claims
+
+        Args:
+            text: Words to look for
+            limit: Maximum number of results
+
+        Returns:
+            List of (key, fact_check), best match first
+        """
+        words = claim_keywords(text)
+        if not words:
+            return []
+        query = 'claim : (' + ' OR '.join('"' + word.replace('"', '""') + '"' for word in words) + ')'
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                'SELECT f.key, f.claim, f.verdict, f.confidence, f.sources, f.explanation '
+                'FROM fact_check_fts JOIN fact_checks f ON f.id = fact_check_fts.rowid '
+                'WHERE fact_check_fts MATCH ? ORDER BY bm25(fact_check_fts) LIMIT ?',
+                (query, limit)
+            ).fetchall()
+        return [(row[0], self._fact_check(row[1:])) for row in rows]
+
+    def close(self):
+        self.pool.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: python -m src.models.fact_store <fact_checks.csv|.jsonl> [database_url]')
+        sys.exit(1)
+    store = SQLiteFactStore.from_url(sys.argv[2] if len(sys.argv) > 2 else DATABASE_URL)
+    print(f"Imported {store.import_file(sys.argv[1])} fact-checks; {len(store)} in {store.path}")
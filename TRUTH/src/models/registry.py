@@ -0,0 +1,174 @@
+"""Versioned model registry with hot swapping for the running service"""
+
+import logging
+import os
+import re
+import threading
+import time
+
+from src.config import MODEL_REGISTRY_DIR, MODEL_WATCH_INTERVAL
+from src.models.artifact import is_mapped_artifact
+
+logger = logging.getLogger(__name__)
+
+VERSION_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*$')
+
+
+class ModelRegistry:
+    """
+    Versioned detector artifacts on local disk
+
+    Layout:
+        <root>/<version>/   mapped model artifact (see src.models.artifact)
+        <root>/CURRENT      name of the version the service should run
+
+    Activating a version loads it into a FakeNewsDetector, which publishes
+    the new model with a single reference swap: predictions never lock, and
+    requests already in flight finish on the model they started with.
+    Other worker processes follow CURRENT through watch().
+    """
+
+    CURRENT_FILE = 'CURRENT'
+
+    def __init__(self, root=None):
+        self.root = root or MODEL_REGISTRY_DIR
+        self._lock = threading.Lock()  # serializes swaps, never taken by readers
+        self._watch_lock = threading.Lock()
+        self._watcher = None
+        self._pid = None
+        self._stop = threading.Event()
+
+    def path(self, version):
+        """Directory of a registry version"""
+        if not version or not VERSION_PATTERN.match(version):
+            raise ValueError(f'Invalid model version: {version!r}')
+        return os.path.join(self.root, version)
+
+    def versions(self):
+        """List published versions, oldest name first"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if VERSION_PATTERN.match(name) and is_mapped_artifact(os.path.join(self.root, name))
+        )
+
+    def current_version(self):
+        """Version named in CURRENT, or None"""
+        try:
+            with open(os.path.join(self.root, self.CURRENT_FILE)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def publish(self, detector, version=None, activate=False):
+        """
+        Save a trained detector as a new registry version
+
+        Args:
+            detector: Trained FakeNewsDetector
+            version: Version name (defaults to a UTC timestamp)
+            activate: Also make it the current version and load it
+
+        Returns:
+            The published version name
+        """
+        version = version or time.strftime('%Y%m%d-%H%M%S', time.gmtime())
+        path = self.path(version)
+        if os.path.exists(path):
+            raise ValueError(f'Model version already exists: {version}')
+
+        if detector.model is None:
+            raise ValueError('Cannot publish an untrained detector')
+        detector.save_model(path, version=version)
+
+        if activate:
+            self.activate(detector, version)
+        return version
+
+    def set_current(self, version):
+        """Atomically point CURRENT at a published version"""
+        if not is_mapped_artifact(self.path(version)):
+            raise ValueError(f'Unknown model version: {version}')
+        os.makedirs(self.root, exist_ok=True)
+        staging = os.path.join(self.root, f'.{self.CURRENT_FILE}.{os.getpid()}')
+        with open(staging, 'w') as f:
+            f.write(version)
+        os.replace(staging, os.path.join(self.root, self.CURRENT_FILE))
+
+    def activate(self, detector, version=None):
+        """
+        Load a version into detector and record it as current
+
+        Args:
+            detector: FakeNewsDetector to swap
+            version: Version to activate (defaults to CURRENT)
+
+        Returns:
+            The activated version name
+        """
+        version = version or self.current_version()
+        if version is None:
+            raise ValueError('No model version to activate')
+
+        with self._lock:
+            if detector.model_version != version:
+                self._load(detector, version)
+            if version != self.current_version():
+                self.set_current(version)
+        return version
+
+    def sync(self, detector):
+        """Load CURRENT into detector if it changed; return True on a swap"""
+        version = self.current_version()
+        if version is None or version == detector.model_version:
+            return False
+
+        with self._lock:
+            if version == detector.model_version:
+                return False
+            self._load(detector, version)
+        return True
+
+    def watch(self, detector, interval=None):
+        """
+        Poll CURRENT in a background thread and hot-swap on change
+
+        Cheap to call on every request: the thread is started once per
+        process, and again in a worker forked after it started (gunicorn
+        preload), where the parent's thread does not exist.
+        """
+        if self._watcher is not None and self._pid == os.getpid():
+            return
+        interval = interval or MODEL_WATCH_INTERVAL
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.sync(detector)
+                except Exception:
+                    logger.exception("Model registry sync failed")
+
+        with self._watch_lock:
+            if self._watcher is not None and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                # A swap running in the parent at fork time may have left the lock held
+                self._lock = threading.Lock()
+                self._stop = threading.Event()
+            self._stop.clear()
+            self._pid = os.getpid()
+            self._watcher = threading.Thread(target=run, name='model-registry-watch', daemon=True)
+            self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the background watcher"""
+        self._stop.set()
+        if self._watcher is not None and self._pid == os.getpid():
+            self._watcher.join()
+        self._watcher = None
+
+    def _load(self, detector, version):
+        if not detector.load_model(self.path(version), version=version):
+            raise ValueError(f'Unknown model version: {version}')
+        logger.info(f"Activated model version {version}")
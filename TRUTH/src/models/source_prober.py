@@ -0,0 +1,193 @@
+"""Concurrent HTTP probing of news sources"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import API_TIMEOUT, PROBE_DEADLINE, PROBE_MAX_CONNECTIONS, PROBE_PER_HOST
+from src.models.circuit_breaker import CircuitBreaker
+
+# Seconds allowed for the About page request
+ABOUT_TIMEOUT = 5
+
+# What a probe found: the HEAD status code (None if the request failed), whether
+# /about answered 200, and the HEAD request's exception (None if it succeeded;
+# CircuitOpen if the host was not probed)
+Probe = namedtuple('Probe', ['status_code', 'has_about', 'error'])
+
+
+class ProbeDeadlineExceeded(requests.Timeout):
+    """The source did not answer before the probing deadline"""
+
+
+class CircuitOpen(requests.ConnectionError):
+    """The source's host has been failing; it is not probed until its circuit half-opens"""
+
+
+class SourceProber:
+    """
+    Probes sources with concurrent HEAD and About-page requests
+
+    An asyncio event loop in a background thread schedules the requests,
+    which run on a thread pool through one requests.Session, so
+    connections to a host are kept alive and reused across calls. For each
+    source the HEAD and /about requests run at the same time. Requests to
+    one host are limited to per_host at once, however many calls are
+    probing it. Every probe_many call has one deadline for all of its URLs:
+    request timeouts are capped by the time left, and whatever has not
+    answered when it passes is reported as timed out, so a slow site
+    cannot hold the caller for longer than the deadline.
+
+    A CircuitBreaker tracks each host. Hosts that keep failing are not
+    probed at all while their circuit is open (the probe reports
+    CircuitOpen at once), and request timeouts shrink to fit a host's
+    observed latency.
+    """
+
+    def __init__(self, deadline=None, max_connections=None, per_host=None,
+                 head_timeout=API_TIMEOUT, about_timeout=ABOUT_TIMEOUT, breaker=None):
+        """
+        Args:
+            deadline: Default seconds per probe_many call (defaults to PROBE_DEADLINE)
+            max_connections: Requests in flight at once (defaults to PROBE_MAX_CONNECTIONS)
+            per_host: Requests in flight per host (defaults to PROBE_PER_HOST)
+            head_timeout: Longest wait for the HEAD request
+            about_timeout: Longest wait for the About page
+            breaker: CircuitBreaker for the probed hosts (defaults to one built from config)
+        """
+        self.deadline = PROBE_DEADLINE if deadline is None else deadline
+        self.max_connections = max_connections or PROBE_MAX_CONNECTIONS
+        self.per_host = per_host or PROBE_PER_HOST
+        self.head_timeout = head_timeout
+        self.about_timeout = about_timeout
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self._lock = threading.Lock()
+        self._loop = None
+        self._pid = None
+
+    def probe(self, url, deadline=None):
+        """Probe one URL; see probe_many"""
+        return self.probe_many([url], deadline)[0]
+
+    def probe_many(self, urls, deadline=None):
+        """
+        Probe URLs concurrently
+
+        Args:
+            urls: Source URLs
+            deadline: Seconds before unanswered probes count as timed out
+                (defaults to self.deadline)
+
+        Returns:
+            List of Probe, one per URL
+        """
+        if not urls:
+            return []
+        until = time.monotonic() + (self.deadline if deadline is None else deadline)
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._probe_all(urls, until), loop).result()
+
+    def close(self):
+        """Stop the event loop and close pooled connections"""
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._executor.shutdown(wait=False)
+                self._session.close()
+            self._loop = None
+
+    def _ensure_loop(self):
+        """Start the event loop thread, restarting it after a fork (gunicorn preload)"""
+        if self._loop is not None and self._pid == os.getpid():
+            return self._loop
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='source-prober', daemon=True).start()
+                self._executor = ThreadPoolExecutor(self.max_connections, thread_name_prefix='source-probe')
+                self._session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.max_connections, pool_maxsize=self.per_host)
+                self._session.mount('http://', adapter)
+                self._session.mount('https://', adapter)
+                self._hosts = {}  # host -> [semaphore, probes using it]
+                self._loop, self._pid = loop, os.getpid()
+        return self._loop
+
+    async def _probe_all(self, urls, until):
+        return await asyncio.gather(*(self._probe(url, until) for url in urls))
+
+    async def _probe(self, url, until):
+        host = urlsplit(url).netloc.lower()
+        if not self.breaker.allow(host):
+            return Probe(None, False, CircuitOpen(f'{host} is failing; not probed until its circuit half-opens'))
+        slot = self._hosts.setdefault(host, [asyncio.Semaphore(self.per_host), 0])
+        slot[1] += 1
+        try:
+            head = asyncio.ensure_future(self._limited(slot[0], self._head, url, until))
+            about = asyncio.ensure_future(self._limited(slot[0], self._about, url, until))
+            done, pending = await asyncio.wait({head, about}, timeout=max(until - time.monotonic(), 0))
+            for task in pending:
+                task.cancel()
+        finally:
+            slot[1] -= 1
+            if not slot[1]:
+                del self._hosts[host]
+
+        # Only requests the host failed to answer in its own timeout count against
+        # its circuit: running out of the caller's deadline, whether queued behind
+        # other probes of the host or waiting for an answer, says nothing about it
+        if head not in done:
+            return Probe(None, False, ProbeDeadlineExceeded(f'{host} did not answer within the deadline'))
+        has_about = about in done and about.exception() is None and about.result()
+        if head.exception() is not None:
+            if not isinstance(head.exception(), ProbeDeadlineExceeded):
+                self.breaker.record_failure(host)
+            return Probe(None, has_about, head.exception())
+        status_code, latency = head.result()
+        if status_code >= 500:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host, latency)
+        return Probe(status_code, has_about, None)
+
+    async def _limited(self, semaphore, request, url, until):
+        """Run a blocking request on the pool once the host has a free slot"""
+        async with semaphore:
+            remaining = until - time.monotonic()
+            if remaining <= 0:
+                raise ProbeDeadlineExceeded(f'No time left to probe {url}')
+            return await asyncio.get_running_loop().run_in_executor(self._executor, request, url, remaining)
+
+    def _timeout(self, url, default, remaining):
+        return min(self.breaker.timeout(urlsplit(url).netloc.lower(), default), remaining)
+
+    def _head(self, url, remaining):
+        """
+        Return (status code, seconds taken)
+
+        A timeout cut short by the caller's deadline raises ProbeDeadlineExceeded.
+        """
+        host_timeout = self._timeout(url, self.head_timeout, float('inf'))
+        start = time.monotonic()
+        try:
+            response = self._session.head(url, timeout=min(host_timeout, remaining), allow_redirects=True)
+        except requests.Timeout as e:
+            if remaining < host_timeout:
+                raise ProbeDeadlineExceeded(f'{url} did not answer before the deadline') from e
+            raise
+        return response.status_code, time.monotonic() - start
+
+    def _about(self, url, remaining):
+        about_url = url.rstrip('/') + '/about'
+        timeout = self._timeout(url, self.about_timeout, remaining)
+        try:
+            return self._session.get(about_url, timeout=timeout).status_code == 200
+        except requests.RequestException:
+            return False
@@ -0,0 +1,306 @@
+"""Cross-validated hyperparameter search for the fake news detector"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+from sklearn.model_selection import ParameterGrid, StratifiedKFold
+
+from src.config import TUNING_CACHE_DIR, TUNING_WORKERS
+from src.models.artifact import PackedForest
+from src.models.detector import FakeNewsDetector
+from src.utils.text_processor import TextPreprocessor
+
+DEFAULT_PARAM_GRID = {
+    'vectorizer__max_features': [1000, 5000],
+    'forest__n_estimators': [50, 100],
+    'forest__max_depth': [None, 30]
+}
+
+PARAM_PREFIXES = ('vectorizer', 'forest')
+
+
+def _digest(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode('utf-8')
+        h.update(len(data).to_bytes(8, 'little'))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _cleaning_key(preprocessor):
+    """Identify a preprocessor's cleaning behaviour, so code changes invalidate the cache"""
+    cls = type(preprocessor)
+    try:
+        source = inspect.getsource(inspect.getmodule(cls))
+    except (OSError, TypeError):
+        source = ''
+    return _digest(cls.__module__, cls.__qualname__, source)
+
+
+class FeatureCache:
+    """
+    On-disk cache of cleaned corpora and fitted TF-IDF fold matrices
+
+    Layout:
+        <root>/corpus/<key>.json        cleaned texts, keyed by corpus and cleaning code
+        <root>/features/<key>/X.npz     whole corpus vectorized by a vectorizer fitted
+        <root>/features/<key>/vectorizer.pkl   on one fold's training rows
+
+    Feature entries are keyed by the cleaned corpus, the vectorizer
+    parameters and the training rows, so repeated searches never re-clean or
+    re-vectorize, and fold vocabularies never see their test rows.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or TUNING_CACHE_DIR
+        self.built = 0
+        self.reused = 0
+
+    def cleaned(self, texts, preprocessor=None):
+        """
+        Return (key, cleaned texts), cleaning only on a cache miss
+
+        Args:
+            texts: Raw text samples
+            preprocessor: TextPreprocessor to clean with
+
+        Returns:
+            Tuple of cache key and list of cleaned texts
+        """
+        preprocessor = preprocessor or TextPreprocessor()
+        key = _digest(_cleaning_key(preprocessor), *texts)
+        path = os.path.join(self.root, 'corpus', f'{key}.json')
+
+        if os.path.exists(path):
+            with open(path) as f:
+                cleaned = json.load(f)
+            self.reused += 1
+            return key, cleaned
+
+        cleaned = preprocessor.clean_texts(texts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        staging = f'{path}.{os.getpid()}'
+        with open(staging, 'w') as f:
+            json.dump(cleaned, f)
+        os.replace(staging, path)
+        self.built += 1
+        return key, cleaned
+
+    def feature_path(self, corpus_key, vectorizer_params, train_index):
+        """Directory of the feature entry for a vectorizer config and fold"""
+        key = _digest(
+            corpus_key,
+            json.dumps(vectorizer_params, sort_keys=True, default=repr),
+            np.asarray(train_index, dtype=np.int64).tobytes()
+        )
+        return os.path.join(self.root, 'features', key)
+
+    @staticmethod
+    def has_features(path):
+        return os.path.isfile(os.path.join(path, 'vectorizer.pkl'))
+
+    @staticmethod
+    def load_features(path):
+        """Return (vectorizer, X) from a feature entry"""
+        with open(os.path.join(path, 'vectorizer.pkl'), 'rb') as f:
+            vectorizer = pickle.load(f)
+        return vectorizer, sparse.load_npz(os.path.join(path, 'X.npz')).tocsr()
+
+
+def _build_features(task):
+    """Pool task: fit a vectorizer on one fold and cache the vectorized corpus"""
+    path = task['path']
+    if FeatureCache.has_features(path):
+        return path
+
+    with open(task['corpus_path']) as f:
+        cleaned = json.load(f)
+    vectorizer = FakeNewsDetector._build_vectorizer(**task['vectorizer_params'])
+    vectorizer.fit([cleaned[i] for i in task['train_index']])
+    X = vectorizer.transform(cleaned)
+
+    staging = f'{path}.{os.getpid()}.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    sparse.save_npz(os.path.join(staging, 'X.npz'), X, compressed=False)
+    with open(os.path.join(staging, 'vectorizer.pkl'), 'wb') as f:
+        pickle.dump(vectorizer, f)
+    try:
+        os.replace(staging, path)
+    except OSError:
+        # Another worker published the same entry first
+        shutil.rmtree(staging, ignore_errors=True)
+    return path
+
+
+def _score_fold(task):
+    """Pool task: train one forest on a cached fold and measure it"""
+    vectorizer, X = FeatureCache.load_features(task['path'])
+    labels = np.asarray(task['labels'])
+    train_index, test_index = task['train_index'], task['test_index']
+
+    model = FakeNewsDetector._build_forest(**{**task['forest_params'], 'n_jobs': 1})
+    start = time.perf_counter()
+    model.fit(X[train_index], labels[train_index])
+    train_time = time.perf_counter() - start
+
+    accuracy = float(np.mean(model.predict(X[test_index]) == labels[test_index]))
+
+    # Serving cost after cleaning: vectorize + score, per document and in one batch
+    docs = task['latency_docs']
+    latencies = []
+    for doc in docs:
+        start = time.perf_counter()
+        model.predict_proba(vectorizer.transform([doc]))
+        latencies.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    model.predict_proba(vectorizer.transform(docs))
+    batch_time = time.perf_counter() - start
+
+    packed = PackedForest.from_estimator(model)
+    return {
+        'accuracy': accuracy,
+        'train_time': train_time,
+        'model_bytes': sum(array.nbytes for array in packed.arrays().values()),
+        'n_features': len(vectorizer.vocabulary_),
+        'latency_ms': float(np.median(latencies)) * 1000,
+        'batch_latency_ms': batch_time / len(docs) * 1000
+    }
+
+
+class HyperparameterSearch:
+    """
+    Grid search with k-fold cross-validation over detector settings
+
+    Every (config, fold) pair is trained in a process pool from matrices
+    cached by FeatureCache, so vectorizing is paid once per vectorizer
+    config and fold, and not at all on later runs. Each config is reported
+    with accuracy, training time, packed model size and inference latency.
+    """
+
+    def __init__(self, cache_dir=None, n_splits=5, workers=None, random_state=42,
+                 latency_samples=50):
+        self.cache = FeatureCache(cache_dir)
+        self.n_splits = n_splits
+        self.workers = workers if workers is not None else (TUNING_WORKERS or None)
+        self.random_state = random_state
+        self.latency_samples = latency_samples
+        self.preprocessor = TextPreprocessor()
+
+    def run(self, texts, labels, param_grid=None):
+        """
+        Cross-validate every configuration in param_grid
+
+        Args:
+            texts: List of text samples
+            labels: List of labels (0 = fake, 1 = real)
+            param_grid: Dict (or list of dicts) of 'vectorizer__<param>' and
+                'forest__<param>' value lists (defaults to DEFAULT_PARAM_GRID)
+
+        Returns:
+            List of result dictionaries, one per configuration, best accuracy first
+        """
+        configs = [self._split_params(params) for params in ParameterGrid(param_grid or DEFAULT_PARAM_GRID)]
+        labels = np.asarray(labels)
+        corpus_key, cleaned = self.cache.cleaned(texts, self.preprocessor)
+        corpus_path = os.path.join(self.cache.root, 'corpus', f'{corpus_key}.json')
+
+        folds = list(StratifiedKFold(
+            n_splits=self.n_splits, shuffle=True, random_state=self.random_state
+        ).split(cleaned, labels))
+
+        # Phase 1: vectorize each distinct (vectorizer config, fold) once
+        builds = {}
+        for vectorizer_params, _ in configs:
+            for train_index, _ in folds:
+                path = self.cache.feature_path(corpus_key, vectorizer_params, train_index)
+                if path in builds:
+                    continue
+                if FeatureCache.has_features(path):
+                    self.cache.reused += 1
+                    builds[path] = None
+                else:
+                    builds[path] = {
+                        'path': path,
+                        'corpus_path': corpus_path,
+                        'vectorizer_params': vectorizer_params,
+                        'train_index': train_index
+                    }
+        pending = [task for task in builds.values() if task is not None]
+        os.makedirs(os.path.join(self.cache.root, 'features'), exist_ok=True)
+        self._map(_build_features, pending)
+        self.cache.built += len(pending)
+
+        # Phase 2: train and measure every (config, fold) pair
+        tasks = []
+        for vectorizer_params, forest_params in configs:
+            for train_index, test_index in folds:
+                tasks.append({
+                    'path': self.cache.feature_path(corpus_key, vectorizer_params, train_index),
+                    'labels': labels,
+                    'train_index': train_index,
+                    'test_index': test_index,
+                    'forest_params': forest_params,
+                    'latency_docs': [cleaned[i] for i in test_index[:self.latency_samples]]
+                })
+        scores = self._map(_score_fold, tasks)
+
+        results = []
+        for i, (vectorizer_params, forest_params) in enumerate(configs):
+            fold_scores = scores[i * len(folds):(i + 1) * len(folds)]
+            accuracies = [score['accuracy'] for score in fold_scores]
+            results.append({
+                'vectorizer_params': vectorizer_params,
+                'forest_params': forest_params,
+                'accuracy': float(np.mean(accuracies)),
+                'accuracy_std': float(np.std(accuracies)),
+                **{
+                    metric: float(np.mean([score[metric] for score in fold_scores]))
+                    for metric in ('train_time', 'model_bytes', 'n_features',
+                                   'latency_ms', 'batch_latency_ms')
+                }
+            })
+        return sorted(results, key=lambda result: -result['accuracy'])
+
+    @staticmethod
+    def cheapest(results, min_accuracy, cost='latency_ms'):
+        """
+        Pick the lowest-cost configuration that meets an accuracy bar
+
+        Args:
+            results: Output of run()
+            min_accuracy: Required mean cross-validated accuracy
+            cost: Result metric to minimize (latency_ms, model_bytes, train_time, ...)
+
+        Returns:
+            The matching result dictionary, or None if no configuration qualifies
+        """
+        eligible = [result for result in results if result['accuracy'] >= min_accuracy]
+        return min(eligible, key=lambda result: result[cost]) if eligible else None
+
+    @staticmethod
+    def _split_params(params):
+        split = {prefix: {} for prefix in PARAM_PREFIXES}
+        for name, value in params.items():
+            prefix, _, param = name.partition('__')
+            if prefix not in split or not param:
+                raise ValueError(f'Parameter must start with vectorizer__ or forest__: {name}')
+            split[prefix][param] = value
+        return split['vectorizer'], split['forest']
+
+    def _map(self, func, tasks):
+        if not tasks:
+            return []
+        if self.workers == 1 or len(tasks) == 1:
+            return [func(task) for task in tasks]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(func, tasks))
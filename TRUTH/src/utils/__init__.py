@@ -1,5 +1,24 @@
-"""Initialize utils module"""
+"""Initialize utils module
 
-from src.utils.text_processor import TextPreprocessor, TextAnalyzer
+Exports are imported on first access, so importing one submodule does not
+pull in every utility's dependencies.
+"""
 
-__all__ = ['TextPreprocessor', 'TextAnalyzer']
+from importlib import import_module
+
+_EXPORTS = {
+    'Document': 'src.utils.text_processor',
+    'LRUCache': 'src.utils.cache',
+    'TextPreprocessor': 'src.utils.text_processor',
+    'TextAnalyzer': 'src.utils.text_processor'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,98 @@
+"""Bounded in-memory caching utilities"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with optional time-to-live and hit/miss counters
+
+    A maxsize of 0 disables caching. The default TTL (seconds, None for no
+    expiry) can be overridden per entry in set().
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (value, expires_at, created_at)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default on a miss"""
+        with self._lock:
+            entry = self._entries.get(key, self._MISSING)
+            if entry is self._MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=_MISSING, age=0):
+        """
+        Cache value under key, evicting the least recently used entries
+
+        age is how many seconds old the value already is (e.g. when copied
+        from another cache); it counts towards the entry age statistics.
+        """
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is self._MISSING else ttl
+        now = self._clock()
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at, now - age)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        """Zero the hit, miss, eviction and expiration counters"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return size, hit/miss, eviction and entry age (seconds) statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            now = self._clock()
+            ages = [now - created_at for _, _, created_at in self._entries.values()]
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'oldest_age': max(ages, default=0.0),
+                'mean_age': sum(ages) / len(ages) if ages else 0.0
+            }
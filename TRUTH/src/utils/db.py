@@ -0,0 +1,62 @@
+"""Pooled SQLite connections shared by the on-disk stores"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of SQLite connections
+
+    Connections are opened on demand, in WAL mode, and reused; sqlite3
+    keeps a cache of prepared statements per connection, so the constant
+    queries of a store are compiled once per connection. A pool created
+    before a fork (gunicorn's preload) opens fresh connections in each
+    worker rather than sharing the parent's.
+    """
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self.size = size
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, cached_statements=64)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; blocks while all of them are in use"""
+        if self._pid != os.getpid():
+            self._reset()
+        with self._lock:
+            opened = self._opened < self.size and self._idle.empty()
+            if opened:
+                self._opened += 1
+        try:
+            connection = self._open() if opened else self._idle.get()
+        except sqlite3.Error:
+            with self._lock:
+                self._opened -= 1
+            raise
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self):
+        """Close the idle connections"""
+        while not self._idle.empty():
+            self._idle.get().close()
+            self._opened -= 1
@@ -0,0 +1,140 @@
+"""Fast rule-based named entity extraction"""
+
+import re
+from collections import Counter
+from functools import cached_property
+
+# Organizations the fact-check database and credibility checks refer to
+DEFAULT_GAZETTEER = (
+    'WHO', 'World Health Organization', 'CDC', 'Centers for Disease Control', 'NASA', 'IPCC',
+    'IEEE', 'FDA', 'NIH', 'United Nations', 'European Union', 'Reuters', 'Associated Press', 'BBC'
+)
+
+# Runs of capitalized words separated by whitespace (punctuation ends a run)
+CAPITALIZED_RUN = re.compile(r"\b[A-Z][\w'&-]*(?:(?:[ \t]+|[ \t]*\n[ \t]*)[A-Z][\w'&-]*)*")
+CAPITALIZED_WORD = re.compile(r"[A-Z][\w'&-]*")
+WORD = re.compile(r"[\w'&-]+")
+SENTENCE_END = '.!?:;"'
+HONORIFICS = frozenset(['dr', 'mr', 'mrs', 'ms', 'prof', 'sir'])
+MAX_ACRONYM_LENGTH = 5
+
+
+class EntityExtractor:
+    """
+    Entity extraction from capitalization, n-grams and a gazetteer
+
+    Candidates are runs of capitalized words (leading stopwords trimmed)
+    plus case-insensitive matches of gazetteer phrases. A single capitalized
+    word at the start of a sentence is dropped when the same word also
+    appears in lowercase, since it is then most likely an ordinary word.
+    All-caps words longer than an acronym are treated as shouting. Results
+    are ranked by frequency, ties broken by first occurrence, so the output
+    is deterministic. Runs in linear time without a POS tagger.
+    """
+
+    def __init__(self, gazetteer=DEFAULT_GAZETTEER, stop_words=None):
+        self._stop_words = stop_words
+        self.gazetteer = {}
+        for name in gazetteer:
+            self.gazetteer.setdefault(tuple(WORD.findall(name.lower())), name)
+        self.max_ngram = max((len(key) for key in self.gazetteer), default=0)
+        self._first_words = {key[0] for key in self.gazetteer}
+
+    @cached_property
+    def stop_words(self):
+        """Run-splitting words: the given stop words (scikit-learn's by default) and honorifics"""
+        stop_words = self._stop_words
+        if stop_words is None:
+            from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS as stop_words
+        return frozenset(word.lower() for word in stop_words) | HONORIFICS
+
+    def extract(self, text, limit=10):
+        """
+        Extract entities from text
+
+        Args:
+            text: Input text
+            limit: Maximum number of entities to return
+
+        Returns:
+            List of entity strings, most frequent first
+        """
+        counts = Counter()
+        first_seen = {}
+        sentence_initial = []
+        lowercase_words = {word for word in WORD.findall(text) if word.islower()}
+
+        def add(entity, position):
+            counts[entity] += 1
+            first_seen.setdefault(entity, position)
+
+        for run in CAPITALIZED_RUN.finditer(text):
+            words = [(m.group(), m.start()) for m in CAPITALIZED_WORD.finditer(text, run.start(), run.end())]
+            for group in self._split_run(words, lowercase_words):
+                entity = ' '.join(word for word, _ in group)
+                position = group[0][1]
+                if self._gazetteer_name(entity.split()) is not None:
+                    continue  # counted by the gazetteer pass
+                if len(group) == 1 and self._starts_sentence(text, position):
+                    sentence_initial.append((entity, position))
+                else:
+                    add(entity, position)
+
+        # A lone capitalized word opening a sentence only counts if the word
+        # is also capitalized mid-sentence somewhere, so it is not just "The"
+        for entity, position in sentence_initial:
+            if entity in counts:
+                add(entity, position)
+
+        if self.gazetteer:
+            tokens = [(m.group(), m.start()) for m in WORD.finditer(text)]
+            words = [word for word, _ in tokens]
+            lowered = text.lower()
+            for i, (word, position) in enumerate(tokens):
+                if lowered[position:position + len(word)] not in self._first_words:
+                    continue
+                for n in range(min(self.max_ngram, len(words) - i), 0, -1):
+                    name = self._gazetteer_name(words[i:i + n])
+                    if name is not None:
+                        add(name, position)
+                        break
+
+        ranked = sorted(counts, key=lambda entity: (-counts[entity], first_seen[entity]))
+        return ranked[:limit]
+
+    def extract_batch(self, texts, limit=10):
+        """Extract entities from a list of texts"""
+        return [self.extract(text, limit) for text in texts]
+
+    def _gazetteer_name(self, words):
+        """Canonical gazetteer name for a word sequence; acronyms must match case"""
+        name = self.gazetteer.get(tuple(word.lower() for word in words))
+        if name is not None and name.isupper() and ' '.join(words) != name:
+            return None  # "who" is not the WHO
+        return name
+
+    def _split_run(self, words, lowercase_words):
+        """Split a capitalized run at stopwords, honorifics and shouted words"""
+        shouting = sum(word.isupper() and len(word) > 1 for word, _ in words) > 1
+        group = []
+        for word, position in words:
+            if word.lower() in self.stop_words or self._is_shouting(word, shouting, lowercase_words):
+                if group:
+                    yield group
+                group = []
+            else:
+                group.append((word, position))
+        if group:
+            yield group
+
+    @staticmethod
+    def _is_shouting(word, in_shouted_run, lowercase_words):
+        """All-caps words are acronyms unless long, next to other caps, or ordinary words"""
+        if not word.isupper() or len(word) == 1:
+            return False
+        return len(word) > MAX_ACRONYM_LENGTH or in_shouted_run or word.lower() in lowercase_words
+
+    @staticmethod
+    def _starts_sentence(text, position):
+        preceding = text[max(0, position - 80):position].rstrip()
+        return not preceding or preceding[-1] in SENTENCE_END
@@ -0,0 +1,90 @@
+"""Local NLTK data bundle, built once at deploy time and never downloaded at runtime
+
+Build the bundle with:
+
+    python -m src.utils.resources [target_dir]
+"""
+
+import os
+import sys
+
+from src.config import NLTK_DATA_DIR
+
+# NLTK download id -> resource path, for the data the analysis stages use
+NLTK_RESOURCES = {
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+    'wordnet': 'corpora/wordnet'
+}
+
+_nltk = None
+
+
+def nltk_data_paths():
+    """Directories searched for NLTK data: the bundle first, then NLTK's defaults"""
+    paths = [NLTK_DATA_DIR]
+    paths += [path for path in os.getenv('NLTK_DATA', '').split(os.pathsep) if path]
+    paths += [os.path.expanduser('~/nltk_data')]
+    paths += [os.path.join(sys.prefix, sub) for sub in ('nltk_data', 'share/nltk_data', 'lib/nltk_data')]
+    paths += ['/usr/share/nltk_data', '/usr/local/share/nltk_data', '/usr/lib/nltk_data', '/usr/local/lib/nltk_data']
+    return paths
+
+
+def missing_nltk_resources(resources=None):
+    """
+    Check for NLTK data on disk without importing NLTK
+
+    Args:
+        resources: Download ids to check (defaults to all of NLTK_RESOURCES)
+
+    Returns:
+        List of download ids found in none of nltk_data_paths()
+    """
+    paths = nltk_data_paths()
+    missing = []
+    for name in resources or NLTK_RESOURCES:
+        resource = NLTK_RESOURCES[name]
+        if not any(os.path.exists(os.path.join(path, resource)) or
+                   os.path.exists(os.path.join(path, f'{resource}.zip')) for path in paths):
+            missing.append(name)
+    return missing
+
+
+def load_nltk():
+    """
+    Import NLTK on first use, with the bundle directory first on its data path
+
+    NLTK never downloads anything from here; missing data raises NLTK's
+    LookupError at the call that needs it.
+    """
+    global _nltk
+    if _nltk is None:
+        import nltk
+        if NLTK_DATA_DIR not in nltk.data.path:
+            nltk.data.path.insert(0, NLTK_DATA_DIR)
+        _nltk = nltk
+    return _nltk
+
+
+def download_nltk_data(target=None):
+    """
+    Download every NLTK_RESOURCES entry into target (a build step, not a runtime one)
+
+    Returns:
+        List of download ids that failed
+    """
+    import nltk
+
+    target = target or NLTK_DATA_DIR
+    os.makedirs(target, exist_ok=True)
+    return [name for name in NLTK_RESOURCES if not nltk.download(name, download_dir=target, quiet=True)]
+
+
+if __name__ == '__main__':
+    target = sys.argv[1] if len(sys.argv) > 1 else NLTK_DATA_DIR
+    failed = download_nltk_data(target)
+    if failed:
+        print(f"Failed to download NLTK data: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"NLTK data ready in {target}")
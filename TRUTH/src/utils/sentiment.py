@@ -0,0 +1,136 @@
+"""Pluggable sentiment scoring backends"""
+
+import numpy as np
+
+NEGATIONS = ('no', 'not', 'never')
+
+
+def sentiment_label(polarity):
+    """Map a polarity in [-1, 1] to positive/negative/neutral"""
+    return 'positive' if polarity > 0.1 else 'negative' if polarity < -0.1 else 'neutral'
+
+
+class TextBlobSentiment:
+    """TextBlob (pattern) sentiment, the reference backend"""
+
+    name = 'textblob'
+
+    def score(self, text):
+        """Return (polarity, subjectivity) for a text or Document"""
+        if hasattr(text, 'blob'):
+            blob = text.blob
+        else:
+            from textblob import TextBlob
+            blob = TextBlob(text)
+        sentiment = blob.sentiment
+        return sentiment.polarity, sentiment.subjectivity
+
+    def score_batch(self, texts):
+        """Return a list of (polarity, subjectivity) pairs"""
+        return [self.score(text) for text in texts]
+
+
+class LexiconSentiment:
+    """
+    Vectorized lexicon sentiment scorer
+
+    Uses TextBlob's own word lexicon, precomputed into per-term polarity and
+    subjectivity arrays. A batch of texts becomes one sparse document-term
+    matrix, and every score comes from a single sparse-dense product:
+    polarity and subjectivity are the means over the lexicon words found,
+    as in TextBlob. "not/no/never <word>" bigrams carry TextBlob's negation
+    adjustment (polarity * -0.5). Intensifiers, exclamation boosts and
+    emoticons are not modelled, so scores approximate TextBlob rather than
+    match it; see sentiment_agreement().
+    """
+
+    name = 'lexicon'
+
+    def __init__(self):
+        self._vectorizer = None
+        self._weights = None
+
+    def _build(self):
+        from sklearn.feature_extraction.text import CountVectorizer
+        from textblob.en import sentiment as lexicon
+
+        lexicon.load()
+        words = sorted(w for w in lexicon if ' ' not in w and None in lexicon[w])
+        scores = np.array([lexicon[w][None][:2] for w in words], dtype=np.float64)
+
+        terms = list(words)
+        polarity = list(scores[:, 0])
+        subjectivity = list(scores[:, 1])
+        count = [1.0] * len(words)
+
+        # Negated words: add the difference between the negated and plain polarity
+        for negation in NEGATIONS:
+            for word, (p, _) in zip(words, scores):
+                if p:
+                    terms.append(f'{negation} {word}')
+                    polarity.append(p * -0.5 - p)
+                    subjectivity.append(0.0)
+                    count.append(0.0)
+
+        self._vectorizer = CountVectorizer(
+            vocabulary={term: i for i, term in enumerate(terms)},
+            ngram_range=(1, 2),
+            token_pattern=r"(?u)\b\w(?:[\w-]*\w)?\b",
+            dtype=np.float64
+        )
+        self._weights = np.column_stack([polarity, subjectivity, count])
+
+    def score_batch(self, texts):
+        """Return a list of (polarity, subjectivity) pairs"""
+        if self._vectorizer is None:
+            self._build()
+        X = self._vectorizer.transform([str(text) for text in texts])
+        totals = np.asarray(X @ self._weights)
+        matched = np.maximum(totals[:, 2], 1)
+        polarity = np.clip(totals[:, 0] / matched, -1.0, 1.0)
+        subjectivity = np.clip(totals[:, 1] / matched, 0.0, 1.0)
+        return list(zip(polarity.tolist(), subjectivity.tolist()))
+
+    def score(self, text):
+        """Return (polarity, subjectivity) for a text or Document"""
+        return self.score_batch([text])[0]
+
+
+SENTIMENT_BACKENDS = {
+    TextBlobSentiment.name: TextBlobSentiment,
+    LexiconSentiment.name: LexiconSentiment
+}
+
+
+def get_sentiment_backend(name):
+    """Instantiate a sentiment backend by name ('textblob' or 'lexicon')"""
+    try:
+        return SENTIMENT_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown sentiment backend: {name}") from None
+
+
+def sentiment_agreement(texts, backend, reference=None):
+    """
+    Compare a backend's scores with a reference backend (TextBlob by default)
+
+    Returns:
+        Dictionary with label agreement, polarity/subjectivity mean absolute
+        error and polarity correlation
+    """
+    reference = reference or TextBlobSentiment()
+    expected = np.array(reference.score_batch(texts))
+    actual = np.array(backend.score_batch(texts))
+
+    labels_match = [sentiment_label(a) == sentiment_label(e) for a, e in zip(actual[:, 0], expected[:, 0])]
+    if np.std(actual[:, 0]) and np.std(expected[:, 0]):
+        correlation = float(np.corrcoef(actual[:, 0], expected[:, 0])[0, 1])
+    else:
+        correlation = None
+    return {
+        'documents': len(texts),
+        'label_agreement': float(np.mean(labels_match)),
+        'polarity_mae': float(np.mean(np.abs(actual[:, 0] - expected[:, 0]))),
+        'subjectivity_mae': float(np.mean(np.abs(actual[:, 1] - expected[:, 1]))),
+        'polarity_correlation': correlation
+    }
@@ -2,46 +2,209 @@
 
 import re
 import string
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from textblob import TextBlob
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import islice
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+from src.config import CLEAN_CHUNK_SIZE, CLEAN_WORKERS, ENTITY_EXTRACTOR, SENTIMENT_BACKEND
+from src.utils.entities import EntityExtractor
+from src.utils.lexicon import LanguagePatternScanner
+from src.utils.resources import load_nltk
+from src.utils.sentiment import get_sentiment_backend, sentiment_label
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# NLTK and TextBlob are imported on first use (see src.utils.resources), so
+# importing this module stays cheap and never touches the network
+
+# clean_text patterns, compiled once
+URL_PATTERN = re.compile(r'http\S+|www\S+|https\S+', flags=re.MULTILINE)
+EMAIL_PATTERN = re.compile(r'\S+@\S+')
+KEPT_CHARACTERS = string.ascii_letters + string.digits + " "
+
+_NON_SPACE_RUN = re.compile(r'\S*')
+_DROPPED_BYTES = bytes(b for b in range(128) if chr(b) not in KEPT_CHARACTERS)
+
+# Joins texts for batch cleaning: whitespace (so no URL/email match crosses
+# it), ASCII (so it survives the character filter) and never in real text
+_SEPARATOR = '\x1e'
+_DROPPED_BYTES_BATCH = _DROPPED_BYTES.replace(_SEPARATOR.encode('ascii'), b'')
+
+
+def _remove_urls(text):
+    """URL_PATTERN.sub('', text), jumping between 'http'/'www' with str.find"""
+    pieces, last, pos = [], 0, 0
+    http, www = text.find('http'), text.find('www')
+    while True:
+        # Re-search only when the scan has moved past a cached hit
+        if http != -1 and http < pos:
+            http = text.find('http', pos)
+        if www != -1 and www < pos:
+            www = text.find('www', pos)
+        if http == -1 and www == -1:
+            break
+        start = www if http == -1 or (www != -1 and www < http) else http
+        prefix_end = start + (4 if start == http else 3)
+        end = _NON_SPACE_RUN.match(text, prefix_end).end()
+        if end > prefix_end:
+            pieces.append(text[last:start])
+            last = pos = end
+        else:
+            pos = start + 1
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+
+def _remove_emails(text):
+    """
+    EMAIL_PATTERN.sub('', text), jumping between '@' signs with str.find
+    
+    A non-whitespace run is removed whole when it contains an '@' with a
+    non-whitespace character on each side, which is what the regex removes.
+    """
+    at = text.find('@')
+    if at == -1:
+        return text
+    
+    reversed_text = text[::-1]
+    pieces, last = [], 0
+    while at != -1:
+        run_start = len(text) - _NON_SPACE_RUN.match(reversed_text, len(text) - at).end()
+        run_end = _NON_SPACE_RUN.match(text, at).end()
+        if '@' in text[run_start + 1:run_end - 1]:
+            pieces.append(text[last:run_start])
+            last = run_end
+        at = text.find('@', run_end)
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+
+def _clean(text):
+    text = _remove_emails(_remove_urls(text.lower()))
+    # Non-ASCII characters are never kept, so drop them before the byte-level filter
+    text = text.encode('ascii', 'ignore').translate(None, _DROPPED_BYTES).decode('ascii')
+    return ' '.join(text.split())
+
+
+def _clean_chunk(texts):
+    """Clean a list of texts in one pass over the joined chunk"""
+    if not texts:
+        return []
+    joined = _SEPARATOR.join(texts)
+    if joined.count(_SEPARATOR) != len(texts) - 1:
+        return [_clean(text) for text in texts]
+    
+    joined = _remove_emails(_remove_urls(joined.lower()))
+    joined = joined.encode('ascii', 'ignore').translate(None, _DROPPED_BYTES_BATCH).decode('ascii')
+    return [' '.join(part.split()) for part in joined.split(_SEPARATOR)]
+
+
+class Document:
+    """
+    Article text with lazily computed, cached views
+    
+    Every analysis stage accepts either a plain string or a Document. Passing
+    one Document through a whole analysis computes each view (lowercased
+    text, cleaned text, tokens, sentences, TextBlob, POS tags) at most once
+    instead of once per stage.
+    """
+    
+    _default_preprocessor = None
+    
+    def __init__(self, text, preprocessor=None):
+        self.text = text
+        self._preprocessor = preprocessor
+    
+    @classmethod
+    def of(cls, text):
+        """Return text unchanged if it is a Document, else wrap it"""
+        return text if isinstance(text, cls) else cls(text)
+    
+    @property
+    def preprocessor(self):
+        if self._preprocessor is None:
+            if Document._default_preprocessor is None:
+                Document._default_preprocessor = TextPreprocessor()
+            self._preprocessor = Document._default_preprocessor
+        return self._preprocessor
+    
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+    
+    @cached_property
+    def cleaned(self):
+        return self.preprocessor.clean_text(self.text)
+    
+    @cached_property
+    def tokens(self):
+        return load_nltk().word_tokenize(self.lower)
+    
+    @cached_property
+    def sentences(self):
+        return load_nltk().sent_tokenize(self.text)
+    
+    @cached_property
+    def segments(self):
+        """Raw '.'-delimited segments, the fact checker's claim candidates"""
+        return self.text.split('.')
+    
+    @cached_property
+    def blob(self):
+        load_nltk()
+        from textblob import TextBlob
+        return TextBlob(self.text)
+    
+    @cached_property
+    def tags(self):
+        return self.blob.tags
+    
+    def __str__(self):
+        return self.text
 
 
 class TextPreprocessor:
     """Handles text preprocessing and normalization"""
     
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+    @cached_property
+    def stop_words(self):
+        return set(load_nltk().corpus.stopwords.words('english'))
     
     def clean_text(self, text):
-        """Clean and normalize text"""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        # Remove special characters except spaces
-        text = re.sub(f'[^{re.escape(string.ascii_letters + string.digits + " ")}]', '', text)
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        """
+        Clean and normalize text
+        
+        Lowercases, removes URLs and email addresses, keeps only ASCII
+        letters, digits and spaces, and collapses whitespace.
+        """
+        return _clean(text)
+    
+    def clean_texts(self, texts, workers=None, chunk_size=None):
+        """
+        Clean many texts; output is identical to calling clean_text on each
+        
+        Args:
+            texts: Iterable of texts
+            workers: Processes to clean chunks in (defaults to CLEAN_WORKERS;
+                1 cleans in this process)
+            chunk_size: Texts per chunk (defaults to CLEAN_CHUNK_SIZE)
+            
+        Returns:
+            List of cleaned texts, in input order
+        """
+        workers = workers or CLEAN_WORKERS
+        chunk_size = chunk_size or CLEAN_CHUNK_SIZE
+        texts = iter(texts)
+        chunks = iter(lambda: list(islice(texts, chunk_size)), [])
+        
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                cleaned = pool.map(_clean_chunk, chunks)
+                return [text for chunk in cleaned for text in chunk]
+        return [text for chunk in chunks for text in _clean_chunk(chunk)]
     
     def tokenize_text(self, text):
         """Tokenize text into words"""
-        return word_tokenize(text.lower())
+        return load_nltk().word_tokenize(text.lower())
     
     def remove_stopwords(self, tokens):
         """Remove common stopwords"""
@@ -49,12 +212,13 @@ class TextPreprocessor:
     
     def get_sentences(self, text):
         """Extract sentences from text"""
-        return sent_tokenize(text)
+        return load_nltk().sent_tokenize(text)
     
     def calculate_statistics(self, text):
         """Calculate text statistics"""
-        words = self.tokenize_text(text)
-        sentences = self.get_sentences(text)
+        doc = Document.of(text)
+        words = doc.tokens
+        sentences = doc.sentences
         
         return {
             'word_count': len(words),
@@ -68,36 +232,72 @@ class TextPreprocessor:
 class TextAnalyzer:
     """Analyze text for linguistic patterns"""
     
+    # Shared one-pass pattern scanner; replace it to use custom lexicons
+    pattern_scanner = LanguagePatternScanner()
+    
+    # Sentiment scorer (TextBlob by default, see src.utils.sentiment)
+    sentiment_backend = get_sentiment_backend(SENTIMENT_BACKEND)
+    
+    # Rule-based extractor for extract_entities(method='fast'); replace to change the gazetteer
+    entity_extractor = EntityExtractor()
+    
     @staticmethod
     def get_sentiment(text):
-        """Analyze sentiment using TextBlob"""
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity  # -1 to 1
-        subjectivity = blob.sentiment.subjectivity  # 0 to 1
-        
+        """Analyze sentiment with the configured backend (TextBlob by default)"""
+        polarity, subjectivity = TextAnalyzer.sentiment_backend.score(Document.of(text))
+        return TextAnalyzer._sentiment_result(polarity, subjectivity)
+    
+    @staticmethod
+    def get_sentiment_batch(texts):
+        """Analyze sentiment for a list of texts or Documents"""
+        scores = TextAnalyzer.sentiment_backend.score_batch([Document.of(text) for text in texts])
+        return [TextAnalyzer._sentiment_result(polarity, subjectivity) for polarity, subjectivity in scores]
+    
+    @staticmethod
+    def _sentiment_result(polarity, subjectivity):
         return {
-            'polarity': polarity,
-            'subjectivity': subjectivity,
-            'sentiment': 'positive' if polarity > 0.1 else 'negative' if polarity < -0.1 else 'neutral'
+            'polarity': polarity,  # -1 to 1
+            'subjectivity': subjectivity,  # 0 to 1
+            'sentiment': sentiment_label(polarity)
         }
     
     @staticmethod
     def analyze_language_patterns(text):
         """Analyze language patterns that may indicate fake news"""
-        patterns = {
-            'exclamation_count': text.count('!'),
-            'question_count': text.count('?'),
-            'caps_percentage': sum(1 for c in text if c.isupper()) / len(text) * 100 if text else 0,
-            'quotation_count': text.count('"'),
-            'has_sources': text.lower().count('according to') + text.lower().count('said') + text.lower().count('reported'),
-            'sensational_words': sum(1 for word in ['shocking', 'amazing', 'incredible', 'unbelievable', 'devastating'] 
-                                      if word in text.lower())
-        }
-        return patterns
+        doc = Document.of(text)
+        return TextAnalyzer.pattern_scanner.scan(doc.text, doc.lower)
+    
+    @staticmethod
+    def analyze_language_patterns_batch(texts):
+        """Analyze language patterns for a list of texts or Documents"""
+        return [TextAnalyzer.analyze_language_patterns(text) for text in texts]
+    
+    @staticmethod
+    def extract_entities(text, method=None, limit=10):
+        """
+        Extract key entities from text
+        
+        Args:
+            text: Input text or Document
+            method: 'tagger' (nouns from TextBlob's POS tagger) or 'fast'
+                (capitalization/gazetteer rules, no tagger); defaults to
+                ENTITY_EXTRACTOR
+            limit: Maximum number of entities
+            
+        Returns:
+            List of entities, most frequent first (ties in order of appearance)
+        """
+        method = method or ENTITY_EXTRACTOR
+        doc = Document.of(text)
+        if method == 'fast':
+            return TextAnalyzer.entity_extractor.extract(doc.text, limit)
+        if method != 'tagger':
+            raise ValueError(f"Unknown entity extraction method: {method}")
+        
+        nouns = Counter(word for (word, tag) in doc.tags if tag.startswith('NN'))
+        return [noun for noun, _ in nouns.most_common(limit)]  # Counter keeps first-seen order on ties
     
     @staticmethod
-    def extract_entities(text):
-        """Extract key entities from text"""
-        blob = TextBlob(text)
-        nouns = [word for (word, tag) in blob.tags if tag.startswith('NN')]
-        return list(set(nouns))[:10]  # Return top 10 unique nouns
+    def extract_entities_batch(texts, method=None, limit=10):
+        """Extract entities from a list of texts or Documents"""
+        return [TextAnalyzer.extract_entities(text, method, limit) for text in texts]
@@ -76,6 +76,251 @@ def test_text_processor():
         return False
 
 
+def test_clean_texts():
+    """Property test: clean_text/clean_texts match the reference cleaning"""
+    print("\n" + "="*60)
+    print("Testing Batch Text Cleaning...")
+    print("="*60)
+    
+    try:
+        import random
+        import re
+        import string
+        from src.utils.text_processor import TextPreprocessor
+        
+        def reference(text):
+            text = text.lower()
+            text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+            text = re.sub(r'\S+@\S+', '', text)
+            text = re.sub(f'[^{re.escape(string.ascii_letters + string.digits + " ")}]', '', text)
+            return re.sub(r'\s+', ' ', text).strip()
+        
+        # Random texts built from URL, email, whitespace, Unicode and case edge cases
+        rng = random.Random(13)
+        pieces = ['http', 'https://a.io/x?y=1', 'www.', '@', 'a@b.c', 'News', 'WORD', '42', ' ', '  ',
+                  '\t', '\n', '\x1c', '\x1e', '\xa0', '\u2028', 'İ', 'Σ', 'ß', 'É', '\u212a', '.', '!', '"', '😀']
+        texts = [''.join(rng.choice(pieces) for _ in range(rng.randint(0, 20))) for _ in range(5000)]
+        expected = [reference(text) for text in texts]
+        
+        preprocessor = TextPreprocessor()
+        assert [preprocessor.clean_text(text) for text in texts] == expected, "clean_text differs"
+        print("✓ clean_text is byte-identical to the reference")
+        
+        assert preprocessor.clean_texts(texts, chunk_size=97) == expected, "clean_texts differs"
+        assert preprocessor.clean_texts(iter(texts), workers=2, chunk_size=500) == expected, \
+            "Parallel clean_texts differs"
+        assert preprocessor.clean_texts([]) == []
+        print("✓ clean_texts is byte-identical, serial and parallel")
+        
+        print("\n✓ Batch text cleaning tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Batch text cleaning test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_document():
+    """Test the shared Document gives the same results as raw strings"""
+    print("\n" + "="*60)
+    print("Testing Shared Document...")
+    print("="*60)
+    
+    try:
+        from src.models.fact_checker import FactChecker
+        from src.utils.text_processor import Document, TextAnalyzer, TextPreprocessor
+        from data.sample_articles import get_sample_articles
+        
+        text = get_sample_articles()[0]['content']
+        doc = Document(text)
+        assert doc.cleaned is doc.cleaned and doc.blob is doc.blob, "Views are not cached"
+        assert doc.cleaned == TextPreprocessor().clean_text(text), "Cleaned text differs"
+        print("✓ Document views are computed once and cached")
+        
+        assert TextAnalyzer.get_sentiment(doc) == TextAnalyzer.get_sentiment(text)
+        assert TextAnalyzer.analyze_language_patterns(doc) == TextAnalyzer.analyze_language_patterns(text)
+        checker = FactChecker()
+        assert checker.get_fact_check_score(doc) == checker.get_fact_check_score(text)
+        print("✓ Stages return identical results for strings and Documents")
+        
+        print("\n✓ Shared Document tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Shared Document test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_pattern_scanner():
+    """Test the lexicon scanner against per-feature counting"""
+    print("\n" + "="*60)
+    print("Testing Pattern Scanner...")
+    print("="*60)
+    
+    try:
+        from src.utils.lexicon import LanguagePatternScanner
+        from src.utils.text_processor import TextAnalyzer
+        from data.sample_articles import get_sample_articles
+        
+        def reference(text):
+            lower = text.lower()
+            return {
+                'exclamation_count': text.count('!'),
+                'question_count': text.count('?'),
+                'caps_percentage': sum(1 for c in text if c.isupper()) / len(text) * 100 if text else 0,
+                'quotation_count': text.count('"'),
+                'has_sources': lower.count('according to') + lower.count('said') + lower.count('reported'),
+                'sensational_words': sum(1 for word in ['shocking', 'amazing', 'incredible',
+                                                        'unbelievable', 'devastating'] if word in lower)
+            }
+        
+        texts = [a['content'] for a in get_sample_articles()] + [
+            "", "SHOCKING!!! Officials SAID it was \"amazing\"?", "Ünbelievable: Éxperts reported... saidsaid"
+        ]
+        automaton = LanguagePatternScanner(automaton_min_phrases=0)
+        for text in texts:
+            expected = reference(text)
+            assert TextAnalyzer.analyze_language_patterns(text) == expected, f"Mismatch for {text[:30]!r}"
+            assert automaton.scan(text) == expected, f"Automaton mismatch for {text[:30]!r}"
+        assert TextAnalyzer.analyze_language_patterns_batch(texts) == [reference(t) for t in texts]
+        print("✓ Scanner matches per-feature counting (count and automaton paths)")
+        
+        scanner = LanguagePatternScanner(sensational_words=['ab', 'b'], attribution_phrases=['aa', 'aba', 'aa'],
+                                         automaton_min_phrases=0)
+        features = scanner.scan("aaaabab")
+        assert features['has_sources'] == 2 * "aaaabab".count('aa') + "aaaabab".count('aba')
+        assert features['sensational_words'] == 2
+        print("✓ Custom lexicons follow str.count semantics")
+        
+        print("\n✓ Pattern scanner tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Pattern scanner test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_sentiment_backends():
+    """Test the lexicon sentiment backend against TextBlob"""
+    print("\n" + "="*60)
+    print("Testing Sentiment Backends...")
+    print("="*60)
+    
+    try:
+        from src.utils.sentiment import (
+            LexiconSentiment, TextBlobSentiment, get_sentiment_backend, sentiment_agreement
+        )
+        from src.utils.text_processor import TextAnalyzer
+        from data.sample_articles import get_sample_articles
+        
+        texts = [a['content'] for a in get_sample_articles()] + [a['title'] for a in get_sample_articles()]
+        lexicon = LexiconSentiment()
+        scores = lexicon.score_batch(texts)
+        assert scores == [lexicon.score(text) for text in texts], "Batch and single scores differ"
+        assert all(-1 <= p <= 1 and 0 <= s <= 1 for p, s in scores), "Scores out of range"
+        assert lexicon.score("This is not good") < lexicon.score("This is good"), "Negation ignored"
+        print("✓ Lexicon backend scores batches with NumPy")
+        
+        report = sentiment_agreement(texts, lexicon)
+        assert report['label_agreement'] >= 0.75 and report['polarity_correlation'] > 0.9, report
+        print(f"✓ Agrees with TextBlob on {report['label_agreement']:.0%} of sample labels "
+              f"(polarity r={report['polarity_correlation']:.2f})")
+        
+        original = TextAnalyzer.sentiment_backend
+        try:
+            TextAnalyzer.sentiment_backend = lexicon
+            result = TextAnalyzer.get_sentiment(texts[0])
+            assert set(result) == {'polarity', 'subjectivity', 'sentiment'}, "Result shape changed"
+            assert TextAnalyzer.get_sentiment_batch(texts[:2])[0] == result
+        finally:
+            TextAnalyzer.sentiment_backend = original
+        assert isinstance(get_sentiment_backend('textblob'), TextBlobSentiment)
+        print("✓ Backends are pluggable with the same result shape")
+        
+        print("\n✓ Sentiment backend tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Sentiment backend test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_entity_extraction():
+    """Test the fast rule-based entity extractor"""
+    print("\n" + "="*60)
+    print("Testing Entity Extraction...")
+    print("="*60)
+    
+    try:
+        from src.utils.entities import EntityExtractor
+        from src.utils.text_processor import Document, TextAnalyzer
+        
+        text = ("The World Health Organization met John Smith in New York. Experts who attended "
+                "said John Smith spoke twice. WHO officials agreed. BREAKING NEWS: The CDC warns.")
+        entities = TextAnalyzer.extract_entities(text, method='fast')
+        assert entities[0] == 'John Smith', "Entities not ranked by frequency"
+        for expected in ('World Health Organization', 'WHO', 'New York', 'CDC'):
+            assert expected in entities, f"Missing {expected}"
+        assert not {'The', 'Experts', 'BREAKING', 'NEWS'} & set(entities), "Noise not filtered"
+        print("✓ Capitalized runs, gazetteer names and acronyms are extracted")
+        
+        assert TextAnalyzer.extract_entities(Document(text), method='fast') == entities, "Not deterministic"
+        assert TextAnalyzer.extract_entities_batch([text, "Nothing here."], method='fast') == [entities, []]
+        assert EntityExtractor(gazetteer=['Experts Panel']).extract("Experts Panel met.") == ['Experts Panel']
+        print("✓ Batch mode and custom gazetteers work")
+        
+        print("\n✓ Entity extraction tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Entity extraction test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_fast_start():
+    """Test lazy heavy imports and the local NLTK data bundle"""
+    print("\n" + "="*60)
+    print("Testing Fast Start...")
+    print("="*60)
+    
+    try:
+        import os
+        import subprocess
+        import tempfile
+        from src.utils import resources
+        
+        probe = ("import sys, src.utils, src.models, src.utils.text_processor, src.models.fact_checker; "
+                 "print(','.join(m for m in ('nltk', 'textblob', 'sklearn') if m in sys.modules))")
+        loaded = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True)
+        assert loaded.stdout.strip() == '', f"Imported at startup: {loaded.stdout.strip()}"
+        print("✓ Text processing imports without NLTK, TextBlob or scikit-learn")
+        
+        with tempfile.TemporaryDirectory() as bundle:
+            os.makedirs(os.path.join(bundle, 'corpora', 'stopwords'))
+            original = resources.NLTK_DATA_DIR
+            resources.NLTK_DATA_DIR = bundle
+            try:
+                assert resources.nltk_data_paths()[0] == bundle, "Bundle directory not searched first"
+                assert resources.missing_nltk_resources(['stopwords']) == [], "Bundled resource not found"
+            finally:
+                resources.NLTK_DATA_DIR = original
+        nltk = resources.load_nltk()
+        assert nltk.data.path[0] == resources.NLTK_DATA_DIR, "Bundle not first on the NLTK data path"
+        print("✓ Bundle directory is searched first, without downloading")
+        
+        from src.models import FactChecker
+        from src.utils import LRUCache
+        assert FactChecker.__name__ == 'FactChecker' and LRUCache.__name__ == 'LRUCache'
+        print("✓ Package exports resolve on first access")
+        
+        print("\n✓ Fast start tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Fast start test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
 def test_models():
     """Test model functionality"""
     print("\n" + "="*60)
@@ -114,6 +359,1161 @@ def test_models():
         return False
 
 
+def test_detector_batch():
+    """Test vectorized batch prediction against single predictions"""
+    print("\n" + "="*60)
+    print("Testing Detector Batch Prediction...")
+    print("="*60)
+    
+    try:
+        from src.models.detector import FakeNewsDetector
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [a['content'] for a in articles]
+        labels = [0 if a['is_fake'] else 1 for a in articles]
+        
+        detector = FakeNewsDetector().train(texts, labels)
+        detector.cache.maxsize = 0  # every path computes its own probabilities
+        
+        single = [detector.predict(text) for text in texts]
+        batched = detector.predict_batch(texts, batch_size=3)
+        assert batched == single, "Batch predictions differ from single predictions"
+        print("✓ Chunked batch predictions match single predictions")
+        
+        streamed = list(detector.iter_predict_batch(iter(texts), batch_size=1))
+        assert streamed == single, "Streaming predictions differ from single predictions"
+        assert detector.cache.stats()['hits'] == 0, "Predictions were served from the cache"
+        print("✓ Streaming batch predictions work")
+        
+        print("\n✓ Detector batch tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Detector batch test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_micro_batcher():
+    """Test that concurrent predictions are coalesced into batches"""
+    print("\n" + "="*60)
+    print("Testing Micro-Batcher...")
+    print("="*60)
+    
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        from src.models.detector import FakeNewsDetector
+        from src.models.batcher import MicroBatcher
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [a['content'] for a in articles]
+        labels = [0 if a['is_fake'] else 1 for a in articles]
+        detector = FakeNewsDetector().train(texts, labels)
+        detector.cache.maxsize = 0  # every path computes its own probabilities
+        
+        batcher = MicroBatcher(detector, max_batch_size=8, max_wait_ms=50)
+        requests_ = texts * 4
+        with ThreadPoolExecutor(max_workers=len(requests_)) as pool:
+            results = list(pool.map(batcher.predict, requests_))
+        
+        assert results == [detector.predict(t) for t in requests_], "Batched results differ"
+        print("✓ Micro-batched results match direct predictions")
+        
+        stats = batcher.stats()
+        assert stats['requests'] == len(requests_), "Stats missed requests"
+        assert stats['max_batch_size'] > 1, "Requests were not coalesced"
+        print(f"✓ Coalesced {stats['requests']} requests into {stats['batches']} batches")
+        
+        slow = MicroBatcher(detector, max_batch_size=8, max_wait_ms=200)
+        cancelled = slow.submit(texts[0])
+        assert cancelled.cancel(), "Queued request could not be cancelled"
+        assert slow.submit(texts[1]).result(timeout=10) == detector.predict(texts[1]), "Prediction after a cancel failed"
+        assert slow._worker.is_alive(), "Worker thread died after a cancelled request"
+        print("✓ Cancelled requests are skipped without stopping the worker")
+        
+        print("\n✓ Micro-batcher tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Micro-batcher test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_streaming_training():
+    """Test out-of-core training from a generator and model round-trip"""
+    print("\n" + "="*60)
+    print("Testing Streaming Training...")
+    print("="*60)
+    
+    try:
+        import os
+        import tempfile
+        from src.models.detector import FakeNewsDetector
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        samples = ((a['content'], 0 if a['is_fake'] else 1) for a in articles * 5)
+        
+        detector = FakeNewsDetector().train_streaming(samples, batch_size=3, n_features=2 ** 12)
+        result = detector.predict(articles[0]['content'])
+        assert result['prediction'] in ('real', 'fake'), "Streaming model prediction failed"
+        print("✓ Streaming training from a generator works")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'streaming.pkl')
+            detector.save_model(path)
+            loaded = FakeNewsDetector()
+            assert loaded.load_model(path), "Streaming model failed to load"
+            assert loaded.predict(articles[0]['content']) == result, "Loaded model predicts differently"
+        print("✓ Streaming model saves and loads")
+        
+        print("\n✓ Streaming training tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Streaming training test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_mapped_artifact():
+    """Test memory-mapped model artifacts and the pickle fallback"""
+    print("\n" + "="*60)
+    print("Testing Mapped Model Artifacts...")
+    print("="*60)
+    
+    try:
+        import os
+        import tempfile
+        import numpy as np
+        from src.models.detector import FakeNewsDetector
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [a['content'] for a in articles]
+        labels = [0 if a['is_fake'] else 1 for a in articles]
+        detector = FakeNewsDetector().train(texts, labels)
+        expected = detector.predict_batch(texts)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            mapped_path = os.path.join(tmp, 'detector')
+            detector.save_model(mapped_path)
+            mapped = FakeNewsDetector()
+            assert mapped.load_model(mapped_path), "Mapped artifact failed to load"
+            assert isinstance(mapped.model.value, np.memmap), "Forest arrays are not memory-mapped"
+            assert all(isinstance(array, np.memmap) for array in mapped.model.walk_arrays()), \
+                "Forest walk arrays are not memory-mapped"
+            assert mapped.predict_batch(texts) == expected, "Mapped model predicts differently"
+            print("✓ Mapped artifact round-trip works")
+            
+            legacy_path = os.path.join(tmp, 'detector.pkl')
+            detector.save_model(legacy_path)
+            legacy = FakeNewsDetector()
+            legacy.model_path = os.path.join(tmp, 'missing')
+            legacy.legacy_model_path = legacy_path
+            assert legacy.load_model(), "Legacy pickle fallback failed"
+            assert legacy.predict_batch(texts) == expected, "Pickled model predicts differently"
+            print("✓ Legacy pickle fallback works")
+        
+        print("\n✓ Mapped artifact tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Mapped artifact test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_compiled_forest():
+    """Test that the compiled forest reproduces sklearn probabilities"""
+    print("\n" + "="*60)
+    print("Testing Compiled Forest...")
+    print("="*60)
+    
+    try:
+        import numpy as np
+        from src.models.detector import FakeNewsDetector
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [a['content'] for a in articles]
+        labels = [0 if a['is_fake'] else 1 for a in articles]
+        # Noisy variants give the forest more than one split to learn
+        texts += [f"{a['content']} {a['title']} update {i}" for i, a in enumerate(articles * 5)]
+        labels += [0 if a['is_fake'] else 1 for a in articles * 5]
+        
+        detector = FakeNewsDetector().train(texts, labels)
+        detector.compile_model()
+        detector.cache.maxsize = 0  # every path computes its own probabilities
+        
+        X = detector.vectorizer.transform([detector.preprocessor.clean_text(t) for t in texts])
+        expected = detector.model.predict_proba(X)
+        assert np.allclose(detector.compiled_model.predict_proba(X), expected, rtol=0, atol=1e-12), \
+            "Compiled batch probabilities differ from sklearn"
+        for i in range(X.shape[0]):
+            assert np.allclose(detector.compiled_model.predict_proba(X[i]), expected[i], rtol=0, atol=1e-12), \
+                "Compiled single-row probabilities differ from sklearn"
+        print("✓ Compiled probabilities match sklearn")
+        
+        assert [detector.predict(t) for t in texts] == detector.predict_batch(texts), \
+            "Compiled single predictions differ from batch predictions"
+        print("✓ Compiled single predictions match batch predictions")
+        
+        print("\n✓ Compiled forest tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Compiled forest test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_prediction_cache():
+    """Test the content-hash prediction cache and its invalidation"""
+    print("\n" + "="*60)
+    print("Testing Prediction Cache...")
+    print("="*60)
+    
+    try:
+        from src.models.detector import FakeNewsDetector
+        from src.utils.cache import LRUCache
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [a['content'] for a in articles]
+        labels = [0 if a['is_fake'] else 1 for a in articles]
+        detector = FakeNewsDetector().train(texts, labels)
+        
+        first = detector.predict(texts[0])
+        # Same cleaned text (case and punctuation differ) must hit the cache
+        assert detector.predict(texts[0].upper() + "!!!") == first, "Cached prediction differs"
+        assert detector.cache.hits == 1 and detector.cache.misses == 1, "Cache counters are wrong"
+        print("✓ Repeated content is served from the cache")
+        
+        detector.predict_batch(texts)
+        assert detector.cache.hits == 2, "Batch predictions do not use the cache"
+        print("✓ Batch predictions share the cache")
+        
+        version = detector.model_version
+        detector.train(texts, labels)
+        assert len(detector.cache) == 0, "Cache not cleared after retraining"
+        assert detector.model_version != version, "Model version not bumped after retraining"
+        print("✓ Cache is invalidated when the model changes")
+        
+        now = [0.0]
+        cache = LRUCache(2, ttl=10, clock=lambda: now[0])
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('b') is None and cache.get('a') == 1, "LRU eviction order is wrong"
+        now[0] = 11.0
+        assert cache.get('a') is None, "Expired entry was returned"
+        assert cache.stats()['evictions'] == 1 and cache.stats()['expirations'] == 1, "Cache stats are wrong"
+        print("✓ LRU eviction and TTL expiry work")
+        
+        print("\n✓ Prediction cache tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Prediction cache test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_model_registry():
+    """Test versioned publishing and hot swapping under concurrent reads"""
+    print("\n" + "="*60)
+    print("Testing Model Registry...")
+    print("="*60)
+    
+    try:
+        import os
+        import tempfile
+        import threading
+        import time
+        from src.models.detector import FakeNewsDetector
+        from src.models.registry import ModelRegistry
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [a['content'] for a in articles]
+        labels = [0 if a['is_fake'] else 1 for a in articles]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = ModelRegistry(tmp)
+            trainer = FakeNewsDetector()
+            registry.publish(trainer.train(texts, labels), 'v1')
+            registry.publish(trainer.train(texts, list(reversed(labels))), 'v2')
+            assert registry.versions() == ['v1', 'v2'], "Registry versions are wrong"
+            
+            serving = FakeNewsDetector()
+            serving.cache.maxsize = 0
+            registry.activate(serving, 'v1')
+            assert serving.model_version == 'v1', "Version not activated"
+            print("✓ Versions publish and activate")
+            
+            seen, errors = set(), []
+            stop = threading.Event()
+            
+            def reader():
+                while not stop.is_set():
+                    try:
+                        seen.add(serving.predict(texts[0])['model_version'])
+                    except Exception as e:
+                        errors.append(e)
+            
+            threads = [threading.Thread(target=reader) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for version in ['v2', 'v1', 'v2']:
+                registry.activate(serving, version)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            assert not errors, f"Readers failed during swaps: {errors[0]}"
+            assert seen <= {'v1', 'v2'}, "Readers saw an unknown version"
+            print("✓ Hot swaps are safe under concurrent predictions")
+            
+            follower = FakeNewsDetector()
+            assert ModelRegistry(tmp).sync(follower), "Follower did not pick up CURRENT"
+            assert follower.model_version == 'v2', "Follower loaded the wrong version"
+            registry.set_current('v1')
+            assert ModelRegistry(tmp).sync(follower) and follower.model_version == 'v1', \
+                "Follower did not follow CURRENT"
+            print("✓ Other workers follow the CURRENT version")
+            
+            def wait_for(version):
+                deadline = time.time() + 5
+                while follower.model_version != version and time.time() < deadline:
+                    time.sleep(0.02)
+                return follower.model_version == version
+            
+            watcher = ModelRegistry(tmp)
+            watcher.watch(follower, interval=0.05)
+            registry.set_current('v2')
+            assert wait_for('v2'), "Watcher did not hot-swap to CURRENT"
+            
+            pid = os.fork()
+            if pid == 0:
+                swapped = False
+                try:
+                    watcher.watch(follower, interval=0.05)
+                    registry.set_current('v1')
+                    swapped = wait_for('v1')
+                finally:
+                    os._exit(0 if swapped else 1)
+            _, status = os.waitpid(pid, 0)
+            watcher.stop_watching()
+            assert os.waitstatus_to_exitcode(status) == 0, "Forked worker did not restart the watcher"
+            print("✓ Watcher restarts in forked workers")
+        
+        print("\n✓ Model registry tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Model registry test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_incremental_update():
+    """Test warm-start forest updates with tree retirement"""
+    print("\n" + "="*60)
+    print("Testing Incremental Updates...")
+    print("="*60)
+    
+    try:
+        import os
+        import tempfile
+        import numpy as np
+        from src.models.artifact import PackedForest
+        from src.models.detector import FakeNewsDetector
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [a['content'] for a in articles]
+        labels = [0 if a['is_fake'] else 1 for a in articles]
+        
+        detector = FakeNewsDetector().train(texts, labels)
+        live_trees = detector.model.estimators_
+        version = detector.model_version
+        
+        report = detector.update(texts, labels, n_new_trees=10, eval_texts=texts, eval_labels=labels)
+        assert report['n_trees'] == 110 and report['trees_added'] == 10, "Trees were not added"
+        assert len(live_trees) == 100, "Previous model was mutated in place"
+        assert detector.model_version != version, "Model version not bumped after update"
+        assert 0.0 <= report['accuracy'] <= 1.0, "Update report is missing accuracy"
+        print("✓ Warm-start update adds trees to a copy of the forest")
+        
+        report = detector.update(texts, labels, n_new_trees=10, max_trees=50)
+        assert report['n_trees'] == 50 and report['trees_retired'] == 70, "Oldest trees were not retired"
+        assert len(detector.update_history) == 2, "Update history not recorded"
+        print("✓ Oldest trees are retired beyond max_trees")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            detector.save_model(os.path.join(tmp, 'detector'))
+            packed = FakeNewsDetector()
+            packed.load_model(os.path.join(tmp, 'detector'))
+            report = packed.update(texts, labels, n_new_trees=5, max_trees=50)
+        assert isinstance(packed.model, PackedForest) and report['n_trees'] == 50, \
+            "Packed forest update failed"
+        print("✓ Mapped (packed) forests can be updated")
+        
+        shallow = FakeNewsDetector().train(texts, labels, forest_params={'n_estimators': 10, 'max_depth': 2})
+        with tempfile.TemporaryDirectory() as tmp:
+            shallow.save_model(os.path.join(tmp, 'shallow'))
+            shallow.load_model(os.path.join(tmp, 'shallow'))
+        shallow.update(texts, labels, n_new_trees=5)
+        assert shallow.model.params['max_depth'] == 2 and np.diff(shallow.model.node_offsets).max() <= 7, \
+            "Trees added to a mapped forest ignore its forest_params"
+        report = shallow.update(texts, labels, n_new_trees=0, max_trees=12)
+        assert report['trees_added'] == 0 and report['n_trees'] == 12, "n_new_trees=0 was not respected"
+        print("✓ Updates reuse the forest's hyperparameters and honour n_new_trees=0")
+        
+        streaming = FakeNewsDetector().train_streaming(zip(texts, labels), batch_size=4, n_features=2 ** 12)
+        with tempfile.TemporaryDirectory() as tmp:
+            streaming.save_model(os.path.join(tmp, 'streaming'))
+            linear = FakeNewsDetector()
+            linear.load_model(os.path.join(tmp, 'streaming'))
+            linear.update(texts, labels)
+        streaming.update(texts, labels)
+        X = streaming.vectorizer.transform(texts)
+        assert np.allclose(linear.model.predict_proba(X), streaming.model.predict_proba(X)), \
+            "Mapped linear model update differs from the in-memory one"
+        print("✓ Mapped linear models resume partial_fit after loading")
+        
+        try:
+            detector.update(texts[:1], labels[:1])
+            raise AssertionError("Single-class update batch was accepted")
+        except ValueError:
+            pass
+        print("✓ Single-class update batches are rejected")
+        
+        print("\n✓ Incremental update tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Incremental update test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_compact_features():
+    """Test compact float32 / pruned-vocabulary training"""
+    print("\n" + "="*60)
+    print("Testing Compact Feature Mode...")
+    print("="*60)
+    
+    try:
+        import os
+        import tempfile
+        import numpy as np
+        from src.models.detector import FakeNewsDetector
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [f"{a['content']} {a['title']} update {i}" for i, a in enumerate(articles * 5)]
+        labels = [0 if a['is_fake'] else 1 for a in articles * 5]
+        
+        detector = FakeNewsDetector().train(texts, labels, compact_features=20)
+        X = detector.vectorizer.transform(texts)
+        assert len(detector.vectorizer.vocabulary_) <= 20, "Vocabulary was not pruned"
+        assert X.dtype == np.float32 and X.indices.dtype == np.int32, "Features are not compact"
+        print("✓ Pruned vocabulary emits float32/int32 features")
+        
+        detector.compile_model()
+        compiled = detector.compiled_model
+        assert compiled.threshold.dtype == np.float32, "Compiled thresholds are not float32"
+        expected = detector.model.predict_proba(X)
+        assert np.allclose(compiled.predict_proba(X), expected, atol=1e-6), \
+            "Compact forest probabilities differ from sklearn"
+        print("✓ Compact packed forest matches sklearn")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            detector.save_model(os.path.join(tmp, 'compact'))
+            loaded = FakeNewsDetector()
+            loaded.load_model(os.path.join(tmp, 'compact'))
+            assert loaded.model.threshold.dtype == np.float32, "Mapped artifact is not compact"
+            assert [r['label'] for r in loaded.predict_batch(texts)] == \
+                [r['label'] for r in detector.predict_batch(texts)], "Loaded compact model differs"
+        print("✓ Compact models round-trip through mapped artifacts")
+        
+        same = ["solar panels generate electricity"] * 4
+        degenerate = FakeNewsDetector().train(same, [0, 1, 0, 1], compact_features=20)
+        full = FakeNewsDetector().train(same, [0, 1, 0, 1])
+        assert degenerate.vectorizer.vocabulary_ == full.vectorizer.vocabulary_, "Vocabulary lost when no feature ranks"
+        assert degenerate.predict(same[0])['prediction'] in ('real', 'fake')
+        print("✓ Compact mode keeps the vocabulary when the forest never splits")
+        
+        print("\n✓ Compact feature tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Compact feature test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_hyperparameter_search():
+    """Test the cross-validation harness and its feature cache"""
+    print("\n" + "="*60)
+    print("Testing Hyperparameter Search...")
+    print("="*60)
+    
+    try:
+        import tempfile
+        from src.models.tuning import HyperparameterSearch
+        from data.sample_articles import get_sample_articles
+        
+        articles = get_sample_articles()
+        texts = [f"{a['content']} {a['title']} update {i}" for i, a in enumerate(articles * 4)]
+        labels = [0 if a['is_fake'] else 1 for a in articles * 4]
+        grid = {'vectorizer__max_features': [50, 500], 'forest__n_estimators': [5, 10]}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            search = HyperparameterSearch(cache_dir=tmp, n_splits=2, workers=2)
+            results = search.run(texts, labels, grid)
+            assert len(results) == 4, "Expected one result per configuration"
+            for key in ('accuracy', 'train_time', 'model_bytes', 'latency_ms'):
+                assert all(key in result for result in results), f"Missing {key}"
+            assert search.cache.built == 5, "Expected one cleaned corpus and 2x2 fold matrices"
+            print(f"✓ Cross-validated {len(results)} configurations")
+            
+            rerun = HyperparameterSearch(cache_dir=tmp, n_splits=2, workers=1)
+            rerun.run(texts, labels, grid)
+            assert rerun.cache.built == 0, "Cached features were rebuilt"
+            print("✓ Re-runs reuse the cached corpus and features")
+            
+            cheapest = HyperparameterSearch.cheapest(results, 0.0, cost='model_bytes')
+            assert cheapest['forest_params']['n_estimators'] == 5, "Cheapest config not selected"
+            assert HyperparameterSearch.cheapest(results, 1.1) is None
+            print("✓ Cheapest configuration selection works")
+        
+        print("\n✓ Hyperparameter search tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Hyperparameter search test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_claim_index():
+    """Test that the claim index returns the same verdicts as a full scan"""
+    print("\n" + "="*60)
+    print("Testing Claim Index...")
+    print("="*60)
+    
+    try:
+        import random
+        from src.models.fact_checker import FactChecker
+        
+        def scan(checker, claim):
+            lowered = claim.lower()
+            return next((fact_check['verdict'] for fact_check in checker.fact_check_db.values()
+                         if checker._match_claim(lowered, fact_check['claim'])), 'UNKNOWN')
+        
+        checker = FactChecker()
+        for claim in ("Vaccines cause autism in children", "Scientists say the earth is flat", "Nothing to see"):
+            assert checker.verify_claim(claim)['verdict'] == scan(checker, claim), f"Verdict changed: {claim}"
+        print("✓ Built-in fact-checks give the same verdicts")
+        
+        rng = random.Random(0)
+        words = ['cause', 'caused', 'is', 'this', 'a', 'vaccine', 'vaccines', 'flat', 'earth', 'the', '5g']
+        for i in range(300):
+            claim = ' '.join(rng.choices(words, k=rng.randint(1, 6)))
+            checker.add_fact_check(f'random_{i}', {
+                'claim': claim, 'verdict': str(i), 'confidence': 0.9, 'sources': [], 'explanation': ''
+            })
+        checker.fact_check_db['direct_edit'] = dict(checker.fact_check_db['random_0'], verdict='EDITED')
+        for _ in range(300):
+            claim = ' '.join(rng.choices(words + ['unrelated', 'thesis'], k=rng.randint(1, 10)))
+            assert checker.verify_claim(claim)['verdict'] == scan(checker, claim), f"Verdict changed: {claim}"
+        print("✓ Random databases, added and edited entries give the same verdicts")
+        
+        checker = FactChecker()
+        checker.verify_claim("the moon is cheese")
+        checker.fact_check_db['claim_flat_earth'] = dict(checker.fact_check_db['claim_flat_earth'], claim='Moon is cheese')
+        assert checker.verify_claim("the moon is cheese")['verdict'] == scan(checker, "the moon is cheese") == 'FALSE'
+        del checker.fact_check_db['claim_flat_earth']
+        assert checker.verify_claim("the moon is cheese")['verdict'] == 'UNKNOWN'
+        checker.fact_check_db = {'moon': {'claim': 'Moon is cheese', 'verdict': 'TRUE', 'confidence': 0.5,
+                                          'sources': [], 'explanation': ''}}
+        assert checker.verify_claim("the moon is cheese")['verdict'] == 'TRUE'
+        print("✓ Entries replaced or deleted in place are re-indexed")
+        
+        print("\n✓ Claim Index tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Claim Index test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_claim_matrix():
+    """Test that bulk claim verification matches the per-claim path"""
+    print("\n" + "="*60)
+    print("Testing Claim Matrix...")
+    print("="*60)
+    
+    try:
+        import random
+        from src.models.analyzer import ContentAnalyzer
+        from src.models.fact_checker import FactChecker
+        
+        checker = FactChecker()
+        rng = random.Random(1)
+        words = ['cause', 'caused', 'is', 'this', 'a', 'vaccine', 'vaccines', 'flat', 'earth', 'the', '5g', 'covid-19']
+        for i in range(300):
+            claim = ' '.join(rng.choices(words, k=rng.randint(0, 6))).title()
+            checker.add_fact_check(f'random_{i}', {
+                'claim': claim, 'verdict': str(i), 'confidence': 0.9, 'sources': [], 'explanation': ''
+            })
+        claims = [' '.join(rng.choices(words + ['unrelated', 'thesis', 'Earths'], k=rng.randint(0, 10)))
+                  for _ in range(500)]
+        assert checker.verify_claims(claims) == [checker.verify_claim(claim) for claim in claims]
+        assert checker.claim_matrix.match([claim.lower() for claim in claims[:10]]) == \
+            [checker._keyword_match(claim.lower()) for claim in claims[:10]]
+        print("✓ Matrix verdicts match verify_claim, including substring matches")
+        
+        checker.add_fact_check('random_0', dict(checker.fact_check_db['random_0'], verdict='EDITED'))
+        assert checker.verify_claims(claims) == [checker.verify_claim(claim) for claim in claims]
+        claims += ["the moon is cheese"] * 10
+        checker.fact_check_db['random_1'] = dict(checker.fact_check_db['random_1'], claim='Moon is cheese')
+        assert checker.verify_claims(claims) == [checker.verify_claim(claim) for claim in claims]
+        assert checker.verify_claims(claims)[-1]['verdict'] == '1'
+        del checker.fact_check_db['random_2']
+        assert checker.verify_claims(claims) == [checker.verify_claim(claim) for claim in claims]
+        print("✓ Matrices follow database changes, including direct edits")
+        
+        analyzer = ContentAnalyzer()
+        items = [
+            {'content': "Vaccines cause autism in children. The earth is flat, critics say."},
+            {'content': "Climate change is real and caused by humans.", 'author': "Jane Doe"},
+            {'content': ""}
+        ] * 30
+        batch = analyzer.analyze_news_batch(items)
+        single = [analyzer.analyze_news(item['content'], None, item.get('author')) for item in items]
+        assert [r['fact_check'] for r in batch] == [r['fact_check'] for r in single]
+        assert [r['overall_score'] for r in batch] == [r['overall_score'] for r in single]
+        print("✓ Batch analysis fact-checks all items together with the same results")
+        
+        print("\n✓ Claim Matrix tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Claim Matrix test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_claim_similarity():
+    """Test MinHash/LSH near-duplicate claim matching"""
+    print("\n" + "="*60)
+    print("Testing Claim Similarity...")
+    print("="*60)
+    
+    try:
+        import os
+        import tempfile
+        from src.models.claim_similarity import MinHashIndex, jaccard, shingles
+        from src.models.fact_checker import FactChecker
+        from src.models.fact_store import SQLiteFactStore
+        
+        checker = FactChecker()
+        with tempfile.TemporaryDirectory() as tmp:
+            checker.similarity_path = os.path.join(tmp, 'claim_lsh.npz')
+            result = checker.verify_claim("Vaccines causes autism", method='minhash')
+            assert result['verdict'] == 'FALSE' and result['checked'], "Near-duplicate not matched"
+            assert checker.verify_claim("Stock markets rose today", method='minhash')['verdict'] == 'UNKNOWN'
+            print("✓ Paraphrased claims match, unrelated claims do not")
+            
+            index = checker.similarity_index
+            assert os.path.exists(checker.similarity_path), "Index not persisted"
+            loaded = MinHashIndex.load(checker.similarity_path, checker.fact_check_db)
+            assert loaded.query("The Earth is flat") == index.query("The Earth is flat")
+            checker.add_fact_check('claim_moon', {
+                'claim': 'The Moon landing was faked', 'verdict': 'FALSE', 'confidence': 0.99,
+                'sources': ['NASA'], 'explanation': 'Apollo landings are well documented'
+            })
+            assert MinHashIndex.load(checker.similarity_path, checker.fact_check_db) is None, "Stale index loaded"
+            assert checker.verify_claim("the moon landings were faked", method='minhash')['checked']
+            checker.fact_check_db['claim_moon'] = dict(checker.fact_check_db['claim_moon'], claim='Moon is made of cheese')
+            assert not checker.verify_claim("the moon landings were faked", method='minhash')['checked']
+            assert checker.verify_claim("the moon is made of cheese", method='minhash')['verdict'] == 'FALSE'
+            print("✓ Saved index reloads, and is ignored once the database changes")
+            
+            store = SQLiteFactStore(os.path.join(tmp, 'truth.db'))
+            store.add_many(FactChecker('memory').fact_check_db.items())
+            stored = FactChecker(store)
+            assert stored.verify_claim("Vaccines causes autism", method='minhash')['verdict'] == 'FALSE'
+            assert os.path.exists(os.path.join(tmp, 'truth.db.lsh.npz')), "Index not saved next to the database"
+            assert FactChecker('memory').similarity_path is None, "In-memory sample index persisted"
+            store.close()
+            print("✓ Index is saved next to its SQLite database only")
+        
+        claims = ["Vaccines cause autism", "5G networks caused COVID-19", "Earth is flat"]
+        index = MinHashIndex(threshold=0.3).build({str(i): {'claim': c} for i, c in enumerate(claims)})
+        for query in ("vaccines do cause autism", "5G network causes covid"):
+            expected = [str(i) for i, c in enumerate(claims) if jaccard(shingles(query), shingles(c)) >= 0.3]
+            assert [key for key, _ in index.query(query)] == expected, f"Re-scoring mismatch: {query}"
+        print("✓ Candidates are re-scored by exact shingle similarity")
+        
+        print("\n✓ Claim Similarity tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Claim Similarity test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_fact_store():
+    """Test the SQLite fact-check store"""
+    print("\n" + "="*60)
+    print("Testing Fact Store...")
+    print("="*60)
+    
+    try:
+        import json
+        import os
+        import sqlite3
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
+        from src.models.fact_checker import FactChecker
+        from src.models.fact_store import SQLiteFactStore
+        
+        claims = [
+            "Vaccines cause autism in children", "Scientists say 5G networks caused COVID-19",
+            "Climate change is real and caused by humans", "The earth is flat", "Stock markets rose today",
+            "covid-19 vaccines are safe", "vaccines caused autism"
+        ]
+        memory = FactChecker('memory')
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteFactStore(os.path.join(tmp, 'truth.db'))
+            checker = FactChecker(store)
+            store.add_many(memory.fact_check_db.items())
+            assert list(store) == list(memory.fact_check_db) and dict(store.items()) == memory.fact_check_db
+            for claim in claims:
+                assert checker.verify_claim(claim) == memory.verify_claim(claim), f"Verdict mismatch: {claim}"
+            print("✓ SQLite store gives the in-memory verdicts")
+            
+            with open(os.path.join(tmp, 'extra.jsonl'), 'w') as f:
+                f.write(json.dumps({'key': 'claim_moon', 'claim': 'The Moon landing was faked', 'verdict': 'false',
+                                    'confidence': 0.99, 'sources': ['NASA']}) + "\n")
+            with open(os.path.join(tmp, 'extra.csv'), 'w') as f:
+                f.write("claim,verdict,confidence,sources,explanation\n")
+                f.write("Earth is flat,FALSE,0.5,Forum;Blog,Duplicate claim\n")
+                f.write("Drinking water is healthy,TRUE,0.9,WHO,Hydration matters\n")
+            assert store.import_file(os.path.join(tmp, 'extra.jsonl')) == 1
+            assert store.import_file(os.path.join(tmp, 'extra.csv')) == 2
+            assert checker.verify_claim("they say the moon landing was faked")['verdict'] == 'FALSE'
+            assert store['claim_moon']['explanation'] == '' and len(store) == 7
+            assert len(store.search("flat earth")) == 2, "Imported claim not searchable"
+            print("✓ CSV and JSONL files import into the store")
+            
+            checker.add_fact_check('claim_flat_earth', dict(memory.fact_check_db['claim_flat_earth'], verdict='TRUE'))
+            assert checker.verify_claim("Earth is flat")['verdict'] == 'TRUE', "Replaced fact-check not used"
+            assert list(store).index('claim_flat_earth') == 3, "Replaced fact-check moved"
+            
+            with sqlite3.connect(store.path) as connection:
+                assert connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            reopened = SQLiteFactStore(store.path, pool_size=2)
+            with ThreadPoolExecutor(4) as pool:
+                results = list(pool.map(lambda claim: FactChecker(reopened).verify_claim(claim), claims * 5))
+            assert results == [checker.verify_claim(claim) for claim in claims * 5]
+            print("✓ Store persists in WAL mode and serves concurrent readers")
+            
+            follower = FactChecker(reopened)
+            index = follower.similarity_index
+            store.add('claim_water', dict(memory.fact_check_db['claim_flat_earth'], claim='Water is wet'))
+            assert index.is_stale(reopened), "Write through another store object not noticed"
+            assert follower.verify_claim("water is wet", method='minhash')['checked']
+            print("✓ Writes through any connection to the database invalidate its indexes")
+            
+            with sqlite3.connect(store.path) as connection:
+                connection.execute("DELETE FROM store_meta WHERE name = 'terms_format'")
+            rebuilt = FactChecker(SQLiteFactStore(store.path))
+            assert [rebuilt.verify_claim(claim) for claim in claims] == [checker.verify_claim(claim) for claim in claims]
+            rebuilt.store.close()
+            reopened.close()
+            store.close()
+            print("✓ Full-text index is rebuilt when its format changes")
+        
+        print("\n✓ Fact Store tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Fact Store test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_credibility_cache():
+    """Test the per-domain credibility cache"""
+    print("\n" + "="*60)
+    print("Testing Credibility Cache...")
+    print("="*60)
+    
+    try:
+        import os
+        import socket
+        import tempfile
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from src.models.credibility import SourceCredibilityAnalyzer
+        from src.models.domain_cache import DomainCache
+        
+        requests_seen = []
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                requests_seen.append(self.path)
+                self.send_response(200)
+                self.end_headers()
+            
+            do_GET = do_HEAD
+            
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            closed_port = s.getsockname()[1]
+        
+        now = [1000.0]
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'credibility.db')
+                cache = DomainCache(maxsize=2, ttl=60, failure_ttl=5, timeout_ttl=1, path=path, clock=lambda: now[0])
+                analyzer = SourceCredibilityAnalyzer(cache)
+                site = f"http://127.0.0.1:{server.server_port}"
+                first = analyzer.verify_source(site + "/news/1")
+                assert analyzer.verify_source(site + "/news/2") == first and len(requests_seen) == 2
+                print("✓ Repeated checks of a domain are served from the cache")
+                
+                dead = f"http://localhost:{closed_port}"
+                assert analyzer.verify_source(dead)['score'] == 0.3
+                cache.set('https://slow.example', {'score': 0.3}, 'timeout')
+                now[0] += 2
+                assert cache.get('https://slow.example') is None and cache.get(analyzer.cache_key(dead, f"localhost:{closed_port}"))
+                now[0] += 5
+                assert cache.get(analyzer.cache_key(dead, f"localhost:{closed_port}")) is None
+                assert analyzer.verify_source(site) == first and len(requests_seen) == 2
+                print("✓ Failures and timeouts expire sooner than successful checks")
+                
+                restarted = SourceCredibilityAnalyzer(DomainCache(maxsize=2, path=path, clock=lambda: now[0]))
+                assert restarted.verify_source(site + "/other") == first and len(requests_seen) == 2
+                stats = restarted.cache.stats()
+                assert stats['disk_hits'] == 1 and stats['hit_rate'] == 1.0 and stats['oldest_age'] == 7
+                assert cache.stats()['size'] <= 2 and cache.stats()['stored'] == {'ok': 1, 'failure': 1, 'timeout': 1}
+                print("✓ Results survive restarts through SQLite; stats report hit rate and entry age")
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        print("\n✓ Credibility Cache tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Credibility Cache test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_source_prober():
+    """Test concurrent source probing against a local stub server"""
+    print("\n" + "="*60)
+    print("Testing Source Prober...")
+    print("="*60)
+    
+    try:
+        import threading
+        import time
+        from collections import Counter
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from src.models.credibility import SourceCredibilityAnalyzer
+        from src.models.domain_cache import DomainCache
+        from src.models.source_prober import SourceProber
+        
+        lock = threading.Lock()
+        active, peak, connections = Counter(), Counter(), set()
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive
+            
+            def do_HEAD(self):
+                host = self.connection.getsockname()[0]
+                with lock:
+                    connections.add(self.client_address)
+                    active[host] += 1
+                    peak[host] = max(peak[host], active[host])
+                time.sleep(3 if host == '127.0.0.20' else 0.2)
+                with lock:
+                    active[host] -= 1
+                self.send_response(404 if self.path.endswith('/about') and host == '127.0.0.3' else 200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+            
+            do_GET = do_HEAD
+            
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(('', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_port
+        prober = SourceProber(deadline=1.0, per_host=2)
+        try:
+            analyzer = SourceCredibilityAnalyzer(DomainCache(maxsize=0), prober)
+            urls = [f"http://127.0.0.{i}:{port}/story" for i in range(2, 10)]
+            start = time.monotonic()
+            results = analyzer.verify_sources(urls + [None, "https://www.reuters.com/x"])
+            elapsed = time.monotonic() - start
+            assert elapsed < 1.0, f"Sources were not probed concurrently ({elapsed:.2f} s)"
+            assert [r['factors']['has_about'] for r in results[:3]] == [True, False, True]
+            assert results[-2]['reason'] == 'Invalid URL' and results[-1]['score'] == 0.95
+            print(f"✓ 8 sources with HEAD and About checks probed in {elapsed:.2f} s")
+            
+            cache = DomainCache(maxsize=10, ttl=60, timeout_ttl=30)
+            slow = SourceCredibilityAnalyzer(cache, prober)
+            start = time.monotonic()
+            result = slow.verify_source(f"http://127.0.0.20:{port}/", deadline=0.5)
+            assert time.monotonic() - start < 1.0 and result['score'] == 0.3, "Deadline not enforced"
+            assert cache.stats()['stored'] == {'timeout': 1}, "Deadline miss not cached as a timeout"
+            print("✓ A slow source is cut off at the deadline and cached as a timeout")
+            
+            prober.probe_many([f"http://127.0.0.11:{port}/{i}" for i in range(6)], deadline=5)
+            assert peak['127.0.0.11'] <= 2, f"Per-host limit exceeded: {peak['127.0.0.11']}"
+            before = len(connections)
+            prober.probe_many([f"http://127.0.0.12:{port}/{i}" for i in range(6)], deadline=5)
+            assert len(connections) - before <= 2, "Connections were not reused"
+            print("✓ Requests per host are limited and connections are kept alive")
+        finally:
+            prober.close()
+            server.shutdown()
+            server.server_close()
+        
+        print("\n✓ Source Prober tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Source Prober test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_circuit_breaker():
+    """Test the per-host circuit breaker and adaptive timeouts"""
+    print("\n" + "="*60)
+    print("Testing Circuit Breaker...")
+    print("="*60)
+    
+    try:
+        import socket
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from src.models.circuit_breaker import CircuitBreaker
+        from src.models.credibility import SourceCredibilityAnalyzer
+        from src.models.domain_cache import DomainCache
+        from src.models.source_prober import SourceProber
+        
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=lambda: now[0])
+        for _ in range(3):
+            assert breaker.allow('down.example')
+            breaker.record_failure('down.example')
+        assert breaker.state('down.example') == 'open' and not breaker.allow('down.example')
+        now[0] += 10
+        assert breaker.allow('down.example') and not breaker.allow('down.example'), "Half-open allows one trial"
+        breaker.record_failure('down.example')
+        assert breaker.state('down.example') == 'open'
+        now[0] += 10
+        assert breaker.allow('down.example')
+        breaker.record_success('down.example', 0.1)
+        assert breaker.state('down.example') == 'closed' and breaker.allow('down.example')
+        stats = breaker.stats()
+        assert stats['trips'] == 2 and stats['rejected'] == 2 and stats['top_trips'] == {'down.example': 2}
+        print("✓ Circuits open after repeated failures and close after a successful trial")
+        
+        for _ in range(30):
+            breaker.record_success('fast.example', 0.01)
+            breaker.record_success('steady.example', 0.4)
+        assert breaker.timeout('fast.example', 30) == 0.5 and abs(breaker.timeout('steady.example', 30) - 1.2) < 1e-9
+        assert breaker.timeout('new.example', 30) == 30
+        print("✓ Timeouts adapt to each host's latency percentile")
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                if self.path.startswith('/slow'):
+                    time.sleep(0.3)
+                self.send_response(200)
+                self.end_headers()
+            
+            do_GET = do_HEAD
+            
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            closed_port = s.getsockname()[1]
+        
+        prober = SourceProber(breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        analyzer = SourceCredibilityAnalyzer(DomainCache(maxsize=0), prober)
+        try:
+            dead = f"http://127.0.0.1:{closed_port}"
+            analyzer.verify_sources([dead, dead + '/a'])
+            analyzer.verify_source(dead)
+            start = time.perf_counter()
+            result = analyzer.verify_source(dead)
+            assert 'circuit' in result['reason'] and result['score'] == 0.3
+            assert time.perf_counter() - start < 0.1
+            assert prober.breaker.stats()['hosts'][f"127.0.0.1:{closed_port}"]['state'] == 'open'
+            print("✓ A failing host gets a fast 'unverifiable' result while its circuit is open")
+            
+            site = f"http://127.0.0.1:{server.server_port}"
+            for i in range(25):
+                assert analyzer.verify_source(f"{site}/{i}")['score'] > 0.6
+            assert prober.breaker.timeout(f"127.0.0.1:{server.server_port}", 30) < 30
+            print("✓ Probe latencies feed the adaptive timeout")
+            
+            busy = SourceProber(per_host=1, breaker=CircuitBreaker(failure_threshold=2))
+            try:
+                host = f"127.0.0.1:{server.server_port}"
+                probes = busy.probe_many([f"http://{host}/slow/{i}" for i in range(8)], deadline=1.0)
+                assert sum(probe.error is not None for probe in probes) >= 4, "Semaphore was not saturated"
+                assert busy.breaker.state(host) == 'closed' and busy.breaker.stats()['trips'] == 0
+            finally:
+                busy.close()
+            print("✓ Probes that run out of deadline while queued do not trip the circuit")
+        finally:
+            prober.close()
+            server.shutdown()
+            server.server_close()
+        
+        print("\n✓ Circuit Breaker tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Circuit Breaker test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_domain_index():
+    """Test the suffix-aware domain reputation index"""
+    print("\n" + "="*60)
+    print("Testing Domain Index...")
+    print("="*60)
+    
+    try:
+        import os
+        import tempfile
+        from src.models.credibility import SourceCredibilityAnalyzer
+        from src.models.domain_index import DomainIndex, PublicSuffixList, read_domain_list
+        
+        suffixes = PublicSuffixList(['uk', 'co.uk', 'blogspot.com', '*.ck', '!www.ck'])
+        assert suffixes.parents('news.example.co.uk') == ['news.example.co.uk', 'example.co.uk']
+        assert suffixes.parents('a.b.ck') == ['a.b.ck'] and suffixes.parents('a.www.ck') == ['a.www.ck', 'www.ck']
+        print("✓ Public suffix rules stop the parent walk at the registrable domain")
+        
+        entries = [('cnn.com', 0.95), ('Bad.Blogspot.com.', 0.1), ('co.uk', 0.0), ('spam.example.co.uk', 0.2),
+                   ('example.co.uk', 0.8), ('cnn.com', 0.9)]
+        with tempfile.TemporaryDirectory() as tmp:
+            listing = os.path.join(tmp, 'domains.txt')
+            with open(listing, 'w') as f:
+                f.write("# blocklist\n0.0.0.0 tracker.example.com\nreuters.com,0.95\nplain.example.org\n"
+                        "domain,score\n127.0.0.1 ads.example.net ads2.example.net\n1,google.com\n")
+            assert list(read_domain_list(listing)) == [
+                ('tracker.example.com', 0.1), ('reuters.com', 0.95), ('plain.example.org', 0.1),
+                ('ads.example.net', 0.1), ('ads2.example.net', 0.1), ('google.com', 0.1)
+            ]
+            
+            path = os.path.join(tmp, 'domains.idx')
+            assert DomainIndex.build(entries, path) == 5, "Duplicate domain not collapsed"
+            for index in (DomainIndex.from_entries(entries, suffixes), DomainIndex.load(path, suffixes)):
+                assert index.lookup('edition.cnn.com') == ('cnn.com', 0.9), "Later duplicate should win"
+                assert index.lookup('www.spam.example.co.uk:443') == ('spam.example.co.uk', 0.2)
+                assert index.score('news.example.co.uk') == 0.8 and index.score('other.co.uk') is None
+                assert index.score('good.blogspot.com') is None and index.score('bad.blogspot.com') == 0.1
+                assert index.get('edition.cnn.com') is None and index.get('CNN.com') == 0.9
+            print("✓ Subdomains inherit the most specific listed entry, in memory and memory-mapped")
+            
+            oversized = [('x' * 300, 0.1), ('cnn.com', 0.9), ('bad.com', 0.1)]
+            assert DomainIndex.build(oversized, path) == 2
+            for index in (DomainIndex.from_entries(oversized), DomainIndex.load(path)):
+                assert index.score('cnn.com') == 0.9 and index.score('bad.com') == 0.1
+                assert index.get('x' * 300) is None
+            print("✓ Over-long names are skipped without shifting later entries")
+        
+        analyzer = SourceCredibilityAnalyzer(reputation=DomainIndex.from_entries([('lies.example', 0.05)]))
+        assert analyzer.verify_source('https://edition.cnn.com/world')['reason'] == 'Known credible source'
+        assert analyzer.verify_source('http://uk.reuters.com')['score'] == 0.95
+        assert analyzer.verify_source('http://daily.lies.example/story') == {
+            'credible': False, 'score': 0.05, 'reason': 'Known unreliable source'
+        }
+        print("✓ Known sources cover their subdomains without network probing")
+        
+        print("\n✓ Domain Index tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Domain Index test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_author_index():
+    """Test the author registry index"""
+    print("\n" + "="*60)
+    print("Testing Author Index...")
+    print("="*60)
+    
+    try:
+        import json
+        import os
+        import tempfile
+        from itertools import chain
+        from src.models.author_index import AuthorIndex, normalize_name, read_author_registry
+        from src.models.credibility import SourceCredibilityAnalyzer
+        
+        assert normalize_name("  José  Müller-Łukasz ") == "jose muller lukasz"
+        assert normalize_name("O'Brien, J.") == "o brien j"
+        print("✓ Names are normalized for case, diacritics and punctuation")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, 'authors.csv')
+            with open(csv_path, 'w', encoding='utf-8') as f:
+                f.write("name,score,aliases,type\n"
+                        "Zoë Ångström,0.9,Z. Angstrom;Zoe A.,journalist\n"
+                        "Daily Rumour,0.2,,outlet\n")
+            jsonl_path = os.path.join(tmp, 'authors.jsonl')
+            with open(jsonl_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'name': 'The Daily Rumour Network', 'score': 0.4, 'aliases': ['DRN']}) + "\n")
+            
+            assert len(AuthorIndex.from_file(jsonl_path)) == 1
+            index = AuthorIndex(chain(read_author_registry(csv_path), read_author_registry(jsonl_path)))
+        
+        assert len(index) == 3
+        assert index.match("By ZOE ANGSTROM") == {
+            'name': 'Zoë Ångström', 'score': 0.9, 'aliases': ['Z. Angstrom', 'Zoe A.'], 'type': 'journalist'
+        }
+        assert index.match("z angstrom and others")['name'] == 'Zoë Ångström'
+        assert index.match("the daily rumour network")['score'] == 0.4, "Longest match should win"
+        assert index.match("Staff, Daily Rumour")['type'] == 'outlet'
+        assert index.match("zoe angstromberg") is None and index.match("") is None
+        print("✓ Aliases, diacritics and bylines match registry entries from CSV and JSONL")
+        
+        analyzer = SourceCredibilityAnalyzer(authors=index)
+        results = analyzer.verify_authors(["DRN", "Zoe A.", "Jane Doe", "DRN"])
+        assert [result['credible'] for result in results] == [False, True, None, False]
+        assert results[0]['reason'] == 'Known unreliable author: The Daily Rumour Network'
+        assert results[0] == results[3] and results[0]['entry'] is not results[3]['entry']
+        assert SourceCredibilityAnalyzer().verify_author("John Smith, Reuters")['reason'] == \
+            'Known credible author: reuters'
+        print("✓ verify_authors returns verify_author results with the matched entry")
+        
+        print("\n✓ Author Index tests passed")
+        return True
+    except Exception as e:
+        print(f"✗ Author Index test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
 def test_analyzer():
     """Test unified analyzer"""
     print("\n" + "="*60)
@@ -154,7 +1554,8 @@ def test_api():
     print("="*60)
     
     try:
-        from api.app import app
+        import os
+        from api.app import app, registry
         
         # Create test client
         client = app.test_client()
@@ -164,6 +1565,29 @@ def test_api():
         assert response.status_code == 200, "Health check failed"
         print("✓ Health check endpoint works")
         
+        # Forked workers start their own registry watcher on their first request
+        pid = os.fork()
+        if pid == 0:
+            watching = False
+            try:
+                client.get('/api/health')
+                watching = registry._pid == os.getpid() and registry._watcher.is_alive()
+            finally:
+                os._exit(0 if watching else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0, "Registry watcher not running in forked worker"
+        print("✓ Forked workers watch the model registry")
+        
+        # Test stats endpoint
+        response = client.get('/api/stats')
+        assert response.status_code == 200, "Stats endpoint failed"
+        print("✓ Stats endpoint works")
+        
+        # Admin endpoints require the admin token
+        response = client.post('/api/admin/models/activate', json={"version": "v1"})
+        assert response.status_code in (401, 403), "Admin endpoint is not protected"
+        print("✓ Admin endpoints are protected")
+        
         # Test analyze endpoint
         response = client.post('/api/analyze', 
             json={"content": "This is test content about real news."})
@@ -242,7 +1666,32 @@ def main():
     
     results.append(("Imports", test_imports()))
     results.append(("Text Processor", test_text_processor()))
+    results.append(("Batch Text Cleaning", test_clean_texts()))
+    results.append(("Shared Document", test_document()))
+    results.append(("Pattern Scanner", test_pattern_scanner()))
+    results.append(("Sentiment Backends", test_sentiment_backends()))
+    results.append(("Entity Extraction", test_entity_extraction()))
+    results.append(("Fast Start", test_fast_start()))
     results.append(("Models", test_models()))
+    results.append(("Detector Batch", test_detector_batch()))
+    results.append(("Micro-Batcher", test_micro_batcher()))
+    results.append(("Streaming Training", test_streaming_training()))
+    results.append(("Mapped Artifacts", test_mapped_artifact()))
+    results.append(("Compiled Forest", test_compiled_forest()))
+    results.append(("Prediction Cache", test_prediction_cache()))
+    results.append(("Model Registry", test_model_registry()))
+    results.append(("Incremental Update", test_incremental_update()))
+    results.append(("Compact Features", test_compact_features()))
+    results.append(("Hyperparameter Search", test_hyperparameter_search()))
+    results.append(("Claim Index", test_claim_index()))
+    results.append(("Claim Matrix", test_claim_matrix()))
+    results.append(("Claim Similarity", test_claim_similarity()))
+    results.append(("Fact Store", test_fact_store()))
+    results.append(("Credibility Cache", test_credibility_cache()))
+    results.append(("Source Prober", test_source_prober()))
+    results.append(("Circuit Breaker", test_circuit_breaker()))
+    results.append(("Domain Index", test_domain_index()))
+    results.append(("Author Index", test_author_index()))
     results.append(("Content Analyzer", test_analyzer()))
     results.append(("Sample Data", test_sample_data()))
     results.append(("Flask API", test_api()))